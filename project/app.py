@@ -1,20 +1,255 @@
-from flask import Flask, render_template, request
-import re
+from flask import (
+    Flask, Response, abort, jsonify, make_response, redirect, render_template, request, stream_template,
+    stream_with_context, url_for,
+)
+from flask.json.provider import DefaultJSONProvider
 from markupsafe import Markup
-from fractions import Fraction
-import copy
+import itertools
 import json
-import math
+import os
+import secrets
+import time
+
+from assets import AssetManifest
+from solver import Budget, Problem, ProblemError, steps
+from solver import solve as solve_problem
+from solver.batch import iter_ndjson, solve_many
+from solver.cache import ResultCache, solve_cached
+from solver.parser import parse_problem, split_objective
+from solver.permalink import decode_problem, encode_problem, problem_text
+from solver.warm import resolve
+from solver.simplex import (
+    INFEASIBLE, TRACE_LEVELS, finish_phase_one, request_options, standard_tableau, trace_level,
+)
+from solver.numeric import NUMERIC_TYPES, format_number, json_default
+
+
+class SolverJSONProvider(DefaultJSONProvider):
+    """JSON provider that also encodes the solver's exact Fractions"""
+
+    @staticmethod
+    def default(o):
+        try:
+            return json_default(o)
+        except TypeError:
+            return DefaultJSONProvider.default(o)
+
+
+# Static files are served by the fingerprinted ``asset`` route below instead of /static
+app = Flask(__name__, static_folder=None)
+app.json = SolverJSONProvider(app)
+# Pivot and wall-clock limits per solve; a request may lower them with its
+# own max_iterations / time_limit but not raise them.  None means unlimited
+app.config.setdefault("SOLVE_MAX_ITERATIONS", 1000)
+app.config.setdefault("SOLVE_TIME_LIMIT", 10.0)
+# Walkthroughs stream to the browser step by step, this many iterations per page
+app.config.setdefault("WALKTHROUGH_PAGE_SIZE", 20)
+
+# Fingerprinted assets may be cached for a year: a changed file gets a new URL
+app.config.setdefault("ASSET_MAX_AGE", 365 * 24 * 3600)
+# Permalink pages may be reused by browsers and proxies for an hour, then revalidated by ETag
+app.config.setdefault("PERMALINK_MAX_AGE", 3600)
+
+asset_manifest = AssetManifest(os.path.join(app.root_path, "static"))
+
+# Solved problems are cached for an hour, up to 1024 entries per cache; walkthroughs
+# are kept as their pivots and a few checkpoint tableaux, and pages are rebuilt from them
+result_cache = ResultCache(maxsize=1024, ttl=3600)
+steps_cache = ResultCache(maxsize=1024, ttl=3600)
+# Problems and final bases kept for /api/resolve, referenced by an opaque handle
+basis_store = ResultCache(maxsize=4096, ttl=1800)
+
+
+@app.template_filter("num")
+def num_filter(value):
+    """Format numeric tableau cells at render time; labels and strings pass through"""
+    if value is None or isinstance(value, str):
+        return value
+    return format_number(value)
+
+
+def bold(label):
+    """Row labels are shown in bold in tableaux and row-operation headers"""
+    return Markup("<b>{}</b>").format(label)
+
+
+class Pager:
+    """Page ``page`` of a walkthrough, ending with iteration ``last``
+
+    ``has_next`` is read when the template reaches the page links, after
+    the page's steps have been walked.  ``link(page)`` is the URL of
+    another page; without it pages are requested by posting the form again.
+    """
+
+    def __init__(self, walkthrough, page, last, link=None):
+        self.walkthrough = walkthrough
+        self.page = page
+        self.last = last
+        self.link = link
+
+    @property
+    def has_next(self):
+        return self.walkthrough.has_more(self.last)
+
+
+def default_limits():
+    """``max_iterations`` and ``time_limit`` solve options from the app config"""
+    return {
+        "max_iterations": app.config["SOLVE_MAX_ITERATIONS"],
+        "time_limit": app.config["SOLVE_TIME_LIMIT"],
+    }
+
+
+@app.template_global()
+def asset_url(name):
+    """URL of the static file ``name`` (relative to ``static/``), fingerprinted by its content"""
+    return url_for("asset", filename=asset_manifest.url_name(name))
+
+
+@app.route("/assets/<path:filename>")
+def asset(filename):
+    """A fingerprinted static file, in the best encoding the client accepts"""
+    found = asset_manifest.lookup(filename)
+    if found is None:
+        abort(404)
+    encoding = found.negotiate(request.accept_encodings)
+    response = make_response(found.bodies[encoding])
+    response.mimetype = found.mimetype
+    if encoding != "identity":
+        response.content_encoding = encoding
+    response.vary.add("Accept-Encoding")
+    response.set_etag(found.etag(encoding))
+    response.cache_control.public = True
+    response.cache_control.max_age = app.config["ASSET_MAX_AGE"]
+    response.cache_control.immutable = True
+    return response.make_conditional(request)
+
+
+def static_page(template):
+    """Render a page that only changes with the code: revalidated by ETag, 304 when unchanged"""
+    response = make_response(render_template(template))
+    response.add_etag()
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
 
-app = Flask(__name__)
 
 @app.route("/")
 def home():
-    return render_template("index.html")
+    return static_page("index.html")
 
 @app.route("/main")
 def main_page():
-    return render_template("main.html")
+    return static_page("main.html")
+
+
+def permalink_url(problem, numeric="fraction", trace="full", page=1):
+    """Canonical /p URL of a solution page; options at their defaults are left out"""
+    options = {}
+    if numeric != "fraction":
+        options["numeric"] = numeric
+    if trace != "full":
+        options["trace"] = trace
+    if page != 1:
+        options["page"] = page
+    return url_for("permalink", code=encode_problem(problem), **options)
+
+
+def solution_page(objective, constraints, nonneg="", numeric="fraction", trace="full", page=1, stream=True):
+    """main.html with every step of the solution, as the "solve" action shows it
+
+    A full walkthrough shows page ``page`` of its iterations, streamed as
+    the solver reaches them unless ``stream`` is False; the other trace
+    levels only solve.
+    """
+    all_steps = []
+    # Add problem statement to all_steps
+    direction, objective_body = split_objective(objective)
+    all_steps.append({
+        'type': 'problem_statement',
+        'data': {
+            'direction': "Minimize" if direction == "min" else "Maximize",
+            'objective': objective_body,
+            'constraints': constraints,
+            'nonneg': nonneg
+        }
+    })
+
+    # Generate standard form
+    standard_form = steps.standard_form(objective, constraints)
+
+    all_steps.append({
+        'type': 'standard_form',
+        'data': standard_form
+    })
+
+    # Everything after the standard form is shared between requests
+    # for the same parsed problem, whatever its spacing or term order
+    limits = default_limits()
+    try:
+        problem = parse_problem(objective, constraints)
+        if trace == "full":
+            walkthrough = steps_cache.get_or_compute(
+                (numeric,) + problem.key(), lambda: steps.Walkthrough(problem, numeric))
+        elif trace == "summary":
+            result = solve_problem(problem, numeric=numeric, trace="summary", **limits)
+        else:
+            result = solve_cached(problem, result_cache, numeric=numeric, **limits)
+    except ProblemError as e:
+        return render_template(
+            "main.html",
+            objective=objective,
+            constraints=constraints,
+            nonneg=nonneg,
+            trace=trace,
+            parse_error=f"Could not solve: {e}. Use format like: 2x + 3y <= 8"
+        )
+    permalink = permalink_url(problem, numeric, trace)
+
+    if trace != "full":
+        # No tableaux or row-operation strings: just the pivots taken and the answer
+        if "trace" in result:
+            all_steps.append({'type': 'pivot_summary', 'data': result["trace"]})
+        all_steps.append({'type': 'answer', 'data': {
+            'status': result["status"],
+            'objective': result["objective"],
+            'variables': list(zip(problem.variables, result["x"] or [])),
+            'iterations': result["iterations"],
+        }})
+        return render_template(
+            "main.html",
+            objective=objective,
+            constraints=constraints,
+            nonneg=nonneg,
+            numeric=numeric,
+            trace=trace,
+            standard_form=standard_form,
+            all_steps=all_steps,
+            display_all_steps=True,
+            permalink=permalink
+        )
+
+    # One page of iterations; when streamed, each step is rendered as the solver reaches it
+    size = app.config["WALKTHROUGH_PAGE_SIZE"]
+    first, last = (page - 1) * size + 1, page * size
+    solved_steps = walkthrough.steps(first, last, bold, Budget(**limits))
+    all_steps = itertools.chain(all_steps, solved_steps)
+    # A permalink pages by links to further permalinks, a posted form by posting again
+    link = (lambda n: permalink_url(problem, numeric, trace, n)) if not stream else None
+    return (stream_template if stream else render_template)(
+        "main.html",
+        objective=objective,
+        constraints=constraints,
+        nonneg=nonneg,
+        numeric=numeric,
+        trace=trace,
+        standard_form=standard_form,
+        column_names=walkthrough.names,
+        all_steps=all_steps,
+        display_all_steps=True,
+        pager=Pager(walkthrough, page, last, link),
+        permalink=permalink
+    )
+
 
 @app.route("/solve", methods=["POST"])
 def solve():
@@ -22,62 +257,23 @@ def solve():
 
     # Get form inputs
     objective = request.form.get("objective", "")
-    constraint1 = request.form.get("constraint1", "")
-    constraint2 = request.form.get("constraint2", "")
+    # Any further constraints arrive as constraint3, constraint4, ...
+    constraints = []
+    while request.form.get(f"constraint{len(constraints) + 1}", "").strip():
+        constraints.append(request.form.get(f"constraint{len(constraints) + 1}"))
     nonneg = request.form.get("nonneg", "")
+    # Exact fractions by default; "float" trades exactness for speed
+    numeric = request.form.get("numeric", "fraction")
+    if numeric not in NUMERIC_TYPES:
+        numeric = "fraction"
+    # "full" walks through every pivot; "summary" and "none" only solve
+    trace = request.form.get("trace", "full")
+    if trace not in TRACE_LEVELS:
+        trace = "full"
     
     # Detect which button was clicked
     action = request.form.get("action", "")
 
-    def format_number(num):
-        """Format number as fraction when possible, otherwise 2 decimal places"""
-        if num == int(num):
-            return str(int(num))
-        
-        try:
-            frac = Fraction(num).limit_denominator(10)
-            if frac.denominator != 1:
-                return f"{frac.numerator}/{frac.denominator}"
-            else:
-                return str(frac.numerator)
-        except:
-            return f"{num:.2f}"
-
-    def parse_fraction_string(value):
-        """Parse fraction strings like '4/5' back to float"""
-        if isinstance(value, (int, float)):
-            return float(value)
-        if isinstance(value, str):
-            if '/' in value:
-                try:
-                    numerator, denominator = value.split('/')
-                    return float(numerator) / float(denominator)
-                except:
-                    return float(value)
-            else:
-                try:
-                    return float(value)
-                except:
-                    return 0.0
-        return float(value)
-
-    def format_reciprocal_display(k_value):
-        """Format 1/k display properly"""
-        k_str = format_number(k_value)
-        
-        if '/' in k_str:
-            try:
-                numerator, denominator = k_str.split('/')
-
-                # For fractions, show both: 1/fraction and reciprocal
-                return f"1/k = 1/{k_str} = {denominator}/{numerator}"
-            except:
-                return f"1/k = 1/{k_str}"
-        else:
-
-            # For whole numbers, just show 1/k directly
-            return f"1/k = 1/{k_str}"
-
     # Variables
     standard_form = request.form.get("standard_form", "")  # Get from form if available
     tableau1 = None
@@ -85,764 +281,94 @@ def solve():
     tableau_ratio = None   
     pivot_index = None
     pivot_row_index = None 
-    ratio_values = None   
     show_solution_button = False
     tableau2 = None
     has_negative_in_z = None
-    current_tableau_data = None
     tableau2_highlight = None
     tableau2_ratio = None
     solution1_header = None
     solution1 = None
-    solution2_header = None
-    solution2 = None
+    other_rows = None
     solution3_header = None
     solution3 = None
     iteration_count = 1
     next_iteration = None
     show_pivotrow_button = False
+    column_names = None
     all_steps = [] 
     display_all_steps = False
 
-    # Helper functions (moved outside to avoid duplication)
-    def parse_constraint(constraint):
-        if not constraint:
-            return None
-        s = constraint.replace(" ", "")
-
-        try:
-            m_x = re.search(r'([+-]?\d*)x', s)
-            m_y = re.search(r'([+-]?\d*)y', s)
-            m_rhs = re.search(r'<=([+-]?\d+)$', s)
-            if not (m_x and m_y and m_rhs):
-                m_alt = re.match(r'([+-]?\d*)x\+?([+-]?\d*)y<=([+-]?\d+)', s)
-                if m_alt:
-                    a_raw = m_alt.group(1)
-                    b_raw = m_alt.group(2)
-                    rhs_raw = m_alt.group(3)
-                else:
-                    return None
-            else:
-                a_raw = m_x.group(1)
-                b_raw = m_y.group(1)
-                rhs_raw = m_rhs.group(1)
-            def to_int(raw):
-                if raw in ["", "+"]:
-                    return 1
-                if raw == "-":
-                    return -1
-                return int(raw)
-            a = to_int(a_raw)
-            b = to_int(b_raw)
-            rhs = int(rhs_raw)
-            return a, b, rhs
-        except Exception:
-            return None
-
-    def parse_objective(obj_str):
-        if not obj_str:
-            return None
-        s = obj_str.replace(" ", "")
-        try:
-            m_x = re.search(r'([+-]?\d*)x', s)
-            m_y = re.search(r'([+-]?\d*)y', s)
-            def to_int(raw):
-                if raw in ["", "+"]:
-                    return 1
-                if raw == "-":
-                    return -1
-                return int(raw)
-            c1 = to_int(m_x.group(1)) if m_x else 0
-            c2 = to_int(m_y.group(1)) if m_y else 0
-            return c1, c2
-        except Exception:
-            return None
-
-    def perform_pivot_operations(tableau, pivot_row, pivot_col):
-        """Perform pivot operations and return new tableau with entering variable first"""
-        pivot_value_str = tableau[pivot_row][pivot_col]
-        pivot_value = parse_fraction_string(pivot_value_str)
-        
-        # Create a copy of the tableau to work with
-        working_tableau = copy.deepcopy(tableau)
-        
-        column_names = ["B.V", "x", "y", "S₁", "S₂", "RHS"]
-        pivot_var = column_names[pivot_col]
-        
-        # Update basic variable for pivot row - this will be the entering variable
-        working_tableau[pivot_row][0] = Markup(f"<b>{pivot_var}</b>")
-        
-        # Normalize pivot row (divide entire row by pivot element)
-        for j in range(1, len(working_tableau[0])):
-            old_val_str = working_tableau[pivot_row][j]
-            old_val = parse_fraction_string(old_val_str)
-            new_val = old_val / pivot_value
-            working_tableau[pivot_row][j] = format_number(new_val)
-        
-        # Update other rows (including z-row)
-        for i in range(len(working_tableau)):
-            if i != pivot_row:
-                pivot_other_str = working_tableau[i][pivot_col]
-                pivot_other = parse_fraction_string(pivot_other_str)
-                
-                for j in range(1, len(working_tableau[0])):
-                    old_val_str = working_tableau[i][j]
-                    old_val = parse_fraction_string(old_val_str)
-                    pivot_row_val_str = working_tableau[pivot_row][j]
-                    pivot_row_val = parse_fraction_string(pivot_row_val_str)
-                    new_val = old_val - pivot_row_val * pivot_other
-                    working_tableau[i][j] = format_number(new_val)
-        
-        # Now reorder the constraint rows so the entering variable is first
-        # Keep z-row always last
-        z_row = working_tableau[-1]
-        constraint_rows = working_tableau[:-1]
-        
-        # Create new order: pivot row first, then other rows
-        reordered_tableau = []
-        reordered_tableau.append(working_tableau[pivot_row])  # Entering variable row first
-        
-        # Add other constraint rows (excluding pivot row)
-        for i in range(len(constraint_rows)):
-            if i != pivot_row:
-                reordered_tableau.append(working_tableau[i])
-        
-        # Add z-row last
-        reordered_tableau.append(z_row)
-        
-        return reordered_tableau
-
-    def check_negative_in_z_row(tableau):
-        """Check if there are negative numbers in z-row"""
-        z_row = tableau[-1][1:-1]
-        has_negative = any(parse_fraction_string(val) < 0 for val in z_row if val != '—')
-        return has_negative
+    def build_tableau():
+        """Initial tableau for the submitted problem; raises ProblemError if it cannot be solved"""
+        return standard_tableau(parse_problem(objective, constraints), numeric)
 
     # Handle the "solve" action - generate all steps at once
     if action == "solve":
         display_all_steps = True
         
-        if objective and constraint1 and constraint2:
-            # Add problem statement to all_steps
-            all_steps.append({
-                'type': 'problem_statement',
-                'data': {
-                    'objective': objective,
-                    'constraint1': constraint1,
-                    'constraint2': constraint2,
-                    'nonneg': nonneg
-                }
-            })
-            
-            # Generate standard form
-            std_obj = "Z - " + objective.replace("+", "-") + " = 0" 
-            std_c1 = constraint1.replace("<=", "+ S₁ =") 
-            std_c2 = constraint2.replace("<=", "+ S₂ =")  
-            standard_form = f"""{std_obj}
-{std_c1}
-{std_c2}"""
-            
-            all_steps.append({
-                'type': 'standard_form',
-                'data': standard_form
-            })
-            
-            parsed1 = parse_constraint(constraint1)
-            parsed2 = parse_constraint(constraint2)
-            
-            if parsed1 is None or parsed2 is None:
-                return render_template(
-                    "main.html",
-                    objective=objective,
-                    constraint1=constraint1,
-                    constraint2=constraint2,
-                    nonneg=nonneg,
-                    parse_error="Could not parse constraints. Use format like: 2x + 3y <= 8"
-                )
+        if objective and constraints:
+            page = request.form.get("page", "1")
+            page = max(int(page), 1) if page.isdigit() else 1
+            return solution_page(objective, constraints, nonneg, numeric, trace, page)
 
-            a1, b1, rhs1 = parsed1
-            a2, b2, rhs2 = parsed2
-            parsed_obj = parse_objective(objective)
-            if parsed_obj is None:
-                c1, c2 = 0, 0
-            else:
-                c1, c2 = parsed_obj
-
-            # Initial Tableau
-            initial_tableau = [
-                [Markup("<b>S₁</b>"), a1, b1, 1, 0, rhs1],
-                [Markup("<b>S₂</b>"), a2, b2, 0, 1, rhs2], 
-                [Markup("<b>z</b>"), -c1, -c2, 0, 0, 0]     
-            ]
-            
-            all_steps.append({
-                'type': 'initial_tableau',
-                'data': initial_tableau
-            })
-            
-            # Start iterative process
-            current_tableau = initial_tableau
-            iteration = 1
-            continue_iterating = True
-            
-            while continue_iterating:
-                
-                # Find pivot column for current iteration
-                z_row = [parse_fraction_string(cell) for cell in current_tableau[-1][1:-1] if cell != '—']
-                try:
-                    min_val = min(z_row)
-                    pivot_index = z_row.index(min_val) + 1
-                except Exception:
-                    pivot_index = 1
-                
-                all_steps.append({
-                    'type': 'pivot_column',
-                    'data': {
-                        'tableau': current_tableau,
-                        'pivot_index': pivot_index,
-                        'iteration': iteration
-                    }
-                })
-                
-                # Find pivot row with ratios
-                ratio_values = []
-                for i in range(2):
-                    row = current_tableau[i]
-                    rhs = parse_fraction_string(row[-1])
-                    pivot_col_value = parse_fraction_string(row[pivot_index]) if row[pivot_index] != '—' else 0
-
-                    if pivot_col_value > 0:
-                        ratio = rhs / pivot_col_value
-                        ratio_values.append(ratio)
-                    else:
-                        ratio_values.append(None)
-
-                positives = [(idx, val) for idx, val in enumerate(ratio_values) if val is not None]
-                if positives:
-                    pivot_idx_pair = min(positives, key=lambda t: t[1])
-                    pivot_row_index = pivot_idx_pair[0]
-                    k = parse_fraction_string(current_tableau[pivot_row_index][pivot_index])
-                else:
-                    pivot_row_index = None
-                    k = None
-                    for i in range(2):
-                        v = parse_fraction_string(current_tableau[i][pivot_index]) if current_tableau[i][pivot_index] != '—' else 0
-                        if v > 0:
-                            pivot_row_index = i
-                            k = v
-                            break
-
-                # Create tableau with ratios
-                tableau_with_ratios = []
-                for i, row in enumerate(current_tableau):
-                    label = row[0]
-                    if i in [0, 1]:
-                        r = ratio_values[i]
-                        if r is not None:
-                            fraction_form = format_number(float(r))
-                            rhs_display = row[-1]
-                            pivot_val_display = row[pivot_index]
-                            
-                            if '/' in str(rhs_display) or '/' in str(pivot_val_display):
-                                if float(r) == int(float(r)):
-                                    ratio_cell = f"{rhs_display} ÷ {pivot_val_display} = {fraction_form}"
-                                else:
-                                    decimal_form = f"{float(r):.2f}"
-                                    ratio_cell = f"{rhs_display} ÷ {pivot_val_display} = {fraction_form} ({decimal_form})"
-                            else:
-                                if float(r) == int(float(r)):
-                                    ratio_cell = f"{rhs_display}/{pivot_val_display} = {fraction_form}"
-                                else:
-                                    decimal_form = f"{float(r):.2f}"
-                                    ratio_cell = f"{rhs_display}/{pivot_val_display} = {fraction_form} ({decimal_form})"
-                        else:
-                            ratio_cell = "—"
-                        new_row = [label] + row[1:] + [ratio_cell]  
-                    else:
-                        if k is not None:
-                            k_display = format_reciprocal_display(k)
-                            new_row = [label] + row[1:] + [k_display]
-                        else:
-                            new_row = [label] + row[1:] + ["1/k = —"]
-                    tableau_with_ratios.append(new_row)
-
-                all_steps.append({
-                    'type': 'pivot_row',
-                    'data': {
-                        'tableau_with_ratios': tableau_with_ratios,
-                        'pivot_index': pivot_index,
-                        'pivot_row_index': pivot_row_index,
-                        'pivot_element': current_tableau[pivot_row_index][pivot_index] if pivot_row_index is not None else None,
-                        'iteration': iteration
-                    }
-                })
-                
-                # Perform pivot operations
-                if pivot_row_index is not None:
-                    pivot_value_str = current_tableau[pivot_row_index][pivot_index]
-                    pivot_value = parse_fraction_string(pivot_value_str)
-                    
-                    column_names = ["B.V", "x", "y", "S₁", "S₂", "RHS"]
-                    pivot_col_name = column_names[pivot_index] if pivot_index < len(column_names) else f"Col{pivot_index}"
-                    
-                    # Calculate reciprocal for display
-                    reciprocal_display = ""
-                    if pivot_value != 0:
-                        reciprocal = 1 / pivot_value
-                        reciprocal_display = format_number(reciprocal)
-                    
-                    # Solution 1: Pivot row operations
-                    solution1_header = Markup(f"{current_tableau[pivot_row_index][0]}({reciprocal_display})→{pivot_col_name}") if reciprocal_display else Markup(f"{current_tableau[pivot_row_index][0]}(1/k)→{pivot_col_name}")
-                    solution1 = []
-                    solution1_results = []
-                    
-                    for j in range(1, len(current_tableau[0])):
-                        old_val_str = current_tableau[pivot_row_index][j]
-                        old_val = parse_fraction_string(old_val_str)
-                        result = old_val / pivot_value
-                        
-                        if reciprocal_display:
-                            solution1.append(f"{format_number(old_val)}({reciprocal_display}) = {format_number(result)}")
-                        else:
-                            solution1.append(f"{format_number(old_val)}(1/{format_number(pivot_value)}) = {format_number(result)}")
-                        
-                        solution1_results.append(result)
-                    
-                    # Solution 2: Other row operations
-                    other_row = 1 - pivot_row_index
-                    P_other_str = current_tableau[other_row][pivot_index]
-                    P_other = parse_fraction_string(P_other_str)
-                    
-                    solution2_header = Markup(f"{current_tableau[other_row][0]} = {current_tableau[other_row][0]} - {pivot_col_name}(P {current_tableau[other_row][0]})")
-                    solution2 = []
-                    
-                    for j in range(1, len(current_tableau[0])):
-                        old_val_str = current_tableau[other_row][j]
-                        old_val = parse_fraction_string(old_val_str)
-                        pivot_row_result = solution1_results[j-1]
-                        new_val = old_val - pivot_row_result * P_other
-                        calc_str = f"{format_number(old_val)} - {format_number(pivot_row_result)}({format_number(P_other)}) = {format_number(new_val)}"
-                        solution2.append(calc_str)
-                    
-                    # Solution 3: Z-row operations
-                    P_z_str = current_tableau[2][pivot_index]
-                    P_z = parse_fraction_string(P_z_str)
-                    
-                    solution3_header = Markup(f"z = z - {pivot_col_name}(P z)")
-                    solution3 = []
-                    
-                    for j in range(1, len(current_tableau[0])):
-                        old_val_str = current_tableau[2][j]
-                        old_val = parse_fraction_string(old_val_str)
-                        pivot_row_result = solution1_results[j-1]
-                        new_val = old_val - pivot_row_result * P_z
-                        calc_str = f"{format_number(old_val)} - {format_number(pivot_row_result)}({format_number(P_z)}) = {format_number(new_val)}"
-                        solution3.append(calc_str)
-
-                    all_steps.append({
-                        'type': 'pivot_operations',
-                        'data': {
-                            'solution1_header': solution1_header,
-                            'solution1': solution1,
-                            'solution2_header': solution2_header,
-                            'solution2': solution2,
-                            'solution3_header': solution3_header,
-                            'solution3': solution3,
-                            'iteration': iteration
-                        }
-                    })
-                    
-                    # Perform pivot operation to get new tableau
-                    new_tableau = perform_pivot_operations(current_tableau, pivot_row_index, pivot_index)
-                    has_negative_in_z = check_negative_in_z_row(new_tableau)
-                    
-                    all_steps.append({
-                        'type': 'new_tableau',
-                        'data': {
-                            'tableau': new_tableau,
-                            'has_negative_in_z': has_negative_in_z,
-                            'iteration_count': iteration + 1
-                        }
-                    })
-                    
-                    # Update for next iteration
-                    current_tableau = new_tableau
-                    iteration += 1
-                    
-                    # Check if we need to continue iterating
-                    continue_iterating = has_negative_in_z
-                else:
-                    # No valid pivot row found, stop iterating
-                    continue_iterating = False
+    # Handle the "standard" action (kept for backward compatibility)
+    if action == "standard":
+        if objective and constraints:
+            standard_form = steps.standard_form(objective, constraints)
             
-            # Render template with all steps
             return render_template(
                 "main.html",
                 objective=objective,
-                constraint1=constraint1,
-                constraint2=constraint2,
+                constraints=constraints,
                 nonneg=nonneg,
                 standard_form=standard_form,
-                all_steps=all_steps,
-                display_all_steps=display_all_steps
+                iteration_count=iteration_count
             )
 
-    # Handle the "standard" action (kept for backward compatibility)
-    if action == "standard":
-        if objective and constraint1 and constraint2:
-            std_obj = "Z - " + objective.replace("+", "-") + " = 0" 
-            std_c1 = constraint1.replace("<=", "+ S₁ =") 
-            std_c2 = constraint2.replace("<=", "+ S₂ =")  
-            standard_form = f"""{std_obj}
-{std_c1}
-{std_c2}"""
-            
+    # Single steps of iteration 1 (kept for backward compatibility); each one
+    # starts from the submitted problem, as the page steps through whole
+    # walkthroughs client-side
+    if action in ["tableau1", "highlight", "pivotrow", "solution"] or action == "tableau2_solution":
+        try:
+            working_tableau = build_tableau()
+        except ProblemError as e:
             return render_template(
                 "main.html",
                 objective=objective,
-                constraint1=constraint1,
-                constraint2=constraint2,
+                constraints=constraints,
                 nonneg=nonneg,
-                standard_form=standard_form,
-                iteration_count=iteration_count
+                standard_form=standard_form,  # Pass standard_form
+                tableau1=None,
+                parse_error=f"Could not solve: {e}. Use format like: 2x + 3y <= 8"
             )
-
-    # Handle tableau data from iterations
-    tableau_data_json = request.form.get("tableau_data")
-    if tableau_data_json and tableau_data_json.strip() and tableau_data_json != "None":
-        try:
-            current_tableau_data = json.loads(tableau_data_json)
-            # Convert back to proper format with Markup
-            converted_tableau = []
-            for row in current_tableau_data:
-                converted_row = []
-                for j, cell in enumerate(row):
-                    if j == 0 and isinstance(cell, str) and ('<b>' in cell or '</b>' in cell):
-                        converted_row.append(Markup(cell))
-                    else:
-                        converted_row.append(cell)
-                converted_tableau.append(converted_row)
-            current_tableau_data = converted_tableau
-        except (json.JSONDecodeError, ValueError) as e:
-            print(f"JSON decode error: {e}")
-            current_tableau_data = None
-    
-    # Handle different actions for iteration 2+
-    if action in ["tableau2_pivotcol", "tableau2_pivotrow", "tableau2_solution"]:
-        iteration_count = 2  # We're on iteration 2 or higher
-    
-    # Handle Pivot Column for iteration 2+
-    if action == "tableau2_pivotcol":
-        working_tableau = current_tableau_data
-        
-        # Find pivot column (highlighting)
-        z_row = [parse_fraction_string(cell) for cell in working_tableau[-1][1:-1] if cell != '—']
-        try:
-            min_val = min(z_row)
-            pivot_index = z_row.index(min_val) + 1
-        except Exception:
-            pivot_index = 1
-        
-        tableau2_highlight = working_tableau
-        
-        # Render template with ONLY pivot column highlighted
-        return render_template(
-            "main.html",
-            objective=objective,
-            constraint1=constraint1,
-            constraint2=constraint2,
-            nonneg=nonneg,
-            standard_form=standard_form,  # Pass standard_form
-            tableau1=tableau1,
-            tableau_highlight=tableau_highlight,
-            tableau2_highlight=tableau2_highlight,
-            pivot_index=pivot_index,
-            tableau_ratio=tableau_ratio,
-            tableau2_ratio=tableau2_ratio,
-            pivot_row_index=pivot_row_index,
-            solution1_header=solution1_header,
-            solution1=solution1,
-            solution2_header=solution2_header,
-            solution2=solution2,
-            solution3_header=solution3_header,
-            solution3=solution3,
-            tableau2=tableau2,
-            has_negative_in_z=has_negative_in_z,
-            show_pivotrow_button=True,
-            current_tableau_data=json.dumps([[str(cell) for cell in row] for row in current_tableau_data]),
-            iteration_count=iteration_count
-        )
-    
-    # Handle Pivot Row for iteration 2+
-    if action == "tableau2_pivotrow":
-        working_tableau = current_tableau_data
-        
-        # Find pivot column first
-        z_row = [parse_fraction_string(cell) for cell in working_tableau[-1][1:-1] if cell != '—']
-        try:
-            min_val = min(z_row)
-            pivot_index = z_row.index(min_val) + 1
-        except Exception:
-            pivot_index = 1
-        
-        # Calculate ratios for pivot row determination
-        ratio_values = []
-        for i in range(2):
-            row = working_tableau[i]
-            rhs = parse_fraction_string(row[-1])
-            pivot_col_value = parse_fraction_string(row[pivot_index]) if row[pivot_index] != '—' else 0
-
-            if pivot_col_value > 0:
-                ratio = rhs / pivot_col_value
-                ratio_values.append(ratio)
-            else:
-                ratio_values.append(None)
-
-        positives = [(idx, val) for idx, val in enumerate(ratio_values) if val is not None]
-        if positives:
-            pivot_idx_pair = min(positives, key=lambda t: t[1])
-            pivot_row_index = pivot_idx_pair[0]
-            k = parse_fraction_string(working_tableau[pivot_row_index][pivot_index])
-        else:
-            pivot_row_index = None
-            k = None
-            for i in range(2):
-                v = parse_fraction_string(working_tableau[i][pivot_index]) if working_tableau[i][pivot_index] != '—' else 0
-                if v > 0:
-                    pivot_row_index = i
-                    k = v
-                    break
-
-        # Create tableau with ratios
-        tableau_with_ratios = []
-        for i, row in enumerate(working_tableau):
-            label = row[0]
-            if i in [0, 1]:
-                r = ratio_values[i]
-                if r is not None:
-                    fraction_form = format_number(float(r))
-                    # Use clearer division representation
-                    rhs_display = row[-1]
-                    pivot_val_display = row[pivot_index]
-                    
-                    # Check if either value is a fraction to avoid confusing "4/5/3" notation
-                    if '/' in str(rhs_display) or '/' in str(pivot_val_display):
-                        # Use division symbol for clarity
-                        if float(r) == int(float(r)):
-                            ratio_cell = f"{rhs_display} ÷ {pivot_val_display} = {fraction_form}"
-                        else:
-                            decimal_form = f"{float(r):.2f}"
-                            ratio_cell = f"{rhs_display} ÷ {pivot_val_display} = {fraction_form} ({decimal_form})"
-                    else:
-                        if float(r) == int(float(r)):
-                            ratio_cell = f"{rhs_display}/{pivot_val_display} = {fraction_form}"
-                        else:
-                            decimal_form = f"{float(r):.2f}"
-                            ratio_cell = f"{rhs_display}/{pivot_val_display} = {fraction_form} ({decimal_form})"
-                else:
-                    ratio_cell = "—"
-                new_row = [label] + row[1:] + [ratio_cell]  
-            else:
-                if k is not None:
-                    k_display = format_reciprocal_display(k)
-                    new_row = [label] + row[1:] + [k_display]
-                else:
-                    new_row = [label] + row[1:] + ["1/k = —"]
-            tableau_with_ratios.append(new_row)
-
-        tableau2_ratio = tableau_with_ratios
-        show_solution_button = True
-
-        return render_template(
-            "main.html",
-            objective=objective,
-            constraint1=constraint1,
-            constraint2=constraint2,
-            nonneg=nonneg,
-            standard_form=standard_form,  # Pass standard_form
-            tableau1=tableau1,
-            tableau_highlight=tableau_highlight,
-            tableau2_highlight=tableau2_highlight,
-            pivot_index=pivot_index,
-            tableau_ratio=tableau_ratio,
-            tableau2_ratio=tableau2_ratio,
-            pivot_row_index=pivot_row_index,
-            solution1_header=solution1_header,
-            solution1=solution1,
-            solution2_header=solution2_header,
-            solution2=solution2,
-            solution3_header=solution3_header,
-            solution3=solution3,
-            tableau2=tableau2,
-            has_negative_in_z=has_negative_in_z,
-            show_solution_button=show_solution_button,
-            current_tableau_data=json.dumps([[str(cell) for cell in row] for row in current_tableau_data]),
-            iteration_count=iteration_count
-        )
-
-    # Main logic for initial tableau and iteration 1 (for backward compatibility)
-    if action in ["tableau1", "highlight", "pivotrow", "solution"] or action == "tableau2_solution":
-        if current_tableau_data and action == "tableau2_solution":
-            working_tableau = current_tableau_data
-            is_iteration = True
-            iteration_count = 2
-        else:
-            parsed1 = parse_constraint(constraint1)
-            parsed2 = parse_constraint(constraint2)
-            if parsed1 is None or parsed2 is None:
-                return render_template(
-                    "main.html",
-                    objective=objective,
-                    constraint1=constraint1,
-                    constraint2=constraint2,
-                    nonneg=nonneg,
-                    standard_form=standard_form,  # Pass standard_form
-                    tableau1=None,
-                    parse_error="Could not parse constraints. Use format like: 2x + 3y <= 8"
-                )
-
-            a1, b1, rhs1 = parsed1
-            a2, b2, rhs2 = parsed2
-            parsed_obj = parse_objective(objective)
-            if parsed_obj is None:
-                c1, c2 = 0, 0
-            else:
-                c1, c2 = parsed_obj
-
-            working_tableau = [
-                [Markup("<b>S₁</b>"), a1, b1, 1, 0, rhs1],
-                [Markup("<b>S₂</b>"), a2, b2, 0, 1, rhs2], 
-                [Markup("<b>z</b>"), -c1, -c2, 0, 0, 0]     
-            ]
-            is_iteration = False
-            iteration_count = 1
-            tableau1 = working_tableau
+        tableau1 = steps.display_rows(working_tableau, bold)
+        column_names = steps.column_names(working_tableau)
 
         # Handle highlight step for pivotal column
         if action in ["highlight", "pivotrow", "solution", "tableau2_solution"]:
-            z_row = [parse_fraction_string(cell) for cell in working_tableau[-1][1:-1] if cell != '—']
-            try:
-                min_val = min(z_row)
-                pivot_index = z_row.index(min_val) + 1
-            except Exception:
-                pivot_index = 1
-            
-            if is_iteration:
-                tableau2_highlight = working_tableau
-            else:
-                tableau_highlight = working_tableau
+            pivot_index = working_tableau.entering() + 1
+            tableau_highlight = steps.display_rows(working_tableau, bold)
 
         # Handle pivot row calculation with ratios
         if action in ["pivotrow", "solution", "tableau2_solution"]:
-            ratio_values = []
-            for i in range(2):
-                row = working_tableau[i]
-                rhs = parse_fraction_string(row[-1])
-                pivot_col_value = parse_fraction_string(row[pivot_index]) if row[pivot_index] != '—' else 0
-
-                if pivot_col_value > 0:
-                    ratio = rhs / pivot_col_value
-                    ratio_values.append(ratio)
-                else:
-                    ratio_values.append(None)
-
-            positives = [(idx, val) for idx, val in enumerate(ratio_values) if val is not None]
-            if positives:
-                pivot_idx_pair = min(positives, key=lambda t: t[1])
-                pivot_row_index = pivot_idx_pair[0]
-                k = parse_fraction_string(working_tableau[pivot_row_index][pivot_index])
-            else:
-                pivot_row_index = None
-                k = None
-                for i in range(2):
-                    v = parse_fraction_string(working_tableau[i][pivot_index]) if working_tableau[i][pivot_index] != '—' else 0
-                    if v > 0:
-                        pivot_row_index = i
-                        k = v
-                        break
-
-            tableau_with_ratios = []
-            for i, row in enumerate(working_tableau):
-                label = row[0]
-                if i in [0, 1]:
-                    r = ratio_values[i]
-                    if r is not None:
-                        fraction_form = format_number(float(r))
-                        # Use clearer division representation
-                        rhs_display = row[-1]
-                        pivot_val_display = row[pivot_index]
-                        
-                        # Check if either value is a fraction to avoid confusing "4/5/3" notation
-                        if '/' in str(rhs_display) or '/' in str(pivot_val_display):
-                            # Use division symbol for clarity
-                            if float(r) == int(float(r)):
-                                ratio_cell = f"{rhs_display} ÷ {pivot_val_display} = {fraction_form}"
-                            else:
-                                decimal_form = f"{float(r):.2f}"
-                                ratio_cell = f"{rhs_display} ÷ {pivot_val_display} = {fraction_form} ({decimal_form})"
-                        else:
-                            if float(r) == int(float(r)):
-                                ratio_cell = f"{rhs_display}/{pivot_val_display} = {fraction_form}"
-                            else:
-                                decimal_form = f"{float(r):.2f}"
-                                ratio_cell = f"{rhs_display}/{pivot_val_display} = {fraction_form} ({decimal_form})"
-                    else:
-                        ratio_cell = "—"
-                    new_row = [label] + row[1:] + [ratio_cell]  
-                else:
-                    if k is not None:
-                        k_display = format_reciprocal_display(k)
-                        new_row = [label] + row[1:] + [k_display]
-                    else:
-                        new_row = [label] + row[1:] + ["1/k = —"]
-                tableau_with_ratios.append(new_row)
-
-            if is_iteration:
-                tableau2_ratio = tableau_with_ratios
-            else:
-                tableau_ratio = tableau_with_ratios
+            tableau_ratio, pivot_row_index, k = steps.ratio_table(working_tableau, pivot_index - 1, bold)
 
             if action in ["pivotrow", "tableau2_solution"]:
                 show_solution_button = True
 
         # PIVOT ELIMINATION
         if action in ["solution", "tableau2_solution"]:
-            if pivot_index is None:
-                z_row = [parse_fraction_string(cell) for cell in working_tableau[-1][1:-1] if cell != '—']
-                try:
-                    min_val = min(z_row)
-                    pivot_index = z_row.index(min_val) + 1
-                except Exception:
-                    pivot_index = 1
-            
             if pivot_row_index is None:
-                local_ratios = []
-                for i in range(2):
-                    try:
-                        pv = parse_fraction_string(working_tableau[i][pivot_index]) if working_tableau[i][pivot_index] != '—' else 0
-                        if pv > 0:
-                            local_ratios.append(parse_fraction_string(working_tableau[i][-1]) / pv)
-                        else:
-                            local_ratios.append(None)
-                    except Exception:
-                        local_ratios.append(None)
-                positives_local = [(idx, val) for idx, val in enumerate(local_ratios) if val is not None]
-                if positives_local:
-                    pivot_row_index = int(min(positives_local, key=lambda t: t[1])[0])
-                else:
-                    pivot_row_index = 0
-
-            pivot_value_str = working_tableau[pivot_row_index][pivot_index]
-            pivot_value = parse_fraction_string(pivot_value_str)
-            
-            if pivot_value == 0:
+                pivot_row_index = 0
+
+            if working_tableau.rows[pivot_row_index][pivot_index - 1] == 0:
                 return render_template(
                     "main.html",
                     objective=objective,
-                    constraint1=constraint1,
-                    constraint2=constraint2,
+                    constraints=constraints,
                     nonneg=nonneg,
                     standard_form=standard_form,  # Pass standard_form
+                    column_names=column_names,
                     tableau1=tableau1,
                     tableau_highlight=tableau_highlight,
                     pivot_index=pivot_index,
@@ -852,84 +378,39 @@ def solve():
                 )
 
             # SOLUTIONS
-            column_names = ["B.V", "x", "y", "S₁", "S₂", "RHS"]
-            pivot_col_name = column_names[pivot_index] if pivot_index < len(column_names) else f"Col{pivot_index}"
-            
-            # Calculate reciprocal for display
-            reciprocal_display = ""
-            if pivot_value != 0:
-                reciprocal = 1 / pivot_value
-                reciprocal_display = format_number(reciprocal)
-            
-            # Use Markup to allow HTML in solution headers - FIXED to show reciprocal
-            if reciprocal_display:
-                solution1_header = Markup(f"{working_tableau[pivot_row_index][0]}({reciprocal_display})→{pivot_col_name}")
-            else:
-                solution1_header = Markup(f"{working_tableau[pivot_row_index][0]}(1/k)→{pivot_col_name}")
-            
-            solution1 = []
-            solution1_results = []
-            
-            for j in range(1, len(working_tableau[0])):
-                old_val_str = working_tableau[pivot_row_index][j]
-                old_val = parse_fraction_string(old_val_str)
-                result = old_val / pivot_value
-                
-                # FIXED: Show the actual reciprocal, not "1/k"
-                if reciprocal_display:
-                    solution1.append(f"{format_number(old_val)}({reciprocal_display}) = {format_number(result)}")
-                else:
-                    solution1.append(f"{format_number(old_val)}(1/{format_number(pivot_value)}) = {format_number(result)}")
-                
-                solution1_results.append(result)
-            
-            other_row = 1 - pivot_row_index
-            P_other_str = working_tableau[other_row][pivot_index]
-            P_other = parse_fraction_string(P_other_str)
-            
-            solution2_header = Markup(f"{working_tableau[other_row][0]} = {working_tableau[other_row][0]} - {pivot_col_name}(P {working_tableau[other_row][0]})")
-            solution2 = []
-            
-            for j in range(1, len(working_tableau[0])):
-                old_val_str = working_tableau[other_row][j]
-                old_val = parse_fraction_string(old_val_str)
-                pivot_row_result = solution1_results[j-1]
-                new_val = old_val - pivot_row_result * P_other
-                calc_str = f"{format_number(old_val)} - {format_number(pivot_row_result)}({format_number(P_other)}) = {format_number(new_val)}"
-                solution2.append(calc_str)
-            
-            P_z_str = working_tableau[2][pivot_index]
-            P_z = parse_fraction_string(P_z_str)
-            
-            solution3_header = Markup(f"z = z - {pivot_col_name}(P z)")
-            solution3 = []
-            
-            for j in range(1, len(working_tableau[0])):
-                old_val_str = working_tableau[2][j]
-                old_val = parse_fraction_string(old_val_str)
-                pivot_row_result = solution1_results[j-1]
-                new_val = old_val - pivot_row_result * P_z
-                calc_str = f"{format_number(old_val)} - {format_number(pivot_row_result)}({format_number(P_z)}) = {format_number(new_val)}"
-                solution3.append(calc_str)
-
-            new_tableau = perform_pivot_operations(working_tableau, pivot_row_index, pivot_index)
-            has_negative_in_z = check_negative_in_z_row(new_tableau)
+            operations = steps.pivot_operations(working_tableau, pivot_row_index, pivot_index - 1, bold)
+            solution1_header = operations['solution1_header']
+            solution1 = operations['solution1']
+            other_rows = operations['other_rows']
+            solution3_header = operations['solution3_header']
+            solution3 = operations['solution3']
+
+            working_tableau.pivot(pivot_row_index, pivot_index - 1)
+            # The end of Phase I switches straight to the Phase II tableau
+            if working_tableau.phase_one is not None and working_tableau.is_optimal():
+                status, _ = finish_phase_one(working_tableau)
+                if status == INFEASIBLE:
+                    return render_template(
+                        "main.html",
+                        objective=objective,
+                        constraints=constraints,
+                        nonneg=nonneg,
+                        standard_form=standard_form,
+                        solution_error="The problem has no feasible solution."
+                    )
+            tableau2 = steps.display_rows(working_tableau, bold)
+            has_negative_in_z = not working_tableau.is_optimal()
 
             # Determine next iteration count
-            if is_iteration:
-                tableau2 = new_tableau
-                next_iteration = iteration_count + 1
-            else:
-                tableau2 = new_tableau
-                next_iteration = 2
+            next_iteration = iteration_count + 1
 
             return render_template(
                 "main.html",
                 objective=objective,
-                constraint1=constraint1,
-                constraint2=constraint2,
+                constraints=constraints,
                 nonneg=nonneg,
                 standard_form=standard_form,  # Pass standard_form
+                column_names=column_names,
                 tableau1=tableau1,
                 tableau_highlight=tableau_highlight,
                 tableau2_highlight=tableau2_highlight,
@@ -939,14 +420,12 @@ def solve():
                 pivot_row_index=pivot_row_index,
                 solution1_header=solution1_header,
                 solution1=solution1,
-                solution2_header=solution2_header,
-                solution2=solution2,
+                other_rows=other_rows,
                 solution3_header=solution3_header,
                 solution3=solution3,
                 tableau2=tableau2,
                 has_negative_in_z=has_negative_in_z,
                 show_solution_button=True,
-                current_tableau_data=json.dumps([[str(cell) for cell in row] for row in new_tableau]) if new_tableau else None,
                 iteration_count=iteration_count,
                 next_iteration=next_iteration
             )
@@ -955,10 +434,10 @@ def solve():
     return render_template(
         "main.html",
         objective=objective,
-        constraint1=constraint1,
-        constraint2=constraint2,
+        constraints=constraints,
         nonneg=nonneg,
         standard_form=standard_form,
+        column_names=column_names,
         tableau1=tableau1,
         tableau_highlight=tableau_highlight,
         tableau2_highlight=tableau2_highlight,
@@ -968,25 +447,202 @@ def solve():
         pivot_row_index=pivot_row_index,
         solution1_header=solution1_header,
         solution1=solution1,
-        solution2_header=solution2_header,
-        solution2=solution2,
+        other_rows=other_rows,
         solution3_header=solution3_header,
         solution3=solution3,
         show_solution_button=show_solution_button,
         show_pivotrow_button=show_pivotrow_button,
         tableau2=tableau2,
         has_negative_in_z=has_negative_in_z,
-        current_tableau_data=current_tableau_data,
         iteration_count=iteration_count,      
         next_iteration=next_iteration,
         all_steps=all_steps,
         display_all_steps=display_all_steps
     )
 
+@app.route("/p/<code>")
+def permalink(code):
+    """Solution page of the problem in ``code`` (see :mod:`solver.permalink`), cacheable by URL
+
+    Options come from the query string (``numeric``, ``trace``, ``page``); any
+    other spelling of the same problem and options redirects to the canonical
+    URL, so each page is cached once.
+    """
+    try:
+        problem = decode_problem(code)
+    except ProblemError:
+        abort(404)
+    numeric = request.args.get("numeric", "fraction")
+    if numeric not in NUMERIC_TYPES:
+        numeric = "fraction"
+    trace = request.args.get("trace", "full")
+    if trace not in TRACE_LEVELS:
+        trace = "full"
+    page = request.args.get("page", "1")
+    page = max(int(page), 1) if page.isdigit() else 1
+    canonical = permalink_url(problem, numeric, trace, page)
+    if request.script_root + request.full_path.rstrip("?") != canonical:
+        return redirect(canonical, 301)
+
+    objective, constraints = problem_text(problem)
+    nonneg = ", ".join(f"{name} >= 0" for name in problem.variables)
+    started = time.monotonic()
+    response = make_response(solution_page(objective, constraints, nonneg, numeric, trace, page, stream=False))
+    time_limit = app.config["SOLVE_TIME_LIMIT"]
+    if time_limit is not None and time.monotonic() - started >= time_limit:
+        # The clock may have cut the solve short; another run could get further
+        response.cache_control.no_store = True
+        return response
+    response.add_etag()
+    response.cache_control.public = True
+    response.cache_control.max_age = app.config["PERMALINK_MAX_AGE"]
+    return response.make_conditional(request)
+
+
+@app.route("/api/solve", methods=["POST"])
+def api_solve():
+    """Solve a structured problem and return the result as JSON
+
+    Accepts the fields of ``Problem.from_dict`` plus optional ``numeric``
+    (default ``"fraction"``), ``trace`` (default false) and the other
+    ``solve()`` options such as ``method`` (``"tableau"`` or ``"revised"``).
+    ``max_iterations`` and ``time_limit`` default to the app's limits and
+    may only lower them; a solve that hits one reports it as its ``status``.  ``sensitivity`` adds
+    shadow prices, reduced costs and ranges to an optimal result.  ``trace``
+    is ``"none"``, ``"summary"`` (the pivots) or ``"full"`` (the pivots and
+    every tableau); true means ``"full"``.  No template is rendered, and only
+    untraced solves go through the result cache.
+    With ``keep_basis`` set the result carries a ``handle`` for
+    ``/api/resolve``.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify(error="Request body must be a JSON object"), 400
+
+    numeric = data.get("numeric", "fraction")
+    if numeric not in NUMERIC_TYPES:
+        return jsonify(error=f"numeric must be one of {sorted(NUMERIC_TYPES)}"), 400
+
+    try:
+        options = request_options(data, default_limits())
+        problem = Problem.from_dict(data)
+        trace = trace_level(data.get("trace"))
+        if trace != "none":
+            result = solve_problem(problem, numeric=numeric, trace=trace, **options)
+        else:
+            result = solve_cached(problem, result_cache, numeric=numeric, **options)
+    except (ProblemError, ValueError, ArithmeticError) as e:
+        return jsonify(error=str(e)), 400
+    if data.get("keep_basis"):
+        result = dict(result, handle=keep_basis(problem, numeric, result))
+    return jsonify(result)
+
+
+def keep_basis(problem, numeric, result):
+    """Store ``problem`` and the basis it was solved to; return the handle"""
+    handle = secrets.token_urlsafe(16)
+    basis_store.put(handle, {"problem": problem, "numeric": numeric, "previous": {"basis": result["basis"]}})
+    return handle
+
+
+@app.route("/api/resolve", methods=["POST"])
+def api_resolve():
+    """Re-solve a kept problem after a change, starting from its last basis
+
+    Takes ``{"handle": ..., "delta": {...}}`` (see :mod:`solver.warm` for
+    the delta) plus the ``/api/solve`` options; ``numeric`` defaults to the
+    one the handle was solved with.  ``warm_start`` in the result reports
+    how the basis was installed; with ``"compare": true`` the changed
+    problem is also solved cold and the pivots saved are reported too.  The
+    result carries a new ``handle`` for the changed problem, so changes can
+    be chained.  Handles expire after half an hour.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify(error="Request body must be a JSON object"), 400
+    kept = basis_store.get(data.get("handle")) if isinstance(data.get("handle"), str) else None
+    if kept is None:
+        return jsonify(error="Unknown or expired handle; solve again with keep_basis"), 400
+
+    numeric = data.get("numeric", kept["numeric"])
+    if numeric not in NUMERIC_TYPES:
+        return jsonify(error=f"numeric must be one of {sorted(NUMERIC_TYPES)}"), 400
+
+    try:
+        options = request_options(data, default_limits())
+        problem, result = resolve(kept["problem"], kept["previous"], data.get("delta", {}),
+                                  compare=bool(data.get("compare")), numeric=numeric,
+                                  trace=trace_level(data.get("trace")), **options)
+    except (ProblemError, ValueError, ArithmeticError) as e:
+        return jsonify(error=str(e)), 400
+    result["handle"] = keep_basis(problem, numeric, result)
+    return jsonify(result)
+
+
+@app.route("/api/walkthrough", methods=["POST"])
+def api_walkthrough():
+    """The whole step-by-step walkthrough of a typed problem as one compact JSON trace
+
+    Takes ``{"objective": "max 3x + 5y", "constraints": ["x <= 4", ...],
+    "numeric": "fraction"}`` and returns :meth:`Walkthrough.compact
+    <solver.steps.Walkthrough.compact>`: every tableau once plus the pivots
+    between them, from which the page lays out the pivot column, ratio
+    table and row operations of each iteration without asking again.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify(error="Request body must be a JSON object"), 400
+    numeric = data.get("numeric", "fraction")
+    if numeric not in NUMERIC_TYPES:
+        return jsonify(error=f"numeric must be one of {sorted(NUMERIC_TYPES)}"), 400
+    objective = data.get("objective")
+    constraints = data.get("constraints")
+    if not isinstance(objective, str) or not isinstance(constraints, list) \
+            or not all(isinstance(c, str) for c in constraints):
+        return jsonify(error="objective must be a string and constraints a list of strings"), 400
+    try:
+        problem = parse_problem(objective, [c for c in constraints if c.strip()])
+        walkthrough = steps_cache.get_or_compute(
+            (numeric,) + problem.key(), lambda: steps.Walkthrough(problem, numeric))
+    except ProblemError as e:
+        return jsonify(error=f"Could not solve: {e}. Use format like: 2x + 3y <= 8"), 400
+    return jsonify(walkthrough.compact(Budget(**default_limits())))
+
+
+@app.route("/api/cache/stats")
+def api_cache_stats():
+    """Hit/miss counters and sizes of the solve caches"""
+    return jsonify(results=result_cache.stats(), steps=steps_cache.stats())
+
+
+@app.route("/api/solve/batch", methods=["POST"])
+def api_solve_batch():
+    """Solve a JSON array or NDJSON stream of problems on the process pool
+
+    Results stream back as NDJSON in completion order; each line carries the
+    ``index`` of its problem.  NDJSON input is read lazily, so solving starts
+    before the whole body has arrived.
+    """
+    if request.mimetype in ("application/x-ndjson", "application/ndjson"):
+        items = iter_ndjson(request.stream)
+    else:
+        data = request.get_json(silent=True)
+        if not isinstance(data, list):
+            return jsonify(error="Request body must be a JSON array or NDJSON"), 400
+        items = enumerate(data)
+
+    limits = default_limits()
+
+    def generate():
+        for result in solve_many(items, **limits):
+            yield json.dumps(result, default=json_default) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
 # ==================== ADDED ABOUT ROUTE ====================
 @app.route("/about")
 def about_page():
-    return render_template("about.html")
+    return static_page("about.html")
 # ===========================================================
 
 
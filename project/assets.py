@@ -0,0 +1,78 @@
+"""Fingerprinted static assets, compressed once and served with long-lived caching.
+
+Every file under ``static/`` is read when the app starts.  Its URL name
+carries a hash of the content (``css/main.css`` -> ``css/main.1a2b3c4d5e6f.css``),
+so a URL never changes meaning and browsers may keep it forever; editing the
+file changes the URL the templates link to.  Each file is gzip- and
+Brotli-compressed up front, so requests only pick a body.  ``brotli`` is in
+requirements.txt; without it only gzip is offered, which every browser reads.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import posixpath
+
+try:
+    import brotli
+except ImportError:     # installed from requirements.txt; gzip alone still serves every browser
+    brotli = None
+
+# Encodings in order of preference
+ENCODINGS = ("br", "gzip") if brotli else ("gzip",)
+# Compressed bodies that do not save at least this much are not kept
+MIN_SAVING = 0.1
+
+
+class Asset:
+    """One static file: its fingerprinted name, type and a body per content encoding"""
+
+    def __init__(self, name, data):
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        stem, ext = posixpath.splitext(name)
+        self.name = name
+        self.url_name = f"{stem}.{digest}{ext}"
+        self.digest = digest
+        self.mimetype = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        self.bodies = {"identity": data}
+        for encoding in ENCODINGS:
+            body = brotli.compress(data) if encoding == "br" else gzip.compress(data, 9, mtime=0)
+            if len(body) <= len(data) * (1 - MIN_SAVING):
+                self.bodies[encoding] = body
+
+    def etag(self, encoding):
+        """Strong ETag of the body in ``encoding``; each representation gets its own"""
+        return self.digest if encoding == "identity" else f"{self.digest}-{encoding}"
+
+    def negotiate(self, accept_encodings):
+        """The best stored encoding allowed by an ``Accept-Encoding`` header"""
+        for encoding in ENCODINGS:
+            if encoding in self.bodies and accept_encodings[encoding]:
+                return encoding
+        return "identity"
+
+
+class AssetManifest:
+    """The assets under ``folder``, looked up by source name or by fingerprinted name"""
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.assets = {}
+        self.by_url = {}
+        for root, _dirs, files in os.walk(folder):
+            for filename in files:
+                path = os.path.join(root, filename)
+                name = os.path.relpath(path, folder).replace(os.sep, "/")
+                with open(path, "rb") as f:
+                    asset = Asset(name, f.read())
+                self.assets[name] = asset
+                self.by_url[asset.url_name] = asset
+
+    def url_name(self, name):
+        """Fingerprinted name of the asset ``name``; KeyError for unknown files"""
+        return self.assets[name].url_name
+
+    def lookup(self, url_name):
+        """The asset served at ``url_name``, or None when that fingerprint is not current"""
+        return self.by_url.get(url_name)
@@ -0,0 +1,100 @@
+"""Time one pivot on an n×n tableau with each implementation.
+
+    python benchmarks/bench_pivot.py [--sizes 10 100 1000]
+
+``legacy`` is the original string-cell loop from the Flask view (parse every
+cell, do float math, format back with ``format_number``), ``python`` is
+``Tableau.pivot`` on float lists and ``numpy`` is ``kernels.pivot_inplace``.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from fractions import Fraction
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np
+
+from solver.kernels import pivot_inplace
+from solver.tableau import Tableau
+
+
+def legacy_format_number(num):
+    if num == int(num):
+        return str(int(num))
+    try:
+        frac = Fraction(num).limit_denominator(10)
+        if frac.denominator != 1:
+            return f"{frac.numerator}/{frac.denominator}"
+        else:
+            return str(frac.numerator)
+    except:
+        return f"{num:.2f}"
+
+
+def legacy_parse(value):
+    if isinstance(value, (int, float)):
+        return float(value)
+    if '/' in value:
+        numerator, denominator = value.split('/')
+        return float(numerator) / float(denominator)
+    return float(value)
+
+
+def legacy_pivot(tableau, pivot_row, pivot_col):
+    """Row elimination loop of the original perform_pivot_operations"""
+    pivot_value = legacy_parse(tableau[pivot_row][pivot_col])
+    working_tableau = [list(row) for row in tableau]
+    for j in range(1, len(working_tableau[0])):
+        working_tableau[pivot_row][j] = legacy_format_number(legacy_parse(working_tableau[pivot_row][j]) / pivot_value)
+    for i in range(len(working_tableau)):
+        if i != pivot_row:
+            pivot_other = legacy_parse(working_tableau[i][pivot_col])
+            for j in range(1, len(working_tableau[0])):
+                old_val = legacy_parse(working_tableau[i][j])
+                pivot_row_val = legacy_parse(working_tableau[pivot_row][j])
+                working_tableau[i][j] = legacy_format_number(old_val - pivot_row_val * pivot_other)
+    return working_tableau
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench(n, repeat):
+    rng = random.Random(n)
+    data = [[float(rng.randint(-9, 9)) for _ in range(n)] for _ in range(n)]
+    for i in range(n):
+        data[i][i] = float(rng.randint(1, 9))
+
+    strings = [["B"] + [str(int(v)) for v in row] for row in data]
+    legacy = timed(lambda: legacy_pivot(strings, 0, 1), repeat if n < 1000 else 1)
+    python = timed(lambda: Tableau([list(row) for row in data], list(range(n - 1)), [""] * n).pivot(0, 0), repeat)
+    array = np.array(data)
+    vectorised = timed(lambda: pivot_inplace(array.copy(), 0, 0), repeat)
+    return legacy, python, vectorised
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'size':>10} {'legacy':>12} {'python':>12} {'numpy':>12} {'speedup':>10}")
+    for n in args.sizes:
+        legacy, python, vectorised = bench(n, args.repeat)
+        print(f"{f'{n}x{n}':>10} {legacy * 1e3:>10.3f}ms {python * 1e3:>10.3f}ms "
+              f"{vectorised * 1e3:>10.3f}ms {legacy / vectorised:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
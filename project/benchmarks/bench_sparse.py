@@ -0,0 +1,66 @@
+"""Solve block-structured sparse LPs with dense and sparse tableau storage.
+
+    python benchmarks/bench_sparse.py [--blocks 20 60 150]
+
+Each problem has ``blocks`` independent blocks of 10 rows × 20 columns plus
+five linking rows, so under 2% of the constraint matrix is nonzero.  Both
+storages run the same pivots; the table shows time and peak memory.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from solver import Problem, solve
+
+
+def block_problem(blocks, rng, block_rows=10, block_cols=20):
+    n = blocks * block_cols
+    rows = []
+    for b in range(blocks):
+        for r in range(block_rows):
+            row = {b * block_cols + j: rng.randint(1, 9) for j in rng.sample(range(block_cols), 3)}
+            row.update({b * block_cols + (2 * r + q) % block_cols: 1 for q in range(2)})
+            rows.append(row)
+    for _ in range(5):
+        rows.append({j: 1 for j in rng.sample(range(n), 20)})
+    return Problem(
+        [rng.randint(1, 9) for _ in range(n)],
+        rows,
+        ["<="] * len(rows),
+        [rng.randint(50, 100) for _ in rows],
+    )
+
+
+def measure(problem, storage):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = solve(problem, numeric="float", storage=storage)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, result["iterations"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--blocks", type=int, nargs="+", default=[20, 60, 150])
+    args = parser.parse_args()
+
+    print(f"{'size':>12} {'pivots':>7} {'dense':>10} {'sparse':>10} {'dense mem':>10} {'sparse mem':>11}")
+    for blocks in args.blocks:
+        problem = block_problem(blocks, random.Random(blocks))
+        dense, dense_mem, pivots = measure(problem, "dense")
+        sparse, sparse_mem, _ = measure(problem, "sparse")
+        size = f"{len(problem.constraints)}x{problem.num_variables}"
+        print(f"{size:>12} {pivots:>7} {dense:>9.2f}s {sparse:>9.2f}s "
+              f"{dense_mem / 1e6:>8.1f}MB {sparse_mem / 1e6:>9.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
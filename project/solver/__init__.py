@@ -0,0 +1,47 @@
+"""Simplex solver core used by the web app.
+
+The package imports no web framework, and NumPy only loads when a
+``numeric="float64"`` tableau is requested, so batch jobs and worker
+processes can import it cheaply. Names listed in ``__all__`` are the
+supported API; submodules hold the building blocks.
+"""
+
+from .numeric import format_number
+from .parser import ParseError, parse_problem
+from .problem import Problem, ProblemError
+from .readers import FormatError, read_lp, read_model, read_mps
+from .revised import RevisedSimplex
+from .simplex import (
+    CANCELLED, INFEASIBLE, ITERATION_LIMIT, OPTIMAL, TIME_LIMIT, UNBOUNDED, Budget, run, run_dual, solve,
+)
+from .sparse import SparseTableau
+from .tableau import Tableau, slack_name
+from .warm import apply_delta, resolve
+
+__all__ = [
+    "Problem",
+    "ProblemError",
+    "ParseError",
+    "parse_problem",
+    "FormatError",
+    "read_model",
+    "read_mps",
+    "read_lp",
+    "Tableau",
+    "SparseTableau",
+    "RevisedSimplex",
+    "slack_name",
+    "format_number",
+    "run",
+    "run_dual",
+    "solve",
+    "Budget",
+    "apply_delta",
+    "resolve",
+    "OPTIMAL",
+    "UNBOUNDED",
+    "INFEASIBLE",
+    "ITERATION_LIMIT",
+    "TIME_LIMIT",
+    "CANCELLED",
+]
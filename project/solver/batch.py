@@ -0,0 +1,139 @@
+"""Solve many JSON problems across a process pool.
+
+Problems travel to the workers in chunks so thousands of tiny LPs do not pay
+one round-trip each; results come back in completion order, each tagged with
+the ``index`` of its problem in the input.
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, wait
+
+from .numeric import NUMERIC_TYPES
+from .parser import parse_problem
+from .problem import Problem, ProblemError
+from .readers import ModelFile
+from .simplex import request_options, solve
+
+CHUNK_SIZE = 64
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Shared process pool with one worker per CPU, created on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # multiprocessing is slow to import; only pay for it when a pool is needed
+            from concurrent.futures import ProcessPoolExecutor
+            _executor = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        return _executor
+
+
+def iter_ndjson(lines):
+    """Number the non-blank lines of an NDJSON stream; parsing happens in the workers"""
+    index = 0
+    for line in lines:
+        if line.strip():
+            yield index, line
+            index += 1
+
+
+def load_problem(data):
+    """Problem from its JSON form, or from text when ``objective`` is a string
+
+    ``{"objective": "max 3x + 2y", "constraints": ["x + y <= 4"]}`` goes
+    through the same parser as the web form.  A :class:`ModelFile` is read
+    here, so model files are parsed in the worker that solves them.
+    """
+    if isinstance(data, ModelFile):
+        return data.load()
+    if isinstance(data, dict) and isinstance(data.get("objective"), str):
+        constraints = data.get("constraints")
+        if not isinstance(constraints, list) or not all(isinstance(c, str) for c in constraints):
+            raise ProblemError("text constraints must be a list of strings")
+        return parse_problem(data["objective"], constraints, data.get("direction"))
+    return Problem.from_dict(data)
+
+
+def solve_item(index, data, numeric="fraction", **options):
+    """Solve one problem dict or JSON text; failures become an ``error`` result instead of raising
+
+    ``options`` are passed on to ``solve()``.  A ``numeric`` field or one of
+    the :data:`~solver.simplex.SOLVE_OPTIONS` in the problem overrides the
+    argument of the same name, except that ``max_iterations`` and
+    ``time_limit`` may only be lowered (see
+    :func:`~solver.simplex.request_options`).
+    """
+    try:
+        if isinstance(data, (str, bytes)):
+            data = json.loads(data)
+        trace = None
+        if isinstance(data, dict):
+            numeric = data.get("numeric", numeric)
+            options = request_options(data, options)
+            trace = data.get("trace")
+        elif not isinstance(data, ModelFile):
+            raise ProblemError(f"a problem must be a JSON object, got {type(data).__name__}")
+        if numeric not in NUMERIC_TYPES:
+            raise ProblemError(f"numeric must be one of {sorted(NUMERIC_TYPES)}")
+        result = solve(load_problem(data), numeric=numeric, trace=trace, **options)
+    except (ProblemError, OSError, ValueError, ZeroDivisionError) as e:
+        return error_result(index, str(e))
+    except Exception as e:
+        # Anything else is still this item's failure, not the batch's
+        return error_result(index, f"{type(e).__name__}: {e}")
+    result["index"] = index
+    return result
+
+
+def error_result(index, message):
+    return {"index": index, "status": "error", "error": message}
+
+
+def solve_chunk(chunk, numeric="fraction", options=None):
+    return [solve_item(index, data, numeric, **(options or {})) for index, data in chunk]
+
+
+def solve_many(items, executor=None, chunk_size=CHUNK_SIZE, numeric="fraction", **options):
+    """Yield results for ``(index, problem_dict)`` pairs in completion order
+
+    ``items`` may be a lazy iterator (e.g. lines of a request body); at most
+    a few chunks per worker are queued ahead of the results being consumed.
+    """
+    if executor is None:
+        executor = get_executor()
+    max_pending = 2 * (getattr(executor, "_max_workers", None) or os.cpu_count() or 1)
+    pending = {}        # future -> indices of its chunk
+    chunk = []
+
+    def submit(chunk):
+        pending[executor.submit(solve_chunk, chunk, numeric, options)] = [index for index, _ in chunk]
+
+    def collect(done):
+        for future in done:
+            indices = pending.pop(future)
+            try:
+                results = future.result()
+            except Exception as e:
+                # The chunk never came back (e.g. a worker died): report each of its items
+                results = [error_result(index, f"{type(e).__name__}: {e}") for index in indices]
+            yield from results
+
+    for item in items:
+        chunk.append(item)
+        if len(chunk) < chunk_size:
+            continue
+        submit(chunk)
+        chunk = []
+        if len(pending) >= max_pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            yield from collect(done)
+    if chunk:
+        submit(chunk)
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        yield from collect(done)
@@ -0,0 +1,232 @@
+"""Result cache keyed on a canonical form of the problem.
+
+Two problems that differ only in variable or constraint order share one
+cache entry; with exact fractions, so do problems that differ by a positive
+scaling of a constraint row.  The cache
+is bounded (LRU), entries can expire (TTL), and concurrent requests for a
+key that is still being solved wait for that solve instead of repeating it.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from .numeric import to_number
+from .problem import Problem
+from .simplex import CANCELLED, TIME_LIMIT, check_options, solve
+from .tableau import artificial_name, slack_name
+
+
+class ResultCache:
+    """Bounded LRU cache with optional TTL, hit/miss counters and in-flight coalescing"""
+
+    def __init__(self, maxsize=1024, ttl=None, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self._entries = OrderedDict()   # key -> (expires_at, value)
+        self._pending = {}              # key -> Future of the solve in progress
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, key, default=None):
+        """Return the live value for ``key`` without computing it"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= self.clock():
+                del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def discard(self, key):
+        """Drop ``key`` if it is cached"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def put(self, key, value):
+        with self._lock:
+            self._store(key, value)
+
+    def _store(self, key, value):
+        expires_at = None if self.ttl is None else self.clock() + self.ttl
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for ``key``, computing it at most once at a time"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > self.clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            future = self._pending.get(key)
+            if future is not None:
+                self.coalesced += 1
+                owner = False
+            else:
+                self.misses += 1
+                future = self._pending[key] = Future()
+                owner = True
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = compute()
+        except BaseException as e:
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._pending[key]
+            self._store(key, value)
+        future.set_result(value)
+        return value
+
+
+def primitive_row(values):
+    """Scale exact rationals by a positive factor to coprime integers"""
+    denominators = 1
+    for v in values:
+        denominators = denominators * v.denominator // math.gcd(denominators, v.denominator)
+    ints = [int(v * denominators) for v in values]
+    divisor = 0
+    for v in ints:
+        divisor = math.gcd(divisor, v)
+    if divisor > 1:
+        ints = [v // divisor for v in ints]
+    return tuple(ints)
+
+
+def canonicalize(problem, numeric="fraction"):
+    """Return (key, canonical problem, variable order, row order)
+
+    Variables are ordered by name and the rows are sorted.  In ``"fraction"``
+    mode every constraint row (with its RHS) is also scaled to coprime
+    integers, which changes nothing in exact arithmetic.  Float rows keep
+    their values: rescaling them would round differently, or overflow, and
+    could change the answer.  ``variable_order[k]`` and ``row_order[k]`` give
+    the original position of canonical column and row ``k``.
+    """
+    variable_order = sorted(range(len(problem.variables)), key=lambda j: problem.variables[j])
+    rows = []
+    for i, (sense, b) in enumerate(zip(problem.senses, problem.rhs)):
+        row = problem.dense_row(i)
+        values = [to_number(row[j], numeric) for j in variable_order] + [to_number(b, numeric)]
+        rows.append((sense, primitive_row(values) if numeric == "fraction" else tuple(values), i))
+    rows.sort()
+    row_order = [i for _, _, i in rows]
+
+    variables = tuple(problem.variables[j] for j in variable_order)
+    objective = tuple(to_number(problem.objective[j], numeric) for j in variable_order)
+    constraints = tuple((sense, values) for sense, values, _ in rows)
+    key = (problem.direction, variables, objective, constraints)
+    canonical = Problem(
+        objective,
+        [values[:-1] for _, values in constraints],
+        [sense for sense, _ in constraints],
+        [values[-1] for _, values in constraints],
+        direction=problem.direction,
+        variables=variables,
+    )
+    return key, canonical, variable_order, row_order
+
+
+def solve_cached(problem, cache, numeric="fraction", **options):
+    """``solve(problem)`` through ``cache``, mapping the shared result back to this problem's order
+
+    ``options`` are passed on to ``solve()`` and are part of the cache key.
+    A solve cut short by its time limit is returned but not kept, since
+    the next attempt may get further.
+    """
+    check_options(**options)
+    key, canonical, variable_order, row_order = canonicalize(problem, numeric)
+    key = (numeric, tuple(sorted(options.items()))) + key
+    result = cache.get_or_compute(key, lambda: solve(canonical, numeric=numeric, **options))
+    if result["status"] in (TIME_LIMIT, CANCELLED):
+        cache.discard(key)
+
+    renamed = {slack_name(k): slack_name(i) for k, i in enumerate(row_order)}
+    renamed.update((artificial_name(k), artificial_name(i)) for k, i in enumerate(row_order))
+    result = dict(result)
+    result["basis"] = [renamed.get(name, name) for name in result["basis"]]
+    if result["x"] is not None:
+        x = [None] * len(variable_order)
+        for k, j in enumerate(variable_order):
+            x[j] = result["x"][k]
+        result["x"] = x
+    if "sensitivity" in result:
+        result["sensitivity"] = restore_sensitivity(result["sensitivity"], problem, canonical,
+                                                    variable_order, row_order, numeric == "fraction")
+    return result
+
+
+def restore_sensitivity(report, problem, canonical, variable_order, row_order, scaled_rows=True):
+    """Map a sensitivity report of the canonical problem back to ``problem``
+
+    Canonical row ``k`` is original row ``row_order[k]`` times a positive
+    factor ``f`` (1 unless ``scaled_rows``), so its shadow price is
+    multiplied by ``f`` and its range divided by it on the way back.
+    """
+    reduced_costs = [None] * len(variable_order)
+    objective_ranges = [None] * len(variable_order)
+    for k, j in enumerate(variable_order):
+        reduced_costs[j] = report["reduced_costs"][k]
+        objective_ranges[j] = report["objective_ranges"][k]
+    shadow_prices = [None] * len(row_order)
+    rhs_ranges = [None] * len(row_order)
+    for k, i in enumerate(row_order):
+        factor = 1
+        if scaled_rows:
+            row = problem.dense_row(i)
+            values = [to_number(row[j]) for j in variable_order] + [to_number(problem.rhs[i])]
+            scaled = list(canonical.dense_row(k)) + [canonical.rhs[k]]
+            factor = next((a / v for a, v in zip(scaled, values) if v != 0), 1)
+        shadow_prices[i] = report["shadow_prices"][k] * factor
+        rhs_ranges[i] = [None if b is None else b / factor for b in report["rhs_ranges"][k]]
+    return {
+        "shadow_prices": shadow_prices,
+        "reduced_costs": reduced_costs,
+        "rhs_ranges": rhs_ranges,
+        "objective_ranges": objective_ranges,
+    }
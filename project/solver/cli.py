@@ -0,0 +1,172 @@
+"""Command-line batch solver: ``python -m solver [FILE ...]``
+
+Reads problems from files or stdin and writes one result line per problem
+to stdout as soon as it is solved. Three input formats are understood:
+
+``text``
+    One problem per block of lines, blocks separated by blank lines. The
+    first line is the objective (``max 3x + 2y``), the others are
+    constraints in the web form's syntax (``2x + 3y <= 8``). Lines starting
+    with ``#`` and nonnegativity lines such as ``x, y >= 0`` are skipped.
+``json``
+    A single problem object or a list of them, in the ``/api/solve`` form.
+``ndjson``
+    One problem object per line, as posted to ``/api/solve/batch``.
+``mps``, ``fixed-mps``, ``lp``
+    One model per file, read by :mod:`solver.readers`.  Files are read by
+    the worker that solves them, and not from stdin.
+
+With ``--format auto`` (the default) files are told apart by extension
+(``.json``, ``.ndjson``/``.jsonl``, ``.mps``, ``.lp``, optionally ``.gz``,
+anything else is text); stdin is JSON if it starts with ``[``, NDJSON if it
+starts with ``{`` and text otherwise.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import re
+import sys
+
+from .batch import CHUNK_SIZE, solve_item, solve_many
+from .numeric import NUMERIC_TYPES, format_number, json_default
+from .pricing import PRICING_RULES
+from .readers import ModelFile, model_format
+from .simplex import METHODS, STORAGES
+
+FORMATS = ("auto", "text", "json", "ndjson", "mps", "fixed-mps", "lp")
+MODEL_FORMATS = ("mps", "fixed-mps", "lp")
+EXTENSIONS = {".json": "json", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+NONNEGATIVITY = re.compile(r"^\s*[^\W\d]\w*(\s*,\s*[^\W\d]\w*)*\s*(>=|≥)\s*0\s*$")
+
+
+def iter_text(lines):
+    """Problem dicts from blank-line separated blocks of objective and constraint lines"""
+    block = []
+    for line in itertools.chain(lines, [""]):
+        line = line.strip()
+        if line.startswith("#") or NONNEGATIVITY.match(line):
+            continue
+        if line:
+            block.append(line)
+        elif block:
+            yield {"objective": block[0], "constraints": block[1:]}
+            block = []
+
+
+def iter_json(lines):
+    data = json.loads("".join(lines))
+    yield from data if isinstance(data, list) else [data]
+
+
+def iter_ndjson(lines):
+    return (line for line in lines if line.strip())
+
+
+READERS = {"text": iter_text, "json": iter_json, "ndjson": iter_ndjson}
+
+
+def sniff(stream):
+    """Guess the format of a stream from its first non-blank character"""
+    first = ""
+    buffered = []
+    for line in stream:
+        buffered.append(line)
+        if line.strip():
+            first = line.lstrip()[0]
+            break
+    fmt = {"[": "json", "{": "ndjson"}.get(first, "text")
+    return fmt, itertools.chain(buffered, stream)
+
+
+def read_problems(paths, fmt="auto"):
+    """Yield problems (dicts or JSON lines) from each path in turn; ``-`` is stdin"""
+    for path in paths:
+        if path == "-":
+            if fmt in MODEL_FORMATS:
+                raise ValueError(f"{fmt} models are read from files, not stdin")
+            path_fmt, lines = sniff(sys.stdin) if fmt == "auto" else (fmt, sys.stdin)
+            yield from READERS[path_fmt](lines)
+            continue
+        path_fmt = fmt
+        if fmt == "auto":
+            path_fmt = model_format(path) or EXTENSIONS.get(os.path.splitext(path)[1].lower(), "text")
+        if path_fmt in MODEL_FORMATS:
+            yield ModelFile(path, path_fmt)
+            continue
+        with open(path, encoding="utf-8") as f:
+            yield from READERS[path_fmt](f)
+
+
+def format_value(value):
+    """Exact fractions as ``p/q``; floats in full, as the shortest text that reads back the same"""
+    if isinstance(value, float):
+        return repr(float(value))
+    return format_number(value)
+
+
+def format_text(result):
+    """``index<TAB>status<TAB>objective<TAB>x``, values as exact as the numeric mode"""
+    if result["status"] == "error":
+        return f"{result['index']}\terror\t{result['error']}"
+    x = result.get("x")
+    values = " ".join(format_value(v) for v in x) if x is not None else "-"
+    objective = format_value(result["objective"]) if result.get("objective") is not None else "-"
+    return f"{result['index']}\t{result['status']}\t{objective}\t{values}"
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m solver", description="Solve linear programs in batch.")
+    parser.add_argument("paths", nargs="*", default=["-"], metavar="FILE", help="input files; '-' or none reads stdin")
+    parser.add_argument("-f", "--format", choices=FORMATS, default="auto", help="input format (default: auto)")
+    parser.add_argument("-o", "--output", choices=("json", "text"), default="json", help="one JSON object or one tab-separated line per result")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="worker processes; 0 means one per CPU (default: 1, no pool)")
+    parser.add_argument("--numeric", choices=sorted(NUMERIC_TYPES), default="fraction", help="arithmetic for problems that do not set it")
+    parser.add_argument("--method", choices=METHODS, default="tableau", help="simplex variant for problems that do not set it")
+    parser.add_argument("--pricing", choices=tuple(PRICING_RULES), default="dantzig", help="entering-column rule for problems that do not set it")
+    parser.add_argument("--storage", choices=STORAGES, default="auto", help="tableau storage for problems that do not set it")
+    parser.add_argument("--max-iterations", type=int, help="stop each solve after this many pivots")
+    parser.add_argument("--time-limit", type=float, metavar="SECONDS", help="stop each solve after this much pivoting time")
+    parser.add_argument("--sensitivity", action="store_true", help="add shadow prices, reduced costs and ranges to JSON results")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="problems sent to a worker at a time")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    items = enumerate(read_problems(args.paths, args.format))
+    options = {"method": args.method, "storage": args.storage, "pricing": args.pricing,
+               "max_iterations": args.max_iterations, "time_limit": args.time_limit,
+               "sensitivity": args.sensitivity}
+
+    executor = None
+    if args.jobs == 1:
+        results = (solve_item(index, data, args.numeric, **options) for index, data in items)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=args.jobs or os.cpu_count() or 1)
+        results = solve_many(items, executor, args.chunk_size, numeric=args.numeric, **options)
+
+    if args.output == "json":
+        dump = lambda result: json.dumps(result, default=json_default, ensure_ascii=False)
+    else:
+        dump = format_text
+
+    failed = False
+    out = sys.stdout
+    try:
+        for result in results:
+            failed = failed or result["status"] == "error"
+            out.write(dump(result) + "\n")
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into head); stop quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), out.fileno())
+        return 0
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    return 1 if failed else 0
@@ -0,0 +1,98 @@
+"""Vectorised pivot kernel on a contiguous float64 array.
+
+This module needs NumPy and is only imported when a solve asks for the
+``"float64"`` numeric mode.
+"""
+
+import numpy as np
+
+from .tableau import Tableau
+
+
+def pivot_inplace(a, row, col):
+    """Pivot the 2-D float64 array ``a`` on (row, col) in place
+
+    The pivot row is normalised, then every other row gets a rank-1 update
+    ``a -= f ⊗ a[row]`` where ``f`` is the pivot column with the pivot row
+    zeroed out.
+    """
+    a[row] /= a[row, col]
+    factors = a[:, col].copy()
+    factors[row] = 0.0
+    a -= np.outer(factors, a[row])
+    return a
+
+
+class ArrayTableau(Tableau):
+    """Tableau whose rows live in one C-contiguous float64 array"""
+
+    @classmethod
+    def from_rows(cls, rows, basis, columns):
+        return cls(np.ascontiguousarray(rows, dtype=np.float64), basis, columns)
+
+    def is_optimal(self):
+        return not (self.rows[-1, :-1] < -self.tolerance).any()
+
+    def entering(self):
+        return int(np.argmin(self.rows[-1, :-1]))
+
+    def basic_values(self):
+        return self.rows[:-1, -1].tolist()
+
+    def reduced_costs(self):
+        return self.row_entries(-1)
+
+    def row_entries(self, row):
+        values = self.rows[row, :-1]
+        nonzero = np.flatnonzero(values)
+        return dict(zip(nonzero.tolist(), values[nonzero].tolist()))
+
+    def column_entries(self, col):
+        values = self.rows[:-1, col]
+        nonzero = np.flatnonzero(values)
+        return dict(zip(nonzero.tolist(), values[nonzero].tolist()))
+
+    def column_dots(self, col, cols):
+        cols = list(cols)
+        block = self.rows[:-1, :-1]
+        return dict(zip(cols, (block[:, cols].T @ block[:, col]).tolist()))
+
+    def ratios(self, col):
+        a = self.rows[:-1, col]
+        rhs = self.rows[:-1, -1]
+        positive = a > self.tolerance
+        ratios = np.divide(rhs, a, out=np.zeros_like(rhs), where=positive)
+        return [float(r) if p else None for r, p in zip(ratios, positive)]
+
+    def pivot(self, row, col):
+        """Pivot on (row, col) in place and move the pivot row to the top"""
+        a = pivot_inplace(self.rows, row, col)
+        if row:
+            a[:row + 1] = np.roll(a[:row + 1], 1, axis=0)
+        self.basis.insert(0, col)
+        del self.basis[row + 1]
+        return self
+
+    def set_objective(self, costs):
+        z = np.array([costs[j] for j in self.basis], dtype=np.float64) @ self.rows[:-1]
+        z[:-1] -= np.asarray(costs, dtype=np.float64)
+        self.rows[-1] = z
+
+    def drop_columns(self, cols):
+        keep = [j for j in range(len(self.columns)) if j not in cols]
+        index = {j: k for k, j in enumerate(keep)}
+        self.rows = np.ascontiguousarray(self.rows[:, keep + [-1]])
+        self.basis = [index[j] for j in self.basis]
+        self.columns = [self.columns[j] for j in keep]
+
+    def solution(self):
+        values = [0.0] * (self.rows.shape[1] - 1)
+        for i, j in enumerate(self.basis):
+            values[j] = float(self.rows[i, -1])
+        return values
+
+    def copy(self):
+        other = ArrayTableau(self.rows.copy(), list(self.basis), list(self.columns))
+        other.tolerance = self.tolerance
+        other.phase_one = self.phase_one
+        return other
@@ -0,0 +1,86 @@
+"""Number types used inside the tableau and their display form.
+
+Tableau cells stay numeric for the whole solve: exact ``Fraction`` values by
+default, ``float`` when speed matters more than exactness, or ``float64``
+for large problems, which keeps the tableau in a NumPy array.  Conversion to
+strings happens only when a tableau is rendered.
+"""
+
+from fractions import Fraction
+
+NUMERIC_TYPES = {
+    "fraction": Fraction,
+    "float": float,
+    "float64": float,  # stored in a NumPy array by kernels.ArrayTableau
+}
+
+# Largest decimal exponent accepted in a number string, as in '1e+308'
+MAX_EXPONENT = 308
+
+
+def number_type(numeric):
+    """Return the Python type used for the ``numeric`` mode"""
+    try:
+        return NUMERIC_TYPES[numeric]
+    except KeyError:
+        raise ValueError(f"unknown numeric mode {numeric!r}, expected one of {sorted(NUMERIC_TYPES)}") from None
+
+
+def parse_fraction(text):
+    """Exact value of a string such as '4/5', '1.5' or '2e-3'; ValueError for anything else
+
+    Exponents beyond ±:data:`MAX_EXPONENT` are refused before Fraction
+    expands them into a huge integer.
+    """
+    text = text.strip()
+    _, _, exponent = text.lower().partition("e")
+    digits = exponent.lstrip("+-").lstrip("0")
+    if len(digits) > len(str(MAX_EXPONENT)) or digits.isdigit() and int(digits) > MAX_EXPONENT:
+        raise ValueError(f"exponent of {text[:20]!r} is beyond ±{MAX_EXPONENT}")
+    try:
+        return Fraction(text)
+    except ValueError:
+        raise ValueError(f"{text[:20]!r} is not a number or has too many digits") from None
+
+
+def to_number(value, numeric="fraction"):
+    """Convert an int, float, Fraction or string such as '4/5' or '1.5'"""
+    kind = number_type(numeric)
+    if isinstance(value, str):
+        value = parse_fraction(value)
+    elif isinstance(value, float) and kind is Fraction:
+        # Go through repr so 0.1 becomes 1/10 rather than its binary expansion
+        value = Fraction(repr(value))
+    return kind(value)
+
+
+def format_number(num):
+    """Display form of a tableau value: exact fractions as ``p/q``, floats as decimals
+
+    Whole values print without a decimal point.  Floats keep 12 significant
+    digits, enough to show every digit the user typed while hiding the
+    rounding noise that pivoting adds in the last few bits.
+    """
+    if isinstance(num, Fraction):
+        if num.denominator == 1:
+            return str(num.numerator)
+        return f"{num.numerator}/{num.denominator}"
+
+    if isinstance(num, int) or abs(num) < 1e15 and num == int(num):
+        return str(int(num))
+    return f"{float(num):.12g}"
+
+
+def json_default(value):
+    """``default`` hook for json encoders: Fractions become ints or floats
+
+    A fraction too large for a float is sent as its ``p/q`` string.
+    """
+    if isinstance(value, Fraction):
+        if value.denominator == 1:
+            return value.numerator
+        try:
+            return float(value)
+        except OverflowError:
+            return format_number(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,223 @@
+"""Single-pass parser for linear expressions and constraints.
+
+One compiled token pattern is matched at increasing offsets, so each input
+character is looked at once and nothing backtracks across tokens.  Accepted
+syntax::
+
+    3x + 2.5y - 1/2 z <= 10      # decimals and fractions as coefficients
+    2*x1 + x2 - x1 >= -4         # '*' is optional, repeated terms are summed
+    profit_a + profit_b = 7      # any identifier is a variable
+    x + 3 <= 2y                  # terms may appear on either side
+    1.5e3 a + 2*e1 <= 1e-2       # scientific notation; 2*e1 is 2 times e1
+
+A number written right before a name that starts with ``e`` would read as
+an exponent, so that is an error: write ``2*e1`` or ``2 e1``.  Exponents are
+limited to ±:data:`~solver.numeric.MAX_EXPONENT`, so no number in a short
+input can take long to convert.
+
+Coefficient rows come out sparse, as ``{variable: Fraction}`` dictionaries.
+"""
+
+import re
+from fractions import Fraction
+
+from .numeric import parse_fraction
+from .problem import Problem, ProblemError
+
+TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<number>(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)
+      | (?P<name>[^\W\d]\w*)
+      | (?P<relation><=|>=|=<|=>|==|=|≤|≥|<|>)
+      | (?P<op>[-+*/−])
+    )""", re.VERBOSE)
+
+RELATIONS = {
+    "<=": "<=", "=<": "<=", "≤": "<=", "<": "<=",
+    ">=": ">=", "=>": ">=", "≥": ">=", ">": ">=",
+    "=": "=", "==": "=",
+}
+
+
+class ParseError(ProblemError):
+    """Raised for text that is not a linear expression or constraint"""
+
+
+def tokenize(text, pattern=TOKEN):
+    """Yield (kind, value, offset) tokens; raises ParseError on anything else
+
+    ``pattern`` must define the same groups as :data:`TOKEN`; file readers
+    pass their own to allow the wider names of their formats.
+    """
+    pos = 0
+    end = len(text)
+    match = pattern.match
+    while pos < end:
+        m = match(text, pos)
+        if m is None:
+            rest = text[pos:]
+            if rest.strip() == "":
+                return
+            offset = pos + len(rest) - len(rest.lstrip())
+            raise ParseError(f"unexpected {text[offset]!r} at position {offset + 1} in {text!r}")
+        kind = m.lastgroup
+        value = m.group(kind)
+        if kind == "op" and value == "−":
+            value = "-"
+        yield kind, value, m.start(kind)
+        pos = m.end()
+
+
+def parse_number(value, offset, text):
+    """Exact value of a number token; raises ParseError for an out-of-range one"""
+    try:
+        return parse_fraction(value)
+    except ValueError as e:
+        raise ParseError(f"{e} at position {offset + 1} in {text!r}") from None
+
+
+def parse_linear(text, pattern=TOKEN):
+    """Parse ``expr [relation expr]`` into (coefficients, relation, constant)
+
+    All variable terms are moved to the left and all constants to the right,
+    so ``x + 3 <= 2y`` gives ``({'x': 1, 'y': -2}, '<=', -3)``.  Without a
+    relation the expression is compared with 0, so ``x + 3`` gives
+    ``({'x': 1}, None, -3)``.
+    """
+    coefficients = {}
+    constant = Fraction(0)
+    relation = None
+    side = 1            # +1 left of the relation, -1 right of it
+    sign = 1
+    coefficient = None  # pending numeric factor of the current term
+    divide = False      # pending '/' inside a coefficient
+    expect_term = True
+    number_end = None   # where the last number token ended
+
+    def finish(name=None):
+        nonlocal constant, coefficient, sign, expect_term
+        value = sign * side * (Fraction(1) if coefficient is None else coefficient)
+        if name is None:
+            constant -= value
+        else:
+            coefficients[name] = coefficients.get(name, 0) + value
+        coefficient = None
+        sign = 1
+        expect_term = False
+
+    for kind, value, offset in tokenize(text, pattern):
+        if kind == "number":
+            number = parse_number(value, offset, text)
+            number_end = offset + len(value)
+            if divide:
+                if number == 0:
+                    raise ParseError(f"division by zero at position {offset + 1} in {text!r}")
+                coefficient /= number
+                divide = False
+            elif coefficient is None and expect_term:
+                coefficient = number
+            else:
+                raise ParseError(f"unexpected number {value!r} at position {offset + 1} in {text!r}")
+        elif kind == "name":
+            if divide or not expect_term:
+                raise ParseError(f"unexpected {value!r} at position {offset + 1} in {text!r}")
+            if offset == number_end and value[0] in "eE":
+                raise ParseError(f"write '*' or a space before {value!r} at position {offset + 1} "
+                                 f"in {text!r}, or it reads as an exponent")
+            finish(value)
+        elif kind == "op" and value in "+-":
+            if divide:
+                raise ParseError(f"incomplete fraction at position {offset + 1} in {text!r}")
+            if coefficient is not None:
+                finish()
+            if expect_term:
+                # Unary sign, possibly right after a binary one: "x + -3y"
+                if value == "-":
+                    sign = -sign
+            else:
+                sign = -1 if value == "-" else 1
+                expect_term = True
+        elif kind == "op" and value == "/":
+            if coefficient is None or divide:
+                raise ParseError(f"unexpected '/' at position {offset + 1} in {text!r}")
+            divide = True
+        elif kind == "op":  # '*' between a coefficient and its variable
+            if coefficient is None or divide:
+                raise ParseError(f"unexpected '*' at position {offset + 1} in {text!r}")
+        else:
+            if relation is not None:
+                raise ParseError(f"more than one relation in {text!r}")
+            if coefficient is not None:
+                finish()
+            elif expect_term:
+                raise ParseError(f"missing term before {value!r} in {text!r}")
+            relation = RELATIONS[value]
+            side = -1
+            sign = 1
+            expect_term = True
+
+    if divide:
+        raise ParseError(f"incomplete fraction at the end of {text!r}")
+    if coefficient is not None:
+        finish()
+    elif expect_term:
+        raise ParseError(f"expression ends without a term: {text!r}")
+    return {name: a for name, a in coefficients.items() if a != 0}, relation, constant
+
+
+def parse_constraint(text):
+    """Parse a constraint into (coefficients, sense, rhs)"""
+    coefficients, relation, rhs = parse_linear(text)
+    if relation is None:
+        raise ParseError(f"constraint has no <=, >= or =: {text!r}")
+    return coefficients, relation, rhs
+
+
+OBJECTIVE_PREFIX = re.compile(r"\s*(?:(max|min)(?:imi[sz]e)?\b\s*:?)?\s*(?:[^\W\d]\w*\s*=(?![=<>]))?", re.IGNORECASE)
+
+
+def split_objective(text):
+    """Split ``min Z = 2a + b`` into ('min', '2a + b'); direction is None when not given"""
+    m = OBJECTIVE_PREFIX.match(text)
+    return (m.group(1).lower() if m.group(1) else None), text[m.end():]
+
+
+def parse_objective(text):
+    """Parse an objective such as ``120x + 100y``, ``Z = 3x + 2y`` or ``min 2a + b``
+
+    Returns (coefficients, direction), with direction None when not given.
+    A constant term is ignored.
+    """
+    direction, body = split_objective(text)
+    coefficients, relation, _ = parse_linear(body)
+    if relation is not None:
+        raise ParseError(f"objective must not contain a relation: {text!r}")
+    return coefficients, direction
+
+
+def natural_key(name):
+    """Sort x2 before x10"""
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name)]
+
+
+def parse_problem(objective, constraints, direction=None):
+    """Build a sparse :class:`Problem` from objective and constraint text
+
+    Variables are ordered by name (x2 before x10), which keeps the column
+    order independent of how the terms were written.
+    """
+    costs, parsed_direction = parse_objective(objective)
+    rows = [parse_constraint(c) for c in constraints]
+    names = set(costs)
+    for coefficients, _, _ in rows:
+        names.update(coefficients)
+    variables = sorted(names, key=natural_key)
+    index = {name: j for j, name in enumerate(variables)}
+    return Problem(
+        [costs.get(name, Fraction(0)) for name in variables],
+        [{index[name]: a for name, a in coefficients.items()} for coefficients, _, _ in rows],
+        [sense for _, sense, _ in rows],
+        [rhs for _, _, rhs in rows],
+        direction=direction or parsed_direction or "max",
+        variables=variables,
+    )
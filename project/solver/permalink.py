@@ -0,0 +1,67 @@
+"""Compact, canonical codes for problems, used in shareable ``/p/<code>`` URLs.
+
+A code is the problem written out as text, terms in variable order and
+without spaces, objective and constraints joined by ``;``, then base64url
+encoded without padding::
+
+    max:3x+5y;x+2y<=6;3x+2y<=12   ->   bWF4OjN4KzV5O3grMnk8PTY7M3grMnk8PTEy
+
+Every problem parsed from text has exactly one code, however its terms were
+spaced, ordered or repeated, so equal problems share one URL and one HTTP
+cache entry.  :func:`decode_problem` accepts any code that parses;
+:func:`encode_problem` of its result is the canonical one.
+"""
+
+import base64
+import binascii
+
+from .parser import parse_problem
+from .problem import ProblemError
+
+
+class PermalinkError(ProblemError):
+    """Raised for a code that is not base64url text of a problem"""
+
+
+def format_linear(terms):
+    """``3x + 5/2y - z`` from (coefficient, name) pairs; zero terms are left out"""
+    text = ""
+    for a, name in terms:
+        if a == 0:
+            continue
+        sign = "-" if a < 0 else "+"
+        a = abs(a)
+        # "2*e1", since "2e1" would read back as 20
+        term = name if a == 1 else f"{a}*{name}" if name[0] in "eE" else f"{a}{name}"
+        text = (f"-{term}" if sign == "-" else term) if not text else f"{text} {sign} {term}"
+    return text or "0"
+
+
+def problem_text(problem):
+    """``(objective, constraints)`` text that :func:`~solver.parser.parse_problem` reads back as ``problem``"""
+    names = problem.variables
+    objective = f"{problem.direction}: " + format_linear(zip(problem.objective, names))
+    constraints = [
+        f"{format_linear((a, names[j]) for j, a in sorted(problem.row_items(i)))} {sense} {rhs}"
+        for i, (sense, rhs) in enumerate(zip(problem.senses, problem.rhs))
+    ]
+    return objective, constraints
+
+
+def encode_problem(problem):
+    """The canonical code of ``problem``"""
+    objective, constraints = problem_text(problem)
+    text = ";".join([objective] + constraints).replace(" ", "")
+    return base64.urlsafe_b64encode(text.encode()).decode().rstrip("=")
+
+
+def decode_problem(code):
+    """The problem written in ``code``; raises PermalinkError or ProblemError"""
+    try:
+        text = base64.urlsafe_b64decode(code + "=" * (-len(code) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise PermalinkError(f"{code!r} is not a problem code") from None
+    objective, *constraints = text.split(";")
+    if not constraints:
+        raise PermalinkError("a problem code needs at least one constraint")
+    return parse_problem(objective, constraints)
@@ -0,0 +1,156 @@
+"""Structured linear programs, independent of how they were entered."""
+
+import math
+from fractions import Fraction
+
+from .numeric import parse_fraction
+
+SENSES = ("<=", ">=", "=")
+DIRECTIONS = ("max", "min")
+
+
+class ProblemError(ValueError):
+    """Raised when a problem description is malformed or unsupported"""
+
+
+def _as_list(value, what):
+    """``value`` as a list; raises ProblemError unless it is a list or tuple"""
+    if not isinstance(value, (list, tuple)):
+        raise ProblemError(f"{what} must be a list, got {type(value).__name__}")
+    return list(value)
+
+
+class Problem:
+    """Optimise ``c·x`` subject to ``A x (<=, >=, =) b`` and ``x >= 0``
+
+    Each constraint row is either a dense list with one coefficient per
+    variable or a sparse ``{column index: coefficient}`` dictionary.
+    """
+
+    def __init__(self, objective, constraints, senses, rhs, direction="max", variables=None):
+        self.objective = _as_list(objective, "objective")
+        self.constraints = [
+            dict(row) if isinstance(row, dict) else _as_list(row, f"constraint {i + 1}")
+            for i, row in enumerate(_as_list(constraints, "constraints"))
+        ]
+        self.senses = _as_list(senses, "senses")
+        self.rhs = _as_list(rhs, "rhs")
+        self.direction = direction
+        if variables is None:
+            variables = [f"x{j + 1}" for j in range(len(self.objective))]
+        self.variables = _as_list(variables, "variables")
+        self.validate()
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a problem from the JSON form used by ``/api/solve``
+
+        ``{"objective": [3, 5], "direction": "max", "constraints": [[1, 2], [3, 2]],
+        "senses": ["<=", "<="], "rhs": [6, 12], "variables": ["x", "y"]}``;
+        ``senses`` defaults to all ``<=`` and ``direction`` to ``max``.  A
+        constraint may also be a sparse object keyed by variable name, e.g.
+        ``{"x": 3, "y": 2}``, in which case ``variables`` is required.
+        """
+        if not isinstance(data, dict):
+            raise ProblemError("problem must be a JSON object")
+        try:
+            objective = data["objective"]
+            constraints = data["constraints"]
+            rhs = data["rhs"]
+        except KeyError as e:
+            raise ProblemError(f"missing field {e.args[0]!r}") from None
+        constraints = _as_list(constraints, "constraints")
+        senses = data.get("senses") or ["<="] * len(constraints)
+        variables = data.get("variables")
+        if any(isinstance(row, dict) for row in constraints):
+            if not isinstance(variables, list):
+                raise ProblemError("sparse constraints need a 'variables' list")
+            index = {name: j for j, name in enumerate(variables)}
+            try:
+                constraints = [
+                    {index[name]: a for name, a in row.items()} if isinstance(row, dict) else row
+                    for row in constraints
+                ]
+            except KeyError as e:
+                raise ProblemError(f"unknown variable {e.args[0]!r} in constraints") from None
+        return cls(
+            objective,
+            constraints,
+            senses,
+            rhs,
+            direction=data.get("direction", "max"),
+            variables=variables,
+        )
+
+    @property
+    def num_variables(self):
+        return len(self.objective)
+
+    def dense_row(self, i):
+        """Coefficients of constraint ``i`` as a list, whatever its storage"""
+        row = self.constraints[i]
+        if isinstance(row, dict):
+            dense = [0] * len(self.objective)
+            for j, a in row.items():
+                dense[j] = a
+            return dense
+        return row
+
+    def row_items(self, i):
+        """(column, coefficient) pairs of the nonzeros of constraint ``i``"""
+        row = self.constraints[i]
+        items = row.items() if isinstance(row, dict) else enumerate(row)
+        return [(j, a) for j, a in items if a != 0]
+
+    def key(self):
+        """Hashable form of the problem exactly as given (row order and scaling kept)"""
+        return (
+            self.direction,
+            tuple(self.variables),
+            tuple(self.objective),
+            tuple(tuple(self.row_items(i)) for i in range(len(self.constraints))),
+            tuple(self.senses),
+            tuple(self.rhs),
+        )
+
+    def to_dict(self):
+        return {
+            "objective": self.objective,
+            "direction": self.direction,
+            "constraints": [self.dense_row(i) for i in range(len(self.constraints))],
+            "senses": self.senses,
+            "rhs": self.rhs,
+            "variables": self.variables,
+        }
+
+    def validate(self):
+        n = len(self.objective)
+        if n == 0:
+            raise ProblemError("objective has no coefficients")
+        if self.direction not in DIRECTIONS:
+            raise ProblemError(f"direction must be one of {DIRECTIONS}, got {self.direction!r}")
+        if len(self.variables) != n:
+            raise ProblemError(f"{len(self.variables)} variable names for {n} objective coefficients")
+        if not all(isinstance(name, str) for name in self.variables):
+            raise ProblemError("variable names must be strings")
+        if not (len(self.constraints) == len(self.senses) == len(self.rhs)):
+            raise ProblemError("constraints, senses and rhs must have the same length")
+        for i, (row, sense) in enumerate(zip(self.constraints, self.senses)):
+            if isinstance(row, dict):
+                if any(not isinstance(j, int) or not 0 <= j < n for j in row):
+                    raise ProblemError(f"constraint {i + 1} refers to a column outside 0..{n - 1}")
+            elif len(row) != n:
+                raise ProblemError(f"constraint {i + 1} has {len(row)} coefficients, expected {n}")
+            if sense not in SENSES:
+                raise ProblemError(f"constraint {i + 1} has unknown sense {sense!r}")
+        coefficients = [a for i in range(len(self.constraints)) for _, a in self.row_items(i)]
+        for value in self.objective + self.rhs + coefficients:
+            if isinstance(value, bool) or not isinstance(value, (int, float, str, Fraction)):
+                raise ProblemError(f"coefficient {value!r} is not a number")
+            if isinstance(value, float) and not math.isfinite(value):
+                raise ProblemError(f"coefficient {value!r} is not finite")
+            if isinstance(value, str):
+                try:
+                    parse_fraction(value)
+                except ValueError as e:
+                    raise ProblemError(f"coefficient {e}") from None
@@ -0,0 +1,482 @@
+"""Streaming readers for MPS and CPLEX LP model files.
+
+Both readers take an iterable of lines (an open file works) and look at each
+line once, adding coefficients straight into sparse ``{column: coefficient}``
+rows, so memory grows with the number of nonzeros rather than with the size
+of the text.  The result is an ordinary :class:`Problem` for ``solve``.
+
+Only what :class:`Problem` can express is accepted: every variable must keep
+a lower bound of at least 0.  Other bounds become extra constraint rows, MPS
+``RANGES`` become a second row, and integrality (``MARKER`` lines,
+``General`` and ``Binary`` sections) is dropped, so the LP relaxation is
+what gets solved.  Binary variables keep their upper bound of 1.
+"""
+
+import functools
+import gzip
+import os
+import re
+from fractions import Fraction
+
+from .numeric import parse_fraction
+from .parser import ParseError, parse_linear
+from .problem import Problem, ProblemError
+
+INFINITY = float("inf")
+
+
+class FormatError(ProblemError):
+    """Raised for a model file that is malformed or uses unsupported features"""
+
+
+@functools.lru_cache(maxsize=4096)
+def read_number(text):
+    """Exact value of a numeric field; ``inf`` and ``infinity`` are allowed
+
+    Model files repeat the same few values many times, so parsed values
+    are cached; building a Fraction from text is the slowest step of a read.
+    """
+    word = text.lower().lstrip("+-")
+    if word in ("inf", "infinity"):
+        return -INFINITY if text.startswith("-") else INFINITY
+    try:
+        return parse_fraction(text)
+    except (ValueError, ZeroDivisionError):
+        raise FormatError(f"{text[:20]!r} is not a number or is out of range") from None
+
+
+class ModelBuilder:
+    """Sparse rows, costs and bounds collected while a file is read"""
+
+    def __init__(self):
+        self.index = {}
+        self.variables = []
+        self.costs = {}
+        self.rows = []
+        self.senses = []
+        self.rhs = []
+        self.lower = {}
+        self.upper = {}
+
+    def column(self, name):
+        j = self.index.get(name)
+        if j is None:
+            j = self.index[name] = len(self.variables)
+            self.variables.append(name)
+        return j
+
+    def add_row(self, coefficients, sense, rhs):
+        """Add a row from ``{name: coefficient}``; returns its index"""
+        self.rows.append({self.column(name): a for name, a in coefficients.items() if a != 0})
+        self.senses.append(sense)
+        self.rhs.append(rhs)
+        return len(self.rows) - 1
+
+    def bound(self, name, lower=None, upper=None):
+        j = self.column(name)
+        if lower is not None:
+            self.lower[j] = lower
+        if upper is not None:
+            self.upper[j] = upper
+
+    def problem(self, direction):
+        """The finished :class:`Problem`, with bounds turned into rows"""
+        for j, lower in self.lower.items():
+            if lower < 0:
+                raise FormatError(
+                    f"variable {self.variables[j]!r} has a negative or missing lower bound; "
+                    "only variables >= 0 are supported"
+                )
+        for j in sorted(self.lower.keys() | self.upper.keys()):
+            lower = self.lower.get(j, 0)
+            upper = self.upper.get(j, INFINITY)
+            if lower == upper:
+                self._bound_row(j, "=", lower)
+                continue
+            if lower > 0:
+                self._bound_row(j, ">=", lower)
+            if upper != INFINITY:
+                self._bound_row(j, "<=", upper)
+        return Problem(
+            [self.costs.get(j, Fraction(0)) for j in range(len(self.variables))],
+            self.rows,
+            self.senses,
+            self.rhs,
+            direction=direction,
+            variables=self.variables,
+        )
+
+    def _bound_row(self, j, sense, value):
+        self.rows.append({j: Fraction(1)})
+        self.senses.append(sense)
+        self.rhs.append(value)
+
+
+# --- MPS ---------------------------------------------------------------------
+
+MPS_SECTIONS = {"NAME", "OBJSENSE", "ROWS", "COLUMNS", "RHS", "RANGES", "BOUNDS", "ENDATA"}
+MPS_SENSES = {"L": "<=", "G": ">=", "E": "="}
+MPS_DIRECTIONS = {"MAX": "max", "MAXIMIZE": "max", "MIN": "min", "MINIMIZE": "min"}
+# Column spans of the six fields of a fixed-format data line
+FIXED_FIELDS = ((1, 3), (4, 12), (14, 22), (24, 36), (39, 47), (49, 61))
+OBJECTIVE = -1
+
+
+def fixed_fields(line):
+    fields = (line[start:end].strip() for start, end in FIXED_FIELDS)
+    return [field for field in fields if field]
+
+
+def read_mps(lines, fixed=False):
+    """Read a free-format (or with ``fixed=True``, fixed-format) MPS model
+
+    MPS models minimise unless an ``OBJSENSE`` section says ``MAX``.  The
+    first ``N`` row is the objective; further ``N`` rows are ignored.
+    """
+    model = ModelBuilder()
+    rows = {}      # row name -> row index, OBJECTIVE, or None for ignored N rows
+    ranges = {}
+    direction = "min"
+    section = None
+    lineno = 0
+    try:
+        for lineno, line in enumerate(lines, 1):
+            if not line.strip() or line.startswith("*"):
+                continue
+            if not line[0].isspace():
+                words = line.split()
+                section = words[0].upper()
+                if section not in MPS_SECTIONS:
+                    raise FormatError(f"unknown section {words[0]!r}")
+                if section == "OBJSENSE" and len(words) > 1:
+                    direction = mps_direction(words[1])
+                if section == "ENDATA":
+                    break
+                continue
+
+            fields = fixed_fields(line) if fixed else line.split()
+            if section == "OBJSENSE":
+                direction = mps_direction(fields[0])
+            elif section == "ROWS":
+                kind, name = fields[0].upper(), fields[1]
+                if kind == "N":
+                    rows[name] = None if OBJECTIVE in rows.values() else OBJECTIVE
+                elif kind in MPS_SENSES:
+                    rows[name] = model.add_row({}, MPS_SENSES[kind], Fraction(0))
+                else:
+                    raise FormatError(f"unknown row type {fields[0]!r}")
+            elif section == "COLUMNS":
+                if len(fields) > 2 and fields[1].strip("'").upper() == "MARKER":
+                    continue
+                j = model.column(fields[0])
+                for row, value in mps_pairs(fields[1:], rows):
+                    if row == OBJECTIVE:
+                        model.costs[j] = value
+                    elif row is not None and value != 0:
+                        model.rows[row][j] = value
+            elif section == "RHS":
+                # The objective's RHS is a constant offset, which does not change the optimum
+                for row, value in mps_pairs(fields[len(fields) % 2:], rows):
+                    if row is not None and row != OBJECTIVE:
+                        model.rhs[row] = value
+            elif section == "RANGES":
+                for row, value in mps_pairs(fields[len(fields) % 2:], rows):
+                    if row is not None and row != OBJECTIVE:
+                        ranges[row] = value
+            elif section == "BOUNDS":
+                mps_bound(model, fields)
+            else:
+                raise FormatError("data line outside a section")
+    except FormatError as e:
+        raise FormatError(f"line {lineno}: {e}") from None
+    except IndexError:
+        raise FormatError(f"line {lineno}: missing field") from None
+
+    for row, r in ranges.items():
+        add_range(model, row, r)
+    return model.problem(direction)
+
+
+def mps_direction(word):
+    try:
+        return MPS_DIRECTIONS[word.upper()]
+    except KeyError:
+        raise FormatError(f"unknown objective sense {word!r}") from None
+
+
+def mps_pairs(fields, rows):
+    """(row index, value) for each ``row value`` pair of a data line"""
+    if len(fields) not in (2, 4):
+        raise FormatError("expected one or two 'row value' pairs")
+    for k in range(0, len(fields), 2):
+        if fields[k] not in rows:
+            raise FormatError(f"unknown row {fields[k]!r}")
+        yield rows[fields[k]], read_number(fields[k + 1])
+
+
+def mps_bound(model, fields):
+    """Apply one BOUNDS line: ``type [set] column [value]``"""
+    kind = fields[0].upper()
+    needs_value = kind in ("UP", "LO", "FX", "LI", "UI")
+    if kind not in ("UP", "LO", "FX", "LI", "UI", "FR", "MI", "PL", "BV"):
+        raise FormatError(f"unknown bound type {fields[0]!r}")
+    # The bound set name is optional; with it the line has one more field
+    with_set = len(fields) == (4 if needs_value else 3) or (kind == "BV" and len(fields) == 4)
+    name = fields[2] if with_set else fields[1]
+    value = read_number(fields[-1]) if needs_value else None
+    if kind in ("UP", "UI"):
+        if value < 0:
+            raise FormatError(f"negative upper bound on {name!r} implies a negative lower bound")
+        model.bound(name, upper=value)
+    elif kind in ("LO", "LI"):
+        model.bound(name, lower=value)
+    elif kind == "FX":
+        model.bound(name, lower=value, upper=value)
+    elif kind == "BV":
+        model.bound(name, lower=Fraction(0), upper=Fraction(1))
+    elif kind in ("FR", "MI"):
+        model.bound(name, lower=-INFINITY)
+    else:
+        model.column(name)
+
+
+def add_range(model, row, r):
+    """Turn a ranged row into two one-sided rows"""
+    sense = model.senses[row]
+    b = model.rhs[row]
+    if sense == "<=":
+        other = (">=", b - abs(r))
+    elif sense == ">=":
+        other = ("<=", b + abs(r))
+    elif r >= 0:
+        model.senses[row] = ">="
+        other = ("<=", b + r)
+    else:
+        model.senses[row] = "<="
+        other = (">=", b + r)
+    model.rows.append(model.rows[row])
+    model.senses.append(other[0])
+    model.rhs.append(other[1])
+
+
+# --- CPLEX LP ----------------------------------------------------------------
+
+LP_NAME = r"[A-Za-z_!\"#$%&()',;?@`{}|~][\w!\"#$%&()',.;?@`{}|~]*"
+LP_TOKEN = re.compile(
+    r"\s*(?:"
+    r"(?P<number>\d+(?:\.\d*)?(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)"
+    rf"|(?P<name>{LP_NAME})"
+    r"|(?P<relation><=|>=|=<|=>|<|>|=)"
+    r"|(?P<op>[-+*])"
+    r")"
+)
+LP_SECTION = re.compile(
+    r"\s*(maximi[sz]e|maximum|max|minimi[sz]e|minimum|min|subject\s+to|such\s+that|s\.?t\.?"
+    r"|bounds?|generals?|gen|integers?|binary|binaries|bin|end)(?=\s|$)(.*)",
+    re.IGNORECASE,
+)
+LP_LABEL = re.compile(r"\s*([^\s:]+)\s*:")
+LP_BOUND = re.compile(r"(<=|>=|=<|=>|<|>|=)")
+LE = ("<", "<=", "=<")
+GE = (">", ">=", "=>")
+
+
+def lp_section(word):
+    word = word.lower()
+    if word.startswith("max"):
+        return "max"
+    if word.startswith("min"):
+        return "min"
+    if word[0] == "s":
+        return "constraints"
+    if word.startswith("bound"):
+        return "bounds"
+    if word.startswith("bin"):
+        return "binary"
+    if word == "end":
+        return "end"
+    return "general"
+
+
+def read_lp(lines):
+    """Read a model in CPLEX LP format
+
+    Objective and constraints may span several lines; a constraint ends
+    once its relation has a right-hand side.  ``\\`` starts a comment.
+    """
+    model = ModelBuilder()
+    direction = None
+    section = None
+    objective = []
+    statement = []
+    has_relation = False
+    lineno = start = 0
+
+    def flush():
+        nonlocal has_relation
+        if not statement:
+            return
+        text = " ".join(statement)
+        statement.clear()
+        has_relation = False
+        m = LP_LABEL.match(text)
+        if m:
+            text = text[m.end():]
+        try:
+            coefficients, sense, rhs = parse_linear(text, LP_TOKEN)
+        except ParseError as e:
+            raise FormatError(f"line {start}: {e}") from None
+        if sense is None:
+            raise FormatError(f"line {start}: constraint has no relation")
+        model.add_row(coefficients, sense, rhs)
+
+    def finish_objective():
+        text = " ".join(objective)
+        m = LP_LABEL.match(text)
+        if m:
+            text = text[m.end():]
+        if text.strip():
+            try:
+                costs, relation, _ = parse_linear(text, LP_TOKEN)
+            except ParseError as e:
+                raise FormatError(f"objective: {e}") from None
+            if relation is not None:
+                raise FormatError("objective must not contain a relation")
+            for name, a in costs.items():
+                model.costs[model.column(name)] = a
+        objective.clear()
+
+    for lineno, line in enumerate(lines, 1):
+        line = line.split("\\", 1)[0].strip()
+        if not line:
+            continue
+        m = LP_SECTION.match(line)
+        if m:
+            if section in ("max", "min"):
+                finish_objective()
+            flush()
+            section = lp_section(m.group(1))
+            if section in ("max", "min"):
+                direction = section
+            if section == "end":
+                break
+            line = m.group(2)
+            if not line.strip():
+                continue
+
+        if section in ("max", "min"):
+            objective.append(line)
+        elif section == "constraints":
+            if statement and LP_LABEL.match(line) and not LP_BOUND.search(line.split(":", 1)[0]):
+                if not has_relation:
+                    raise FormatError(f"line {start}: constraint has no relation")
+                flush()
+            if not statement:
+                start = lineno
+            statement.append(line)
+            # The constraint is complete once something follows its relation
+            relation = LP_BOUND.search(line)
+            if relation:
+                has_relation = True
+                if line[relation.end():].strip().lstrip("<>="):
+                    flush()
+            elif has_relation:
+                flush()
+        elif section == "bounds":
+            try:
+                lp_bound(model, line)
+            except FormatError as e:
+                raise FormatError(f"line {lineno}: {e}") from None
+        elif section == "binary":
+            for name in line.split():
+                model.bound(name, lower=Fraction(0), upper=Fraction(1))
+        elif section == "general":
+            for name in line.split():
+                model.column(name)
+        else:
+            raise FormatError(f"line {lineno}: expected Maximize or Minimize first")
+
+    if section in ("max", "min"):
+        finish_objective()
+    if statement:
+        if not has_relation:
+            raise FormatError(f"line {start}: constraint has no relation")
+        flush()
+    if direction is None:
+        raise FormatError("no Maximize or Minimize section")
+    return model.problem(direction)
+
+
+def lp_bound(model, line):
+    """Apply one line of the Bounds section, e.g. ``0 <= x <= 4`` or ``y free``"""
+    words = line.split()
+    if len(words) == 2 and words[1].lower() == "free":
+        model.bound(words[0], lower=-INFINITY)
+        return
+    parts = [part.strip() for part in LP_BOUND.split(line)]
+    if len(parts) == 5:
+        low, op1, name, op2, high = parts
+        if op1 in GE and op2 in GE:
+            low, high = high, low
+        elif not (op1 in LE and op2 in LE):
+            raise FormatError(f"cannot read bound {line.strip()!r}")
+        model.bound(name, lower=read_number(low), upper=read_number(high))
+        return
+    if len(parts) != 3:
+        raise FormatError(f"cannot read bound {line.strip()!r}")
+    left, op, right = parts
+    if re.fullmatch(LP_NAME, left) and left.lower() not in ("inf", "infinity"):
+        name, value, op = left, read_number(right), op
+    else:
+        # "3 <= x" is "x >= 3"
+        name, value = right, read_number(left)
+        op = "<=" if op in GE else ">=" if op in LE else op
+    if op == "=":
+        model.bound(name, lower=value, upper=value)
+    elif op in LE:
+        model.bound(name, upper=value)
+    else:
+        model.bound(name, lower=value)
+
+
+# --- Files -------------------------------------------------------------------
+
+READERS = {
+    "mps": read_mps,
+    "fixed-mps": lambda lines: read_mps(lines, fixed=True),
+    "lp": read_lp,
+}
+
+
+def model_format(path):
+    """``mps`` or ``lp`` from a file name, looking through a ``.gz`` suffix"""
+    root, ext = os.path.splitext(path.lower())
+    if ext == ".gz":
+        ext = os.path.splitext(root)[1]
+    return {".mps": "mps", ".lp": "lp"}.get(ext)
+
+
+def read_model(path, fmt=None):
+    """Read an MPS or LP file (optionally gzip-compressed) into a :class:`Problem`"""
+    fmt = fmt or model_format(path)
+    if fmt not in READERS:
+        raise FormatError(f"cannot tell the model format of {path!r}; expected .mps or .lp")
+    opener = gzip.open if path.lower().endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        try:
+            return READERS[fmt](f)
+        except FormatError as e:
+            raise FormatError(f"{path}: {e}") from None
+
+
+class ModelFile:
+    """A model file to be read where it is solved (e.g. in a worker process)"""
+
+    __slots__ = ("path", "format")
+
+    def __init__(self, path, format=None):
+        self.path = path
+        self.format = format
+
+    def load(self):
+        return read_model(self.path, self.format)
@@ -0,0 +1,301 @@
+"""Revised simplex: the basis inverse in product form instead of a full tableau.
+
+Only the constraint matrix (by column and by row), the basic solution and
+a file of eta matrices are stored.  Each iteration computes the entering
+column ``B⁻¹ a_q`` (FTRAN) and the pivot row ``e_r B⁻¹ A`` (BTRAN, then
+the rows of A it touches), updates the reduced costs from that row and
+appends one eta for the pivot.  An iteration therefore costs about the
+nonzeros it touches instead of m × n.  Every ``refactor_every`` pivots the
+eta file is rebuilt from the basic columns alone (reinversion), which
+bounds its length and discards accumulated rounding error; reduced costs
+are then recomputed from ``y = c_B B⁻¹``.
+
+:class:`RevisedSimplex` has the :class:`~solver.tableau.Tableau` interface
+and pivot rules, so ``run()``, traces and the step-by-step view work
+unchanged and choose the same pivots as the tableau method.  ``rows``
+rebuilds the full tableau on demand for display.
+"""
+
+from .numeric import to_number
+from .tableau import Tableau, slack_name
+
+REFACTOR_EVERY = 100
+# Float reduced costs and pivots this close to zero count as zero
+FLOAT_TOLERANCE = 1e-9
+
+
+class SingularBasisError(ArithmeticError):
+    """Raised when reinversion finds the basis matrix numerically singular"""
+
+
+class RevisedSimplex(Tableau):
+    """Primal simplex state kept as a product-form factorization of the basis"""
+
+    def __init__(self, a, c, b, head, columns, numeric="fraction", refactor_every=REFACTOR_EVERY):
+        self.a = a                # column q as {row: value}, slacks included
+        self.a_rows = [{} for _ in b]
+        for j, column in enumerate(a):
+            for i, v in column.items():
+                self.a_rows[i][j] = v
+        self.c = c                # cost of every column (maximised)
+        self.b = b
+        self.head = head          # basic column at each factorization position
+        self.units = list(head)   # column equal to e_p at each position, None once dropped
+        self.columns = columns
+        self.order = list(range(len(b)))  # positions in the tableau's display order
+        self.zero = to_number(0, numeric)
+        self.tolerance = 0 if numeric == "fraction" else FLOAT_TOLERANCE
+        self.refactor_every = refactor_every
+        self.etas = []            # (position, {position: value}), reinversion first, then one per pivot
+        self.updates = 0          # pivots since the last reinversion
+        self.refactor()
+
+    @classmethod
+    def from_sparse(cls, objective, constraints, rhs, variables=None, numeric="fraction", **kwargs):
+        """Slack basis for ``max c·x`` s.t. ``A x <= b`` from ``{column: a}`` rows"""
+        m = len(constraints)
+        n = len(objective)
+        if variables is None:
+            variables = [f"x{j + 1}" for j in range(n)]
+        one = to_number(1, numeric)
+        a = [{} for _ in range(n)]
+        for i, row in enumerate(constraints):
+            for j, v in row.items():
+                if v != 0:
+                    a[j][i] = to_number(v, numeric)
+        a += [{i: one} for i in range(m)]
+        c = [to_number(v, numeric) for v in objective] + [to_number(0, numeric)] * m
+        columns = list(variables) + [slack_name(i) for i in range(m)]
+        return cls(a, c, [to_number(v, numeric) for v in rhs], list(range(n, n + m)), columns,
+                   numeric=numeric, **kwargs)
+
+    # --- Factorization -------------------------------------------------------
+
+    def ftran(self, vector):
+        """``B⁻¹ v`` for a sparse column ``{position: value}``"""
+        x = dict(vector)
+        for r, eta in self.etas:
+            xr = x.pop(r, 0)
+            if xr:
+                for i, e in eta.items():
+                    x[i] = x.get(i, 0) + e * xr
+        return x
+
+    def btran(self, vector):
+        """``v B⁻¹`` for a sparse row ``{position: value}``"""
+        y = dict(vector)
+        for r, eta in reversed(self.etas):
+            s = sum(y[i] * e for i, e in eta.items() if i in y)
+            if s:
+                y[r] = s
+            else:
+                y.pop(r, None)
+        return y
+
+    def _add_eta(self, r, d):
+        """Record the pivot that makes position ``r`` basic in the column ``d = B⁻¹ a``"""
+        dr = d[r]
+        eta = {i: -v / dr for i, v in d.items() if v and i != r}
+        eta[r] = 1 / dr
+        self.etas.append((r, eta))
+
+    def refactor(self):
+        """Rebuild the eta file from the basic columns, starting from the unit columns
+
+        Slack and artificial columns that are basic keep their own row; the
+        other columns are pivoted in sparsest first, each on the free row
+        with the largest entry, and the display order follows them to their
+        new positions.
+        """
+        self.etas = []
+        basic = set(self.head)
+        units = set(self.units)
+        free = {i for i, q in enumerate(self.units) if q not in basic}
+        head = list(self.units)
+        for q in sorted((q for q in basic if q not in units), key=lambda q: len(self.a[q])):
+            d = self.ftran(self.a[q])
+            r = max((i for i, v in d.items() if i in free and abs(v) > self.tolerance),
+                    key=lambda i: abs(d[i]), default=None)
+            if r is None:
+                raise SingularBasisError(f"basis is singular at column {self.columns[q]!r}")
+            self._add_eta(r, d)
+            free.discard(r)
+            head[r] = q
+        position = {q: p for p, q in enumerate(head)}
+        self.order = [position[self.head[p]] for p in self.order]
+        self.head = head
+        x = self.ftran({i: v for i, v in enumerate(self.b) if v})
+        self.x_b = [x.get(p, self.zero) for p in range(len(self.b))]
+        self.updates = 0
+        self._z = None
+        self._d = None
+        self._alpha = None
+
+    # --- Tableau interface ---------------------------------------------------
+
+    @property
+    def basis(self):
+        return [self.head[p] for p in self.order]
+
+    @property
+    def num_rows(self):
+        return len(self.b)
+
+    @property
+    def value(self):
+        return sum((self.c[q] * x for q, x in zip(self.head, self.x_b)), self.zero)
+
+    def reduced_costs(self):
+        """z-row entries ``y·a_j - c_j`` of the nonbasic columns, as {column: value}"""
+        if self._z is None:
+            y = self.btran({p: self.c[q] for p, q in enumerate(self.head) if self.c[q]})
+            basic = set(self.head)
+            z = {}
+            for j, column in enumerate(self.a):
+                if j in basic:
+                    continue
+                zj = sum((y[i] * v for i, v in column.items() if i in y), -self.c[j])
+                if zj:
+                    z[j] = zj
+            self._z = z
+        return self._z
+
+    @property
+    def rows(self):
+        """The full tableau ``B⁻¹ [A | b]`` in display order plus the z-row; for display only"""
+        width = len(self.a)
+        rows = []
+        for p in self.order:
+            rho = self.btran({p: self.zero + 1})
+            row = [sum((rho[i] * v for i, v in column.items() if i in rho), self.zero) for column in self.a]
+            rows.append(row + [self.x_b[p]])
+        z = [self.zero] * width
+        for j, v in self.reduced_costs().items():
+            z[j] = v
+        rows.append(z + [self.value])
+        return rows
+
+    @property
+    def z_row(self):
+        return self.rows[-1]
+
+    def label(self, i):
+        if i == self.num_rows:
+            return "z"
+        return self.columns[self.head[self.order[i]]]
+
+    def is_optimal(self):
+        z = self.reduced_costs()
+        return not z or min(z.values()) >= -self.tolerance
+
+    def entering(self):
+        """Column with the most negative reduced cost (first on ties)"""
+        z = self.reduced_costs()
+        best = min(z.values())
+        return min(j for j, v in z.items() if v == best)
+
+    def column(self, col):
+        """``B⁻¹ a_col``, remembered until the next pivot"""
+        if self._d is None or self._d[0] != col:
+            self._d = (col, self.ftran(self.a[col]))
+        return self._d[1]
+
+    def basic_values(self):
+        return [self.x_b[p] for p in self.order]
+
+    def row_entries(self, row):
+        return self.pivot_row(self.order[row])
+
+    def column_entries(self, col):
+        rows = {p: row for row, p in enumerate(self.order)}
+        return {rows[p]: v for p, v in self.column(col).items() if v}
+
+    def column_dots(self, col, cols):
+        # d_j·d_q = a_j·w with w = d_q B⁻¹: one BTRAN instead of an FTRAN per column
+        w = self.btran(self.column(col))
+        return {j: sum((w[i] * v for i, v in self.a[j].items() if i in w), self.zero) for j in cols}
+
+    def ratios(self, col):
+        d = self.column(col)
+        result = [None] * len(self.b)
+        rows = {p: row for row, p in enumerate(self.order)}
+        for p, v in d.items():
+            if v > self.tolerance:
+                result[rows[p]] = self.x_b[p] / v
+        return result
+
+    def pivot_row(self, p):
+        """Row ``p`` of ``B⁻¹ A`` as {column: value}, remembered until the next pivot"""
+        if self._alpha is None or self._alpha[0] != p:
+            alpha = {}
+            for i, rho in self.btran({p: self.zero + 1}).items():
+                for j, v in self.a_rows[i].items():
+                    alpha[j] = alpha.get(j, 0) + rho * v
+            self._alpha = (p, alpha)
+        return self._alpha[1]
+
+    def pivot(self, row, col):
+        """Pivot ``col`` in at display row ``row``, which then moves to the top"""
+        p = self.order[row]
+        d = self.column(col)
+        z = self._z
+        if z is not None:
+            # z_j -= z_q · alpha_j / alpha_q along the pivot row; the leaving column
+            # picks up -z_q / alpha_q, every other basic column stays at zero
+            basic = set(self.head)
+            basic.discard(self.head[p])
+            ratio = z.get(col, 0) / d[p]
+            for j, v in self.pivot_row(p).items():
+                if j not in basic and v:
+                    new = z.get(j, 0) - ratio * v
+                    if new:
+                        z[j] = new
+                    else:
+                        z.pop(j, None)
+            z.pop(col, None)
+        theta = self.x_b[p] / d[p]
+        for i, v in d.items():
+            if i != p and v:
+                self.x_b[i] -= theta * v
+        self.x_b[p] = theta
+        self._add_eta(p, d)
+        self.head[p] = col
+        self.order.insert(0, self.order.pop(row))
+        self._d = None
+        self._alpha = None
+        self.updates += 1
+        if self.updates >= self.refactor_every:
+            self.refactor()
+        return self
+
+    def set_objective(self, costs):
+        self.c = list(costs)
+        self._z = None
+
+    def drop_columns(self, cols):
+        keep = [j for j in range(len(self.a)) if j not in cols]
+        index = {j: k for k, j in enumerate(keep)}
+        self.a = [self.a[j] for j in keep]
+        self.a_rows = [{index[j]: v for j, v in row.items() if j in index} for row in self.a_rows]
+        self.c = [self.c[j] for j in keep]
+        self.columns = [self.columns[j] for j in keep]
+        self.head = [index[q] for q in self.head]
+        self.units = [index.get(q) for q in self.units]
+        self._z = self._d = self._alpha = None
+
+    def solution(self):
+        values = [self.zero] * len(self.a)
+        for q, x in zip(self.head, self.x_b):
+            values[q] = x
+        return values
+
+    def copy(self):
+        other = object.__new__(RevisedSimplex)
+        other.__dict__.update(self.__dict__)
+        other.head = list(self.head)
+        other.order = list(self.order)
+        other.x_b = list(self.x_b)
+        other.etas = list(self.etas)
+        if self._z is not None:
+            other._z = dict(self._z)
+        return other
@@ -0,0 +1,165 @@
+"""Sensitivity analysis read from an optimal basis, without solving again.
+
+For an optimal tableau of ``problem`` :func:`analyse` reports
+
+``shadow_prices``
+    Per constraint, the change in the optimal objective per unit increase
+    of its right-hand side (the dual values).
+``reduced_costs``
+    Per variable, how much the objective worsens per unit of the variable
+    forced into the solution; zero for basic variables.  Equivalently, how
+    far its cost must improve before it is worth using.
+``rhs_ranges``
+    Per constraint, the ``[low, high]`` right-hand sides over which the
+    basis stays optimal, and with it the shadow prices.
+``objective_ranges``
+    Per variable, the ``[low, high]`` costs over which the current solution
+    stays optimal.
+
+Missing bounds are None (unbounded).  The right-hand side of a redundant
+``=`` row, one whose artificial variable is still basic, cannot move at
+all: its range is a single point.  All values refer to the problem as
+given: its direction, row signs and row order.  Ranges hold one change at a
+time, the others kept fixed.
+
+The tableau holds ``B⁻¹`` times each slack or surplus column, so inequality
+rows are read off directly; only ``=`` rows, whose artificial columns are
+gone after Phase I, need the basis matrix solved for their columns of ``B⁻¹``.
+"""
+
+from .numeric import to_number
+from .tableau import artificial_name, slack_name
+
+
+def analyse(problem, tableau, numeric="fraction"):
+    """Sensitivity report for ``problem`` from its optimal ``tableau``, as a dict of lists"""
+    n = problem.num_variables
+    zero = to_number(0, numeric)
+    tolerance = tableau.tolerance
+    sign = 1 if problem.direction == "max" else -1
+    costs = [sign * to_number(c, numeric) for c in problem.objective]     # as maximised by the tableau
+    basis = tableau.basis
+    row_of = {j: r for r, j in enumerate(basis)}
+    x = tableau.basic_values()
+    d = tableau.reduced_costs()
+
+    units = unit_columns(problem, tableau, numeric)
+    basic_costs = [costs[j] if j < n else zero for j in basis]
+    # An artificial variable still basic holds a redundant = row and must stay zero
+    artificials = {artificial_name(i) for i in range(len(problem.constraints))}
+    pinned = {r for r, j in enumerate(basis) if tableau.columns[j] in artificials}
+    shadow_prices = []
+    rhs_ranges = []
+    for i, u in enumerate(units):
+        shadow_prices.append(sign * sum((basic_costs[r] * v for r, v in u.items()), zero))
+        if any(r in pinned for r in u):
+            # Any change would make the redundant rows contradict each other
+            low = high = zero
+        else:
+            # x_B + δ·u must stay nonnegative
+            low, high = step_range(((v, x[r]) for r, v in u.items()), tolerance)
+        b = to_number(problem.rhs[i], numeric)
+        rhs_ranges.append([None if low is None else b + low, None if high is None else b + high])
+
+    reduced_costs = []
+    objective_ranges = []
+    for j in range(n):
+        if j in row_of:
+            reduced_costs.append(zero)
+            # Raising c_j by δ moves each nonbasic reduced cost d_k by δ·α_k
+            alpha = tableau.row_entries(row_of[j])
+            low, high = step_range(((a, d.get(k, zero)) for k, a in alpha.items() if k not in row_of), tolerance)
+        else:
+            reduced_costs.append(d.get(j, zero))
+            low, high = None, d.get(j, zero)
+        c = costs[j]
+        low = None if low is None else c + low
+        high = None if high is None else c + high
+        objective_ranges.append([low, high] if sign == 1 else [None if high is None else -high,
+                                                               None if low is None else -low])
+
+    return {
+        "shadow_prices": shadow_prices,
+        "reduced_costs": reduced_costs,
+        "rhs_ranges": rhs_ranges,
+        "objective_ranges": objective_ranges,
+    }
+
+
+def step_range(pairs, tolerance=0):
+    """Interval of δ keeping every ``value + δ·slope`` nonnegative, for (slope, value) pairs"""
+    low = high = None
+    for slope, value in pairs:
+        if abs(slope) <= tolerance:
+            continue
+        step = -value / slope
+        if slope > 0:
+            low = step if low is None else max(low, step)
+        else:
+            high = step if high is None else min(high, step)
+    return low, high
+
+
+def unit_columns(problem, tableau, numeric="fraction"):
+    """``B⁻¹ e_i`` for each constraint ``i`` of ``problem``, as {tableau row: value}
+
+    The slack of a ``<=`` row has coefficient +1 in the row as given and the
+    surplus of a ``>=`` row -1, however the tableau scaled the row, so their
+    columns give ``B⁻¹ e_i`` up to that sign.  The other rows are solved for.
+    """
+    index = {name: j for j, name in enumerate(tableau.columns)}
+    units = [None] * len(problem.constraints)
+    missing = []
+    for i, sense in enumerate(problem.senses):
+        j = index.get(slack_name(i))
+        if j is None:
+            missing.append(i)
+            continue
+        entries = tableau.column_entries(j)
+        units[i] = entries if sense == "<=" else {r: -v for r, v in entries.items()}
+    if missing:
+        for i, u in zip(missing, solve_basis(problem, tableau, missing, numeric)):
+            units[i] = u
+    return units
+
+
+def solve_basis(problem, tableau, rows, numeric="fraction"):
+    """Columns ``B⁻¹ e_i`` for ``i`` in ``rows`` by Gauss–Jordan elimination on ``B``
+
+    ``B`` is the basis matrix in the rows as given: structural columns from
+    the problem, ±1 for slack, surplus and the artificial variables left
+    basic in redundant rows.
+    """
+    m = len(problem.constraints)
+    n = problem.num_variables
+    zero = to_number(0, numeric)
+    one = to_number(1, numeric)
+    units = {slack_name(i): (i, one if sense == "<=" else -one) for i, sense in enumerate(problem.senses)}
+    # An artificial column is +1 in the row scaled to a nonnegative right-hand side
+    units.update((artificial_name(i), (i, -one if b < 0 else one)) for i, b in enumerate(problem.rhs))
+    dense = [[to_number(a, numeric) for a in problem.dense_row(i)] for i in range(m)]
+
+    # Augmented [B | e_i for i in rows], one list per constraint row
+    matrix = [[zero] * (m + len(rows)) for _ in range(m)]
+    for r, j in enumerate(tableau.basis):
+        if j < n:
+            for i in range(m):
+                matrix[i][r] = dense[i][j]
+        else:
+            i, v = units[tableau.columns[j]]
+            matrix[i][r] = v
+    for t, i in enumerate(rows):
+        matrix[i][m + t] = one
+
+    for col in range(m):
+        pivot = max(range(col, m), key=lambda i: abs(matrix[i][col]))
+        matrix[col], matrix[pivot] = matrix[pivot], matrix[col]
+        top = matrix[col]
+        k = top[col]
+        top[:] = [v / k for v in top]
+        for i, other in enumerate(matrix):
+            factor = other[col]
+            if i != col and factor:
+                other[:] = [v - factor * p for v, p in zip(other, top)]
+    tolerance = tableau.tolerance
+    return [{r: matrix[r][m + t] for r in range(m) if abs(matrix[r][m + t]) > tolerance} for t in range(len(rows))]
@@ -0,0 +1,550 @@
+"""Primal simplex iteration over a :class:`~solver.tableau.Tableau`."""
+
+import copy
+import time
+
+from .numeric import to_number
+from .pricing import PRICING_RULES, make_pricing
+from .problem import ProblemError
+from .revised import FLOAT_TOLERANCE, RevisedSimplex
+from .sensitivity import analyse
+from .sparse import SparseTableau
+from .tableau import Tableau, artificial_name, slack_name
+
+OPTIMAL = "optimal"
+UNBOUNDED = "unbounded"
+INFEASIBLE = "infeasible"
+# A Budget ran out first; the result holds the last (and best) basis reached
+ITERATION_LIMIT = "iteration_limit"
+TIME_LIMIT = "time_limit"
+CANCELLED = "cancelled"
+LIMIT_STATUSES = (ITERATION_LIMIT, TIME_LIMIT, CANCELLED)
+STORAGES = ("auto", "dense", "sparse")
+METHODS = ("tableau", "revised")
+# How much of the run solve() records: nothing, the pivots, or the pivots with every tableau
+TRACE_LEVELS = ("none", "summary", "full")
+# Keyword arguments of solve() that JSON requests may set, besides numeric and trace
+SOLVE_OPTIONS = ("storage", "method", "pricing", "max_iterations", "time_limit", "sensitivity")
+# "auto" picks sparse rows above this many cells when at most this share are nonzero;
+# smaller tableaux fit in memory anyway and dense rows pivot faster when they fill in
+SPARSE_MIN_CELLS = 250_000
+SPARSE_MAX_DENSITY = 0.1
+
+
+class Budget:
+    """Iteration and wall-clock limits and a cancellation flag, checked before every pivot
+
+    ``cancel`` is anything with an ``is_set()`` method, typically a
+    ``threading.Event`` set by another thread.  The clock starts when the
+    budget is created.
+    """
+
+    def __init__(self, max_iterations=None, time_limit=None, cancel=None, clock=time.monotonic):
+        self.max_iterations = max_iterations
+        self.deadline = None if time_limit is None else clock() + time_limit
+        self.cancel = cancel
+        self.clock = clock
+
+    def check(self, iterations):
+        """Status to stop with after ``iterations`` pivots, or None to carry on"""
+        if self.cancel is not None and self.cancel.is_set():
+            return CANCELLED
+        if self.max_iterations is not None and iterations >= self.max_iterations:
+            return ITERATION_LIMIT
+        if self.deadline is not None and self.clock() >= self.deadline:
+            return TIME_LIMIT
+        return None
+
+    def after(self, iterations):
+        """The budget left once ``iterations`` pivots have been spent"""
+        left = copy.copy(self)
+        if left.max_iterations is not None:
+            left.max_iterations = max(left.max_iterations - iterations, 0)
+        return left
+
+
+def run(tableau, on_pivot=None, pricing="dantzig", budget=None):
+    """Pivot until optimal, unbounded or out of ``budget``; return (status, iterations)
+
+    ``on_pivot(tableau, row, col)`` is called before each pivot is applied.
+    ``pricing`` names a rule from :mod:`solver.pricing` or is a rule object.
+    """
+    rule = make_pricing(pricing)
+    rule.start(tableau)
+    iterations = 0
+    while True:
+        col = rule.entering(tableau)
+        if col is None:
+            return OPTIMAL, iterations
+        row = rule.leaving(tableau, col)
+        if row is None:
+            return UNBOUNDED, iterations
+        if budget is not None:
+            status = budget.check(iterations)
+            if status is not None:
+                return status, iterations
+        if on_pivot is not None:
+            on_pivot(tableau, row, col)
+        rule.update(tableau, row, col)
+        tableau.pivot(row, col)
+        iterations += 1
+
+
+def run_dual(tableau, on_pivot=None, budget=None):
+    """Dual simplex pivots until the basis is primal feasible; return (status, iterations)
+
+    The z-row must have no negative entry and stays that way.  Each pivot
+    takes the row with the most negative right-hand side (first on ties)
+    and, among its negative entries, the column with the smallest
+    ``z_j / |a_rj|`` (lowest index on ties).  A row with no negative entry
+    proves the problem INFEASIBLE; a primal feasible basis is OPTIMAL.
+    """
+    tolerance = tableau.tolerance
+    iterations = 0
+    while True:
+        values = tableau.basic_values()
+        row = min(range(len(values)), key=values.__getitem__, default=None)
+        if row is None or values[row] >= -tolerance:
+            return OPTIMAL, iterations
+        z = tableau.reduced_costs()
+        col = best = None
+        for j, a in tableau.row_entries(row).items():
+            if a < -tolerance:
+                ratio = z.get(j, 0) / -a
+                if col is None or ratio < best or ratio == best and j < col:
+                    col, best = j, ratio
+        if col is None:
+            return INFEASIBLE, iterations
+        if budget is not None:
+            status = budget.check(iterations)
+            if status is not None:
+                return status, iterations
+        if on_pivot is not None:
+            on_pivot(tableau, row, col)
+        tableau.pivot(row, col)
+        iterations += 1
+
+
+def check_options(storage="auto", method="tableau", pricing="dantzig", max_iterations=None, time_limit=None,
+                  sensitivity=False):
+    """Raise ProblemError unless every option of ``solve()`` has a known value"""
+    if storage not in STORAGES:
+        raise ProblemError(f"storage must be one of {STORAGES}, got {storage!r}")
+    if method not in METHODS:
+        raise ProblemError(f"method must be one of {METHODS}, got {method!r}")
+    if not isinstance(pricing, str) or pricing not in PRICING_RULES:
+        raise ProblemError(f"pricing must be one of {tuple(PRICING_RULES)}, got {pricing!r}")
+    if max_iterations is not None and (type(max_iterations) is not int or max_iterations < 0):
+        raise ProblemError(f"max_iterations must be a nonnegative integer, got {max_iterations!r}")
+    if time_limit is not None and (type(time_limit) not in (int, float) or not time_limit >= 0):
+        raise ProblemError(f"time_limit must be a nonnegative number of seconds, got {time_limit!r}")
+    if not isinstance(sensitivity, bool):
+        raise ProblemError(f"sensitivity must be true or false, got {sensitivity!r}")
+
+
+def request_options(data, options):
+    """``options`` updated with the :data:`SOLVE_OPTIONS` fields of a request ``data``
+
+    A request may lower ``max_iterations`` and ``time_limit`` but never
+    raise or remove them: its values must be positive and are capped at
+    the ones in ``options`` (when those are set).
+    """
+    options = dict(options)
+    for name in SOLVE_OPTIONS:
+        if name not in data:
+            continue
+        value = data[name]
+        if name in ("max_iterations", "time_limit"):
+            kinds = (int,) if name == "max_iterations" else (int, float)
+            if type(value) not in kinds or not value > 0:
+                raise ProblemError(f"{name} must be a positive {'integer' if kinds == (int,) else 'number'}, "
+                                   f"got {value!r}")
+            if options.get(name) is not None:
+                value = min(value, options[name])
+        options[name] = value
+    return options
+
+
+def trace_level(trace):
+    """The :data:`TRACE_LEVELS` entry for ``trace``; True means ``"full"``, False and None ``"none"``"""
+    if trace is None or trace is False:
+        return "none"
+    if trace is True:
+        return "full"
+    if trace not in TRACE_LEVELS:
+        raise ProblemError(f"trace must be one of {TRACE_LEVELS} or a boolean, got {trace!r}")
+    return trace
+
+
+def choose_storage(problem, numeric="fraction", storage="auto"):
+    """Resolve ``storage="auto"`` to ``"dense"`` or ``"sparse"`` for ``problem``"""
+    check_options(storage=storage)
+    if storage == "sparse" and numeric == "float64":
+        raise ProblemError("float64 tableaux are dense; use numeric 'float' with sparse storage")
+    if storage != "auto":
+        return storage
+    if numeric == "float64":
+        return "dense"
+    cells = len(problem.constraints) * problem.num_variables
+    if cells < SPARSE_MIN_CELLS:
+        return "dense"
+    nonzeros = sum(len(problem.row_items(i)) for i in range(len(problem.constraints)))
+    return "sparse" if nonzeros <= SPARSE_MAX_DENSITY * cells else "dense"
+
+
+def max_costs(problem, numeric="fraction"):
+    """Objective coefficients of ``problem`` as a maximisation, converted to ``numeric``"""
+    objective = [to_number(c, numeric) for c in problem.objective]
+    if problem.direction == "min":
+        objective = [-c for c in objective]
+    return objective
+
+
+def dual_feasible(problem):
+    """True when the slack basis of ``problem`` is dual feasible
+
+    That is, the problem has no ``=`` rows and no cost to maximise is
+    positive (e.g. it minimises nonnegative costs).
+    """
+    sign = 1 if problem.direction == "max" else -1
+    return "=" not in problem.senses and all(sign * c <= 0 for c in problem.objective)
+
+
+def standard_tableau(problem, numeric="fraction", storage="dense", method="tableau", slack_start=False):
+    """Starting tableau for ``problem``, maximising in every case
+
+    ``>=`` rows are negated into ``<=`` rows, and a ``<=`` row with a
+    nonnegative right-hand side starts with its slack basic.  Every other
+    row is scaled to a nonnegative right-hand side and gets an artificial
+    variable instead (after a surplus column if it is an inequality); the
+    tableau then starts in Phase I, maximising minus the sum of the
+    artificials, and ``tableau.phase_one`` holds what
+    :func:`finish_phase_one` needs to switch to the real objective.
+
+    With ``slack_start=True`` every inequality keeps its slack basic, even
+    where the right-hand side is negative; only ``=`` rows get artificials.
+    :func:`solve` asks for this when the slack basis is dual feasible, for
+    :func:`run_dual` to repair, and before installing a warm-start basis.
+
+    With ``storage="sparse"`` (or ``"auto"`` on a large, sparse problem)
+    the rows are kept as dictionaries of nonzeros in a
+    :class:`SparseTableau`.  ``method="revised"`` returns a
+    :class:`RevisedSimplex` instead, which keeps a factorized basis rather
+    than a tableau; ``storage`` is then ignored.
+    """
+    check_options(storage, method)
+    revised = method == "revised"
+    sparse = revised or choose_storage(problem, numeric, storage) == "sparse"
+    objective = max_costs(problem, numeric)
+    constraints = []
+    rhs = []
+    slacks = []                   # per row: 1 for a slack, -1 for a surplus, None for neither
+    for i, (sense, b) in enumerate(zip(problem.senses, problem.rhs)):
+        if sparse:
+            row = {j: to_number(a, numeric) for j, a in problem.row_items(i)}
+        else:
+            row = [to_number(a, numeric) for a in problem.dense_row(i)]
+        b = to_number(b, numeric)
+        if sense == ">=" and (b <= 0 or slack_start) or b < 0 and (sense == "=" or not slack_start):
+            row = {j: -a for j, a in row.items()} if sparse else [-a for a in row]
+            b = -b
+            sense = {"<=": ">=", ">=": "<=", "=": "="}[sense]
+        constraints.append(row)
+        rhs.append(b)
+        slacks.append({"<=": 1, ">=": -1, "=": None}[sense])
+
+    if not all(s == 1 for s in slacks):
+        tableau = _phase_one_tableau(problem, objective, constraints, rhs, slacks, numeric, sparse, revised)
+    elif revised:
+        tableau = RevisedSimplex.from_sparse(objective, constraints, rhs, problem.variables, numeric=numeric)
+    elif sparse:
+        tableau = SparseTableau.from_sparse(objective, constraints, rhs, problem.variables, numeric=numeric)
+    else:
+        tableau = Tableau.from_standard(objective, constraints, rhs, problem.variables, numeric=numeric)
+    if numeric != "fraction":
+        tableau.tolerance = float_tolerance(objective, constraints)
+    return tableau
+
+
+def float_tolerance(objective, constraints):
+    """Zero tolerance of a float tableau with these costs and rows
+
+    :data:`~solver.revised.FLOAT_TOLERANCE` suits coefficients of order one.
+    It shrinks with the smallest row (or cost) magnitude, so a problem
+    whose coefficients are all tiny is not read as all zeros; it never grows.
+    """
+    scale = 1
+    for row in [objective] + constraints:
+        values = row.values() if isinstance(row, dict) else row
+        largest = max((abs(a) for a in values), default=0)
+        if largest:
+            scale = min(scale, largest)
+    return FLOAT_TOLERANCE * scale
+
+
+def _phase_one_tableau(problem, objective, constraints, rhs, slacks, numeric, sparse, revised):
+    """Tableau with slack, surplus and artificial columns and the Phase I z-row"""
+    n = problem.num_variables
+    zero = to_number(0, numeric)
+    one = to_number(1, numeric)
+    columns = list(problem.variables)
+    extra = [{} for _ in constraints]   # per row, {column: ±1} for its slack or surplus and artificial
+    basis = []
+    for i, s in enumerate(slacks):
+        if s is not None:
+            extra[i][len(columns)] = one if s == 1 else -one
+            columns.append(slack_name(i))
+    artificials = []
+    for i, s in enumerate(slacks):
+        if s == 1:
+            basis.append(next(iter(extra[i])))
+        else:
+            extra[i][len(columns)] = one
+            basis.append(len(columns))
+            artificials.append(len(columns))
+            columns.append(artificial_name(i))
+    width = len(columns)
+    costs = objective + [zero] * (width - n)
+
+    if sparse:
+        rows = [dict(row) for row in constraints]
+        for row, entries in zip(rows, extra):
+            row.update(entries)
+        if revised:
+            a = [{} for _ in range(width)]
+            for i, row in enumerate(rows):
+                for j, v in row.items():
+                    if v != 0:
+                        a[j][i] = v
+            tableau = RevisedSimplex(a, costs, rhs, basis, columns, numeric=numeric)
+        else:
+            tableau = SparseTableau([{j: v for j, v in row.items() if v != 0} for row in rows], rhs,
+                                    {j: -c for j, c in enumerate(costs) if c != 0}, zero, basis, columns)
+    else:
+        rows = []
+        for row, entries, b in zip(constraints, extra, rhs):
+            tail = [zero] * (width - n)
+            for j, v in entries.items():
+                tail[j - n] = v
+            rows.append(list(row) + tail + [b])
+        rows.append([-c for c in costs] + [zero])
+        if numeric == "float64":
+            from .kernels import ArrayTableau
+            tableau = ArrayTableau.from_rows(rows, basis, columns)
+        else:
+            tableau = Tableau(rows, basis, columns)
+
+    tableau.phase_one = (costs, artificials)
+    marked = set(artificials)
+    tableau.set_objective([-one if j in marked else zero for j in range(width)])
+    return tableau
+
+
+def finish_phase_one(tableau, on_pivot=None):
+    """Switch an optimal Phase I tableau to the real objective; return (status, pivots)
+
+    The status is INFEASIBLE when the artificial variables cannot all be
+    zero, None otherwise.  Artificials still basic at zero are pivoted out
+    on the largest other entry of their row, and those pivots are counted
+    (and passed to ``on_pivot``).  An artificial whose row has no other
+    nonzero belongs to a redundant constraint; it stays basic at zero,
+    where no later pivot can move it.  The other artificial columns are
+    dropped and the z-row is rebuilt for the phase-two costs.
+    """
+    costs, artificials = tableau.phase_one
+    tolerance = tableau.tolerance
+    scale = 1 if not tolerance else 1 + max(abs(v) for v in tableau.solution())
+    if tableau.value < -tolerance * scale:
+        return INFEASIBLE, 0
+
+    marked = set(artificials)
+    redundant = set()
+    pivots = 0
+    while True:
+        row = next((i for i, j in enumerate(tableau.basis) if j in marked and j not in redundant), None)
+        if row is None:
+            break
+        entries = {j: v for j, v in tableau.row_entries(row).items() if j not in marked and abs(v) > tolerance}
+        if not entries:
+            redundant.add(tableau.basis[row])
+            continue
+        col = max(entries, key=lambda j: abs(entries[j]))
+        if on_pivot is not None:
+            on_pivot(tableau, row, col)
+        tableau.pivot(row, col)
+        pivots += 1
+
+    dropped = marked - redundant
+    tableau.phase_one = None
+    tableau.drop_columns(dropped)
+    tableau.set_objective([c for j, c in enumerate(costs) if j not in dropped])
+    return None, pivots
+
+
+def install_basis(tableau, names):
+    """Pivot the columns called ``names`` into the basis; return the number of pivots
+
+    Each such column replaces a basic column not in ``names``, on the row
+    where its entry is largest.  Names the tableau has no column for are
+    ignored, and so are columns that cannot enter (their entries are zero
+    on every row still free), so the basis reached may only approximate
+    ``names``.  The pivots ignore signs: the basis may be primal or dual
+    infeasible, or neither.
+    """
+    index = {name: j for j, name in enumerate(tableau.columns)}
+    target = {index[name] for name in names if name in index}
+    if tableau.phase_one is not None:
+        target -= set(tableau.phase_one[1])
+    tolerance = tableau.tolerance
+    pivots = 0
+    for col in sorted(target):
+        basis = tableau.basis
+        if col in basis:
+            continue
+        entries = {i: v for i, v in tableau.column_entries(col).items()
+                   if basis[i] not in target and abs(v) > tolerance}
+        if entries:
+            tableau.pivot(max(entries, key=lambda i: abs(entries[i])), col)
+            pivots += 1
+    return pivots
+
+
+def warm_tableau(problem, names, numeric="fraction", storage="dense", method="tableau"):
+    """Starting tableau for ``problem`` with the basis ``names`` installed; return (tableau, pivots)
+
+    The tableau is None when the basis leaves an artificial variable basic,
+    which happens when an ``=`` row is new or its old basic variable is
+    gone; a cold start is then the better choice.
+    """
+    tableau = standard_tableau(problem, numeric, storage, method, slack_start=True)
+    pivots = install_basis(tableau, names)
+    if tableau.phase_one is not None:
+        if set(tableau.phase_one[1]) & set(tableau.basis):
+            return None, pivots
+        finish_phase_one(tableau)
+    return tableau, pivots
+
+
+def solve(problem, numeric="fraction", trace=False, storage="auto", method="tableau", pricing="dantzig",
+          max_iterations=None, time_limit=None, cancel=None, warm_start=None, sensitivity=False):
+    """Solve ``problem`` and return a plain result dictionary
+
+    The result has ``status``, ``x`` (one value per problem variable),
+    ``objective``, ``basis`` (names of the basic variables) and
+    ``iterations``.  ``trace`` is one of :data:`TRACE_LEVELS` (or a bool for
+    ``"full"`` and ``"none"``): ``"summary"`` adds ``trace``, one entry per
+    pivot with the entering and leaving variables, and ``"full"`` adds the
+    tableau before each pivot to those entries and a ``final_tableau``.
+    With ``"none"`` no tableau is copied at all.  ``storage`` is passed to
+    :func:`standard_tableau`; it changes speed and memory, not the result.
+    ``method="revised"`` runs the revised simplex method, which picks the
+    same pivots without updating a full tableau.  ``pricing`` picks the
+    entering-column rule (see :mod:`solver.pricing`); rules other than
+    ``"dantzig"`` may reach a different optimal vertex on degenerate or
+    multiply optimal problems.
+
+    Problems whose slack basis is infeasible (``>=`` and ``=`` rows) are
+    solved in two phases; ``status`` is ``"infeasible"`` when Phase I
+    shows that no point satisfies every constraint.  Trace entries of such
+    a solve carry the ``phase`` they belong to.  When the slack basis is
+    dual feasible instead (inequalities only, no cost to maximise is
+    positive, e.g. minimising nonnegative costs), :func:`run_dual` repairs
+    it without artificial variables; its trace entries have ``dual`` set.
+
+    ``max_iterations`` caps the pivots, ``time_limit`` the seconds spent
+    pivoting, and setting the ``cancel`` event stops the solve at the next
+    pivot.  A solve stopped this way has one of :data:`LIMIT_STATUSES`; its
+    ``x``, ``objective`` and ``basis`` are those of the last basis reached,
+    which is feasible and the best found so far.  A solve stopped in Phase
+    I has no feasible basis yet, so ``x`` and ``objective`` are None.
+
+    ``warm_start`` re-optimizes from an earlier basis instead of the slack
+    basis: pass a previous result of :func:`solve`, or a list of basic
+    variable names.  The basis is installed with :func:`install_basis`, then
+    the primal simplex runs if it is primal feasible and the dual simplex
+    (followed by the primal) if it is dual feasible; a basis that is
+    neither is first made feasible by the dual simplex on zero costs.
+    This suits a problem changed by a new right-hand side, cost or
+    constraint (see :mod:`solver.warm`).  The result then carries
+    ``warm_start``: whether the basis was ``installed`` (a basis leaving an
+    ``=`` row without a basic variable falls back to a cold start) and the
+    ``basis_pivots`` that installed it (no pricing or ratio tests, so they
+    are not counted in ``iterations``).  :func:`solver.warm.resolve` can
+    compare the total against a cold solve.
+    """
+    check_options(storage, method, pricing, max_iterations, time_limit, sensitivity)
+    level = trace_level(trace)
+    tableau = None
+    if warm_start is not None:
+        names = warm_start["basis"] if isinstance(warm_start, dict) else warm_start
+        tableau, basis_pivots = warm_tableau(problem, names, numeric, storage, method)
+        installed = tableau is not None
+    if tableau is None:
+        tableau = standard_tableau(problem, numeric, storage, method, slack_start=dual_feasible(problem))
+    budget = None
+    if max_iterations is not None or time_limit is not None or cancel is not None:
+        budget = Budget(max_iterations, time_limit, cancel)
+    steps = [] if level != "none" else None
+    two_phase = tableau.phase_one is not None
+    in_dual = dual = not two_phase and any(v < 0 for v in tableau.basic_values())
+
+    def record(tableau, row, col):
+        step = {
+            "iteration": len(steps) + 1,
+            "entering": tableau.columns[col],
+            "leaving": tableau.label(row),
+            "pivot": [row, col],
+        }
+        if level == "full":
+            step["tableau"] = [list(r) for r in tableau.rows]
+        if two_phase:
+            step["phase"] = 1 if tableau.phase_one is not None else 2
+        if in_dual:
+            step["dual"] = True
+        steps.append(step)
+
+    on_pivot = record if steps is not None else None
+    if dual:
+        costs = None
+        if not tableau.is_optimal():
+            # Only a warm start gets here: find a feasible basis first, then price with the real costs
+            zero = to_number(0, numeric)
+            costs = max_costs(problem, numeric)
+            costs += [zero] * (len(tableau.columns) - len(costs))
+            tableau.set_objective([zero] * len(costs))
+        status, iterations = run_dual(tableau, on_pivot, budget)
+        if costs is not None:
+            tableau.set_objective(costs)
+        if status == OPTIMAL:
+            # The dual simplex ends optimal; this only cleans up rounding in float modes
+            in_dual = False
+            status, more = run(tableau, on_pivot, pricing, budget and budget.after(iterations))
+            iterations += more
+    else:
+        status, iterations = run(tableau, on_pivot, pricing, budget)
+    if two_phase and status == OPTIMAL:
+        status, pivots = finish_phase_one(tableau, on_pivot)
+        iterations += pivots
+        if status is None:
+            status, more = run(tableau, on_pivot, pricing, budget and budget.after(iterations))
+            iterations += more
+    n = len(problem.variables)
+    feasible = status not in (UNBOUNDED, INFEASIBLE) and tableau.phase_one is None and not in_dual
+    result = {
+        "status": status,
+        "x": tableau.solution()[:n] if feasible else None,
+        "objective": None,
+        "basis": [tableau.columns[j] for j in tableau.basis],
+        "iterations": iterations,
+    }
+    if feasible:
+        result["objective"] = tableau.value if problem.direction == "max" else -tableau.value
+    if sensitivity and feasible and status == OPTIMAL:
+        result["sensitivity"] = analyse(problem, tableau, numeric)
+    if warm_start is not None:
+        result["warm_start"] = {"installed": installed, "basis_pivots": basis_pivots}
+    if steps is not None:
+        result["trace"] = steps
+    if level == "full":
+        result["final_tableau"] = [list(r) for r in tableau.rows]
+    return result
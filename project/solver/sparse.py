@@ -0,0 +1,234 @@
+"""Sparse simplex tableau for large LPs that are mostly zeros.
+
+Rows are ``{column: value}`` dictionaries holding only nonzeros, and a
+column index records which rows have a nonzero in each column.  Pricing
+scans only the nonzeros of the z-row, and the ratio test and elimination
+touch only the rows that have a nonzero in the entering column.  No slack
+identity block is stored: each row starts with just its one slack entry.
+
+Rows are never moved in storage.  The dense tableau's "pivot row goes to
+the top" order is kept in a separate permutation, so every method sees
+the same row order as :class:`~solver.tableau.Tableau`.
+"""
+
+from .numeric import to_number
+from .tableau import Tableau, slack_name
+
+
+class SparseTableau(Tableau):
+    """Tableau with dictionary rows; same interface and pivot rules as :class:`Tableau`"""
+
+    def __init__(self, data, rhs, z, z_value, basis, columns, order=None, col_rows=None):
+        self.data = data          # constraint rows in storage order, {column: value}
+        self.rhs = rhs            # right-hand side per stored row
+        self.z = z                # z-row nonzeros
+        self.z_value = z_value
+        self.basis = basis        # basic column per displayed row, as in Tableau
+        self.columns = columns
+        self.order = order if order is not None else list(range(len(data)))
+        if col_rows is None:
+            col_rows = {}
+            for i, row in enumerate(data):
+                for j in row:
+                    col_rows.setdefault(j, set()).add(i)
+        self.col_rows = col_rows  # column -> stored rows with a nonzero there
+
+    @classmethod
+    def from_sparse(cls, objective, constraints, rhs, variables=None, numeric="fraction"):
+        """Slack-basis tableau for ``max c·x`` s.t. ``A x <= b`` from ``{column: a}`` rows"""
+        m = len(constraints)
+        n = len(objective)
+        if variables is None:
+            variables = [f"x{j + 1}" for j in range(n)]
+        one = to_number(1, numeric)
+        data = []
+        for i, row in enumerate(constraints):
+            entries = {j: to_number(a, numeric) for j, a in row.items() if a != 0}
+            entries[n + i] = one
+            data.append(entries)
+        z = {j: -to_number(c, numeric) for j, c in enumerate(objective) if c != 0}
+        columns = list(variables) + [slack_name(i) for i in range(m)]
+        return cls(
+            data,
+            [to_number(b, numeric) for b in rhs],
+            z,
+            to_number(0, numeric),
+            list(range(n, n + m)),
+            columns,
+        )
+
+    @property
+    def width(self):
+        return len(self.columns)
+
+    @property
+    def num_rows(self):
+        return len(self.data)
+
+    @property
+    def rows(self):
+        """Dense rows in display order with the z-row last, for display and traces"""
+        zero = self.z_value * 0
+        dense = []
+        for i in self.order + [None]:
+            row, b = (self.z, self.z_value) if i is None else (self.data[i], self.rhs[i])
+            values = [zero] * (self.width + 1)
+            for j, v in row.items():
+                values[j] = v
+            values[-1] = b
+            dense.append(values)
+        return dense
+
+    @property
+    def z_row(self):
+        return self.rows[-1]
+
+    @property
+    def value(self):
+        return self.z_value
+
+    def label(self, i):
+        if i == self.num_rows:
+            return "z"
+        return self.columns[self.basis[i]]
+
+    def is_optimal(self):
+        return not self.z or min(self.z.values()) >= -self.tolerance
+
+    def entering(self):
+        """Column with the most negative z-row entry (first on ties)"""
+        best = min(self.z.values())
+        return min(j for j, v in self.z.items() if v == best)
+
+    def basic_values(self):
+        return [self.rhs[i] for i in self.order]
+
+    def reduced_costs(self):
+        return self.z
+
+    def row_entries(self, row):
+        return self.data[self.order[row]]
+
+    def column_entries(self, col):
+        rows = self.col_rows.get(col, ())
+        if not rows:
+            return {}
+        position = {i: pos for pos, i in enumerate(self.order)}
+        return {position[i]: self.data[i][col] for i in rows}
+
+    def column_dots(self, col, cols):
+        data = self.data
+        d = [(data[i], data[i][col]) for i in self.col_rows.get(col, ())]
+        return {j: sum(row.get(j, 0) * v for row, v in d) for j in cols}
+
+    def ratios(self, col):
+        result = [None] * len(self.data)
+        rows = self.col_rows.get(col, ())
+        if rows:
+            position = {i: pos for pos, i in enumerate(self.order)}
+            for i in rows:
+                a = self.data[i][col]
+                if a > self.tolerance:
+                    result[position[i]] = self.rhs[i] / a
+        return result
+
+    def pivot(self, row, col):
+        """Pivot on (row, col) in place; the pivot row moves to the top of the display order"""
+        p = self.order[row]
+        k = self.data[p][col]
+        pivot_row = {j: v / k for j, v in self.data[p].items()}
+        pivot_row[col] = k / k
+        self.data[p] = pivot_row
+        self.rhs[p] /= k
+        b = self.rhs[p]
+
+        for i in list(self.col_rows[col]):
+            if i != p:
+                factor = self.data[i].get(col)
+                if factor:
+                    self.rhs[i] -= b * factor
+                self._eliminate(self.data[i], pivot_row, col, i)
+        if self.z.get(col):
+            self.z_value -= b * self.z[col]
+            self._eliminate(self.z, pivot_row, col, None)
+        else:
+            self.z.pop(col, None)
+
+        self.order.insert(0, self.order.pop(row))
+        self.basis.insert(0, col)
+        del self.basis[row + 1]
+        return self
+
+    def _eliminate(self, other, pivot_row, col, i):
+        """``other -= other[col] * pivot_row`` for stored row ``i`` (None for the z-row)
+
+        Only nonzeros are kept: fill-in adds entries and values that cancel
+        to exactly zero are removed, from the row and from ``col_rows``, so
+        storage and work follow the true nonzero count.
+        """
+        factor = other.pop(col, 0)
+        col_rows = self.col_rows if i is not None else None
+        if col_rows is not None:
+            col_rows[col].discard(i)
+        if not factor:
+            return
+        get = other.get
+        for j, v in pivot_row.items():
+            if j == col:
+                # The entering column is eliminated exactly, whatever the rounding
+                continue
+            value = get(j, 0) - v * factor
+            if value:
+                if col_rows is not None and j not in other:
+                    col_rows.setdefault(j, set()).add(i)
+                other[j] = value
+            elif j in other:
+                del other[j]
+                if col_rows is not None:
+                    col_rows[j].discard(i)
+
+    def set_objective(self, costs):
+        z = {j: -c for j, c in enumerate(costs) if c}
+        value = self.z_value * 0
+        for pos, j in enumerate(self.basis):
+            cb = costs[j]
+            if cb:
+                i = self.order[pos]
+                for k, v in self.data[i].items():
+                    z[k] = z.get(k, 0) + cb * v
+                value += cb * self.rhs[i]
+        self.z = {j: v for j, v in z.items() if v}
+        self.z_value = value
+
+    def drop_columns(self, cols):
+        keep = [j for j in range(self.width) if j not in cols]
+        index = {j: k for k, j in enumerate(keep)}
+        self.data = [{index[j]: v for j, v in row.items() if j in index} for row in self.data]
+        self.z = {index[j]: v for j, v in self.z.items() if j in index}
+        self.basis = [index[j] for j in self.basis]
+        self.columns = [self.columns[j] for j in keep]
+        self.col_rows = {}
+        for i, row in enumerate(self.data):
+            for j in row:
+                self.col_rows.setdefault(j, set()).add(i)
+
+    def solution(self):
+        values = [self.z_value * 0] * self.width
+        for pos, j in enumerate(self.basis):
+            values[j] = self.rhs[self.order[pos]]
+        return values
+
+    def copy(self):
+        other = SparseTableau(
+            [dict(row) for row in self.data],
+            list(self.rhs),
+            dict(self.z),
+            self.z_value,
+            list(self.basis),
+            list(self.columns),
+            list(self.order),
+            {j: set(rows) for j, rows in self.col_rows.items()},
+        )
+        other.tolerance = self.tolerance
+        other.phase_one = self.phase_one
+        return other
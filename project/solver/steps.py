@@ -0,0 +1,470 @@
+"""Human-readable walkthrough of a simplex run: ratio tables and row operations.
+
+Everything here is plain text. Row labels go through a ``label`` callable so
+a caller can decorate them (the web view wraps them in ``<b>`` markup); the
+default leaves them as strings.
+"""
+
+import re
+import threading
+
+from .numeric import format_number
+from .parser import RELATIONS, ParseError, parse_constraint, split_objective
+from .sensitivity import analyse
+from .simplex import INFEASIBLE, OPTIMAL, UNBOUNDED, finish_phase_one, standard_tableau
+from .tableau import artificial_name, slack_name
+
+RELATION = re.compile(r"<=|>=|=<|=>|==|≤|≥|=|<|>")
+
+
+def reciprocal_display(k):
+    """Format the 1/k entry shown under the Ratio column"""
+    k_str = format_number(k)
+    if '/' in k_str:
+        numerator, denominator = k_str.split('/', 1)
+        # For fractions, show both: 1/fraction and reciprocal
+        return f"1/k = 1/{k_str} = {denominator}/{numerator}"
+    # For whole numbers, just show 1/k directly
+    return f"1/k = 1/{k_str}"
+
+
+def column_names(tableau):
+    return ["B.V"] + tableau.columns + ["RHS"]
+
+
+def display_rows(tableau, label=str):
+    """Tableau rows led by their basis label; cells stay numeric"""
+    return [[label(tableau.label(i))] + list(row) for i, row in enumerate(tableau.rows)]
+
+
+def ratio_cell(rhs, pivot, ratio):
+    """``rhs/pivot = ratio``, with ÷ when either side is already a fraction"""
+    rhs_display = format_number(rhs)
+    pivot_display = format_number(pivot)
+    sep = " ÷ " if '/' in rhs_display or '/' in pivot_display else "/"
+    cell = f"{rhs_display}{sep}{pivot_display} = {format_number(ratio)}"
+    if ratio != int(ratio):
+        cell += f" ({float(ratio):.2f})"
+    return cell
+
+
+def ratio_table(tableau, col, label=str):
+    """Rows with a Ratio column, plus the leaving row for ``col`` and its pivot element k"""
+    ratios = tableau.ratios(col)
+    row = tableau.leaving(col, ratios)
+    k = tableau.rows[row][col] if row is not None else None
+
+    table = []
+    for i, cells in enumerate(display_rows(tableau, label)):
+        if i < tableau.num_rows:
+            r = ratios[i]
+            extra = ratio_cell(cells[-1], cells[col + 1], r) if r is not None else "—"
+        else:
+            extra = reciprocal_display(k) if k is not None else "1/k = —"
+        table.append(cells + [extra])
+    return table, row, k
+
+
+def pivot_operations(tableau, row, col, label=str):
+    """Row-operation lines for a pivot on (row, col), before it is applied"""
+    pivot_value = tableau.rows[row][col]
+    name = tableau.columns[col]
+    reciprocal = format_number(1 / pivot_value) if pivot_value != 0 else ""
+
+    pivot_label = label(tableau.label(row))
+    pivot_header = pivot_label + f"({reciprocal or '1/k'})→{name}"
+    factor = reciprocal or f"1/{format_number(pivot_value)}"
+    pivot_lines = []
+    pivot_results = []
+    for old in tableau.rows[row]:
+        result = old / pivot_value
+        pivot_lines.append(f"{format_number(old)}({factor}) = {format_number(result)}")
+        pivot_results.append(result)
+
+    other_rows = []
+    for i, cells in enumerate(tableau.rows):
+        if i == row:
+            continue
+        row_label = label(tableau.label(i)) if i < tableau.num_rows else "z"
+        p = cells[col]
+        header = row_label + " = " + row_label + f" - {name}(P " + row_label + ")"
+        lines = [
+            f"{format_number(old)} - {format_number(r)}({format_number(p)}) = {format_number(old - r * p)}"
+            for old, r in zip(cells, pivot_results)
+        ]
+        other_rows.append({'header': header, 'lines': lines})
+
+    return {
+        'solution1_header': pivot_header,
+        'solution1': pivot_lines,
+        'other_rows': other_rows[:-1],
+        'solution3_header': other_rows[-1]['header'],
+        'solution3': other_rows[-1]['lines'],
+    }
+
+
+def standard_constraint(i, text):
+    """Constraint ``i`` as an equation with its slack, surplus and artificial variables
+
+    The artificial variable is shown wherever Phase I needs one, and with
+    the sign that makes it nonnegative for the right-hand side as typed.
+    """
+    match = RELATION.search(text)
+    if match is None:
+        return text
+    try:
+        _, sense, rhs = parse_constraint(text)
+    except ParseError:
+        sense, rhs = RELATIONS[match.group()], 0
+    slack, artificial = slack_name(i), artificial_name(i)
+    if sense == "<=":
+        added = f"+ {slack}" if rhs >= 0 else f"+ {slack} - {artificial}"
+    elif sense == ">=":
+        added = f"- {slack}" if rhs <= 0 else f"- {slack} + {artificial}"
+    else:
+        added = f"+ {artificial}" if rhs >= 0 else f"- {artificial}"
+    return text[:match.start()] + added + " =" + text[match.end():]
+
+
+def standard_form(objective, constraints):
+    """Slack form of the problem as typed, one equation per line"""
+    std_obj = "Z - " + split_objective(objective)[1].replace("+", "-") + " = 0"
+    std_constraints = [standard_constraint(i, c) for i, c in enumerate(constraints)]
+    return "\n".join([std_obj] + std_constraints)
+
+
+def sensitivity_table(problem, tableau, numeric="fraction"):
+    """Sensitivity report regrouped as one row per constraint and one per variable"""
+    report = analyse(problem, tableau, numeric)
+    x = tableau.solution()
+    constraints = [
+        {'name': slack_name(i), 'rhs': problem.rhs[i], 'shadow_price': price, 'low': low, 'high': high}
+        for i, (price, (low, high)) in enumerate(zip(report['shadow_prices'], report['rhs_ranges']))
+    ]
+    variables = [
+        {'name': name, 'value': x[j], 'cost': problem.objective[j], 'reduced_cost': report['reduced_costs'][j],
+         'low': report['objective_ranges'][j][0], 'high': report['objective_ranges'][j][1]}
+        for j, name in enumerate(problem.variables)
+    ]
+    return {'constraints': constraints, 'variables': variables}
+
+
+def solution_steps(problem, numeric="fraction", label=str, budget=None):
+    """Column names and the list of steps from the initial tableau to the last pivot
+
+    The list form of :func:`stream_steps`, for callers that keep the steps.
+    """
+    names, stream = stream_steps(problem, numeric, label, budget)
+    return names, list(stream)
+
+
+def stream_steps(problem, numeric="fraction", label=str, budget=None):
+    """Column names and a generator of the steps, each built when it is reached
+
+    The starting tableau is built at once, so a problem that cannot be
+    solved raises here rather than from the generator.  Only the current
+    tableau is held between steps, so a caller that passes steps on as they
+    come (such as a streamed page) needs memory for one step at a time.
+    See :meth:`Walkthrough.steps` for the steps themselves.
+    """
+    walkthrough = Walkthrough(problem, numeric)
+    return walkthrough.names, walkthrough.steps(label=label, budget=budget)
+
+
+# Replaying starts from a stored tableau at most this many pivots back
+CHECKPOINT_EVERY = 20
+# Event that stands for finish_phase_one() in Walkthrough.events
+FINISH = "finish"
+
+
+class Walkthrough:
+    """A simplex run kept as its starting tableau and the pivots taken
+
+    Any iteration's steps are rebuilt on demand by replaying pivots from the
+    nearest checkpoint, a copy of the tableau kept every
+    :data:`CHECKPOINT_EVERY` pivots, so a long run holds a few tableaux
+    rather than one per step.  The run is recorded as far as it has been
+    walked: ``events`` holds ``(row, col)`` pivots and :data:`FINISH` where
+    Phase I ended, ``status`` is set once the run is over.  Instances may be
+    shared between threads.
+    """
+
+    def __init__(self, problem, numeric="fraction", checkpoint_every=CHECKPOINT_EVERY):
+        self.problem = problem
+        self.numeric = numeric
+        self.checkpoint_every = checkpoint_every
+        tableau = standard_tableau(problem, numeric)
+        self.names = column_names(tableau)
+        self.events = []
+        self.pivots = []              # event index of each pivot, by iteration - 1
+        self.checkpoints = {0: tableau}
+        self.status = None
+        self._lock = threading.Lock()
+
+    @property
+    def iterations(self):
+        """Pivots recorded so far"""
+        return len(self.pivots)
+
+    def has_more(self, last):
+        """True when the steps of the run may go on past those of iteration ``last``
+
+        Only what has been walked so far is known, so this is also True when
+        the run is merely not recorded that far yet.
+        """
+        with self._lock:
+            recorded, status = len(self.pivots), self.status
+        return recorded > last or recorded == last and status not in (OPTIMAL, INFEASIBLE)
+
+    def _record(self, position, event, tableau):
+        """Note that ``event`` is the one applied at ``position``; keep a checkpoint after it if due"""
+        with self._lock:
+            if position < len(self.events):
+                return
+            self.events.append(event)
+            if event != FINISH:
+                self.pivots.append(position)
+                if len(self.pivots) % self.checkpoint_every == 0:
+                    self.checkpoints[position + 1] = tableau.copy()
+
+    def _finish(self, status):
+        with self._lock:
+            self.status = status
+
+    def _replay(self, position):
+        """A fresh tableau with the first ``position`` events applied"""
+        with self._lock:
+            start = max(p for p in self.checkpoints if p <= position)
+            tableau = self.checkpoints[start].copy()
+            events = self.events[start:position]
+        for event in events:
+            if event == FINISH:
+                finish_phase_one(tableau)
+            else:
+                tableau.pivot(*event)
+        return tableau
+
+    def _start(self, iteration, budget=None):
+        """(tableau, events applied) just before the pivot column of ``iteration``
+
+        Pivots not recorded yet are taken without building any step.  None
+        when the run ends (or ``budget`` runs out) before ``iteration``.
+        """
+        if iteration <= 1:
+            return self._replay(0), 0
+        with self._lock:
+            recorded = len(self.pivots)
+        if iteration <= recorded:
+            position = self.pivots[iteration - 1]
+            return self._replay(position), position
+        position = self.pivots[-1] + 1 if recorded else 0
+        tableau = self._replay(position)
+        done = recorded
+        while True:
+            if tableau.is_optimal():
+                if tableau.phase_one is None:
+                    self._finish(OPTIMAL)
+                    return None
+                status, _ = finish_phase_one(tableau)
+                self._record(position, FINISH, tableau)
+                position += 1
+                if status == INFEASIBLE:
+                    self._finish(INFEASIBLE)
+                    return None
+                continue
+            if done + 1 == iteration:
+                return tableau, position
+            if budget is not None and budget.check(done) is not None:
+                return None
+            col = tableau.entering()
+            row = tableau.leaving(col)
+            if row is None:
+                self._finish(UNBOUNDED)
+                return None
+            tableau.pivot(row, col)
+            self._record(position, (row, col), tableau)
+            position += 1
+            done += 1
+
+    def _walk(self, first=1, last=None, budget=None):
+        """Generator of ``(event, tableau, data)`` for iterations ``first`` to ``last``
+
+        Events are ``start`` (before iteration 1), ``pivot`` (with the
+        ``iteration``, ``col`` and ``row``, before the pivot is applied; a
+        None ``row`` means unbounded), ``pivoted``, ``phase_two``,
+        ``infeasible`` (with the Phase I ``value``), ``optimal`` and
+        ``limit_reached`` (with ``status`` and ``iterations``).  ``tableau``
+        is the live tableau: a consumer reads it before asking for the next
+        event.
+        """
+        start = self._start(first, budget)
+        if start is None:
+            return
+        tableau, position = start
+        iteration = max(first, 1)
+        if iteration == 1:
+            yield 'start', tableau, {}
+        while True:
+            if tableau.is_optimal():
+                if tableau.phase_one is None:
+                    self._finish(OPTIMAL)
+                    yield 'optimal', tableau, {}
+                    return
+                value = tableau.value
+                status, _ = finish_phase_one(tableau)
+                self._record(position, FINISH, tableau)
+                position += 1
+                if status == INFEASIBLE:
+                    self._finish(INFEASIBLE)
+                    yield 'infeasible', tableau, {'value': value}
+                    return
+                yield 'phase_two', tableau, {}
+                continue
+            if last is not None and iteration > last:
+                return
+            status = budget.check(iteration - 1) if budget is not None else None
+            if status is not None:
+                yield 'limit_reached', tableau, {'status': status, 'iterations': iteration - 1}
+                return
+            col = tableau.entering()
+            row = tableau.leaving(col)
+            yield 'pivot', tableau, {'iteration': iteration, 'col': col, 'row': row}
+            # No valid pivot row: the problem is unbounded
+            if row is None:
+                self._finish(UNBOUNDED)
+                return
+            tableau.pivot(row, col)
+            self._record(position, (row, col), tableau)
+            position += 1
+            yield 'pivoted', tableau, {'iteration': iteration}
+            iteration += 1
+
+    def steps(self, first=1, last=None, label=str, budget=None):
+        """Generator of the steps of iterations ``first`` to ``last`` (to the end by default)
+
+        Steps are dicts with a ``type`` and its ``data``.  Iteration 1 is
+        preceded by the ``initial_tableau`` step, and by a ``phase`` step for
+        Phase I when the problem needs artificial variables; Phase I ends
+        with a ``phase`` step showing the Phase II tableau, or with an
+        ``infeasible`` step.  An optimal run ends with a ``sensitivity`` step
+        (see :mod:`solver.sensitivity`).  When ``budget`` (a
+        :class:`~solver.simplex.Budget`, counting pivots from the start of the
+        run) runs out first, the steps end with a ``limit_reached`` step.
+
+        Steps whose columns differ from :attr:`names`, i.e. those after the
+        artificial columns are dropped, carry their own ``columns``.
+        """
+        names = self.names
+        current = None                # display rows of the tableau, while it is unchanged
+        for event, tableau, data in self._walk(first, last, budget):
+            step_columns = column_names(tableau) if len(tableau.columns) + 2 != len(names) else None
+
+            def step(step_type, data):
+                result = {'type': step_type, 'data': data}
+                if step_columns is not None:
+                    result['columns'] = step_columns
+                return result
+
+            if event == 'start':
+                current = display_rows(tableau, label)
+                if tableau.phase_one is not None:
+                    artificials = [tableau.columns[j] for j in tableau.phase_one[1]]
+                    yield step('phase', {'phase': 1, 'artificials': artificials})
+                yield step('initial_tableau', current)
+            elif event == 'optimal':
+                yield step('sensitivity', sensitivity_table(self.problem, tableau, self.numeric))
+            elif event == 'infeasible':
+                yield step('infeasible', data)
+            elif event == 'phase_two':
+                current = display_rows(tableau, label)
+                yield step('phase', {'phase': 2, 'tableau': current, 'has_negative_in_z': not tableau.is_optimal()})
+            elif event == 'limit_reached':
+                yield step('limit_reached', data)
+            elif event == 'pivot':
+                iteration, col = data['iteration'], data['col']
+                if current is None:
+                    current = display_rows(tableau, label)
+                yield step('pivot_column', {'tableau': current, 'pivot_index': col + 1, 'iteration': iteration})
+                table, row, k = ratio_table(tableau, col, label)
+                yield step('pivot_row', {
+                    'tableau_with_ratios': table,
+                    'pivot_index': col + 1,
+                    'pivot_row_index': row,
+                    'pivot_element': k,
+                    'iteration': iteration
+                })
+                if row is not None:
+                    operations = pivot_operations(tableau, row, col, label)
+                    operations['iteration'] = iteration
+                    yield step('pivot_operations', operations)
+            elif event == 'pivoted':
+                current = display_rows(tableau, label)
+                data = {
+                    'tableau': current,
+                    'has_negative_in_z': not tableau.is_optimal(),
+                    'iteration_count': data['iteration'] + 1
+                }
+                if tableau.phase_one is not None:
+                    data['phase'] = 1
+                yield step('new_tableau', data)
+
+    def compact(self, budget=None):
+        """The whole run as plain JSON data, for the browser to lay out itself
+
+        Returns ``{"columns": [...], "steps": [...]}``.  Each tableau is sent
+        once, as a ``tableau`` step with its row ``labels`` and formatted
+        ``rows`` (and ``columns`` when they differ from the first ones).  A
+        ``pivot`` step between two tableaux gives the ``iteration``, the
+        pivot ``col`` and ``row`` (None when unbounded), the ``ratios`` per
+        constraint row and the pivot ``element`` and its ``reciprocal``;
+        ratio tables and row operations follow from those.  The other
+        steps are ``phase`` (1 with its ``artificials``, or 2), ``infeasible``,
+        ``optimal`` (with the ``sensitivity`` table) and ``limit_reached``.
+        """
+        names = self.names
+        steps = []
+
+        def snapshot(tableau, **extra):
+            entry = {
+                'type': 'tableau',
+                'labels': [tableau.label(i) for i in range(len(tableau.rows))],
+                'rows': [[format_number(v) for v in row] for row in tableau.rows],
+            }
+            if len(tableau.columns) + 2 != len(names):
+                entry['columns'] = column_names(tableau)
+            entry.update(extra)
+            return entry
+
+        for event, tableau, data in self._walk(budget=budget):
+            if event == 'start':
+                if tableau.phase_one is not None:
+                    steps.append({'type': 'phase', 'phase': 1,
+                                  'artificials': [tableau.columns[j] for j in tableau.phase_one[1]]})
+                steps.append(snapshot(tableau))
+            elif event == 'pivot':
+                col, row = data['col'], data['row']
+                k = tableau.rows[row][col] if row is not None else None
+                steps.append({
+                    'type': 'pivot',
+                    'iteration': data['iteration'],
+                    'col': col,
+                    'row': row,
+                    'ratios': [None if r is None else format_number(r) for r in tableau.ratios(col)],
+                    'element': None if k is None else format_number(k),
+                    'reciprocal': None if k is None else format_number(1 / k),
+                })
+            elif event == 'pivoted':
+                steps.append(snapshot(tableau, phase=1) if tableau.phase_one is not None else snapshot(tableau))
+            elif event == 'phase_two':
+                steps.append({'type': 'phase', 'phase': 2})
+                steps.append(snapshot(tableau))
+            elif event == 'optimal':
+                table = sensitivity_table(self.problem, tableau, self.numeric)
+                for rows in table.values():
+                    for row in rows:
+                        row.update((key, None if v is None else format_number(v))
+                                   for key, v in row.items() if key != 'name')
+                steps.append({'type': 'optimal', 'sensitivity': table})
+            else:
+                steps.append(dict(data, type=event))
+        return {'columns': names, 'steps': steps}
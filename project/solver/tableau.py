@@ -0,0 +1,191 @@
+"""Dense simplex tableau for problems of any size.
+
+Rows hold the constraint rows followed by the z-row; the last column is the
+RHS.  Pivoting keeps the semantics of the original two-constraint solver: the
+pivot row is normalised, every other row is reduced by a multiple of it, and
+the pivot row is moved to the top so the entering variable is listed first.
+"""
+
+from .numeric import to_number
+
+SUBSCRIPTS = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
+
+
+def slack_name(i):
+    """Name of the slack for constraint ``i`` (0-based), e.g. S₁"""
+    return "S" + str(i + 1).translate(SUBSCRIPTS)
+
+
+def artificial_name(i):
+    """Name of the Phase I artificial variable for constraint ``i`` (0-based), e.g. A₁"""
+    return "A" + str(i + 1).translate(SUBSCRIPTS)
+
+
+class Tableau:
+    """Simplex tableau with one basic variable per constraint row"""
+
+    # z-row entries and pivots no further than this from zero count as zero
+    tolerance = 0
+    # (phase-two costs, artificial columns) while the z-row is the Phase I one
+    phase_one = None
+
+    def __init__(self, rows, basis, columns):
+        self.rows = rows          # m constraint rows + z-row, RHS last
+        self.basis = basis        # column index of the basic variable of each row
+        self.columns = columns    # variable names, one per non-RHS column
+
+    @classmethod
+    def from_standard(cls, objective, constraints, rhs, variables=None, numeric="fraction"):
+        """Build the slack-basis tableau for ``max c·x`` s.t. ``A x <= b``
+
+        ``numeric`` selects exact ``"fraction"``, ``"float"`` or NumPy
+        ``"float64"`` arithmetic for the whole solve.
+        """
+        m = len(constraints)
+        n = len(objective)
+        if variables is None:
+            variables = [f"x{j + 1}" for j in range(n)]
+        zero = to_number(0, numeric)
+        one = to_number(1, numeric)
+        rows = []
+        for i, (coefficients, b) in enumerate(zip(constraints, rhs)):
+            if len(coefficients) != n:
+                raise ValueError(f"constraint {i + 1} has {len(coefficients)} coefficients, expected {n}")
+            slack = [zero] * m
+            slack[i] = one
+            rows.append([to_number(a, numeric) for a in coefficients] + slack + [to_number(b, numeric)])
+        rows.append([-to_number(c, numeric) for c in objective] + [zero] * m + [zero])
+        columns = list(variables) + [slack_name(i) for i in range(m)]
+        if numeric == "float64":
+            from .kernels import ArrayTableau
+            return ArrayTableau.from_rows(rows, list(range(n, n + m)), columns)
+        return cls(rows, list(range(n, n + m)), columns)
+
+    @property
+    def num_rows(self):
+        return len(self.rows) - 1
+
+    @property
+    def z_row(self):
+        return self.rows[-1]
+
+    @property
+    def value(self):
+        return self.rows[-1][-1]
+
+    def label(self, i):
+        """Name of the basic variable of row ``i`` (the z-row is labelled z)"""
+        if i == len(self.rows) - 1:
+            return "z"
+        return self.columns[self.basis[i]]
+
+    def is_optimal(self):
+        """True when no entry of the z-row is negative"""
+        tolerance = -self.tolerance
+        return not any(v < tolerance for v in self.rows[-1][:-1])
+
+    def entering(self):
+        """Column with the most negative z-row entry (first on ties)"""
+        z_row = self.rows[-1]
+        best = 0
+        for j in range(1, len(z_row) - 1):
+            if z_row[j] < z_row[best]:
+                best = j
+        return best
+
+    def basic_values(self):
+        """Right-hand side of each constraint row, i.e. the values of the basic variables"""
+        return [row[-1] for row in self.rows[:-1]]
+
+    def reduced_costs(self):
+        """Nonzero z-row entries as {column: value}; read-only for the caller"""
+        return {j: v for j, v in enumerate(self.rows[-1][:-1]) if v}
+
+    def row_entries(self, row):
+        """Nonzero entries of constraint row ``row`` as {column: value}, RHS excluded"""
+        return {j: v for j, v in enumerate(self.rows[row][:-1]) if v}
+
+    def column_entries(self, col):
+        """Nonzero entries of column ``col`` as {row: value}, z-row excluded"""
+        return {i: row[col] for i, row in enumerate(self.rows[:-1]) if row[col]}
+
+    def column_dots(self, col, cols):
+        """Dot product of column ``col`` with each of ``cols``, as {column: value}"""
+        d = self.column_entries(col)
+        rows = self.rows
+        return {j: sum(rows[i][j] * v for i, v in d.items()) for j in cols}
+
+    def ratios(self, col):
+        """RHS / column ratio per constraint row, None where the entry is not positive"""
+        result = []
+        tolerance = self.tolerance
+        for row in self.rows[:-1]:
+            a = row[col]
+            result.append(row[-1] / a if a > tolerance else None)
+        return result
+
+    def leaving(self, col, ratios=None):
+        """Row with the smallest ratio (first on ties), or None if unbounded"""
+        if ratios is None:
+            ratios = self.ratios(col)
+        best = None
+        for i, r in enumerate(ratios):
+            if r is not None and (best is None or r < ratios[best]):
+                best = i
+        return best
+
+    def pivot(self, row, col):
+        """Pivot on (row, col) in place and move the pivot row to the top"""
+        rows = self.rows
+        pivot_row = rows[row]
+        k = pivot_row[col]
+        pivot_row = [v / k for v in pivot_row]
+        rows[row] = pivot_row
+        nonzero = [j for j, v in enumerate(pivot_row) if v != 0]
+        for i, other in enumerate(rows):
+            if i == row:
+                continue
+            factor = other[col]
+            if factor == 0:
+                continue
+            for j in nonzero:
+                other[j] = other[j] - pivot_row[j] * factor
+
+        rows.insert(0, rows.pop(row))
+        self.basis.insert(0, col)
+        del self.basis[row + 1]
+        return self
+
+    def set_objective(self, costs):
+        """Replace the z-row with the one for maximising ``costs·x`` from the current basis"""
+        rows = self.rows
+        z = [-c for c in costs] + [rows[-1][-1] * 0]
+        for row, j in zip(rows, self.basis):
+            cb = costs[j]
+            if cb:
+                for k, v in enumerate(row):
+                    if v:
+                        z[k] += cb * v
+        rows[-1] = z
+
+    def drop_columns(self, cols):
+        """Delete the nonbasic columns ``cols``; the columns after them move left"""
+        keep = [j for j in range(len(self.columns)) if j not in cols]
+        index = {j: k for k, j in enumerate(keep)}
+        self.rows = [[row[j] for j in keep] + [row[-1]] for row in self.rows]
+        self.basis = [index[j] for j in self.basis]
+        self.columns = [self.columns[j] for j in keep]
+
+    def solution(self):
+        """Values of every column at the current basic solution"""
+        # Multiplying by zero keeps the tableau's number type (Fraction or float)
+        values = [self.rows[-1][-1] * 0] * (len(self.rows[0]) - 1)
+        for i, j in enumerate(self.basis):
+            values[j] = self.rows[i][-1]
+        return values
+
+    def copy(self):
+        other = Tableau([list(row) for row in self.rows], list(self.basis), list(self.columns))
+        other.tolerance = self.tolerance
+        other.phase_one = self.phase_one
+        return other
@@ -0,0 +1,100 @@
+"""Re-solving a problem after a small change, from the basis of an earlier solve.
+
+A *delta* describes the change in the JSON form used by ``/api/resolve``::
+
+    {"rhs": {"1": 14},                      # constraint index (from 0) -> new right-hand side
+     "objective": {"y": 6},                 # variable name -> new cost, or a full list
+     "add_constraints": [{"coefficients": {"x": 1, "y": 1}, "sense": "<=", "rhs": 5}]}
+
+Every field is optional.  Constraints are only ever appended, so the slack
+names of an earlier basis still refer to the same rows.
+"""
+
+from .problem import SENSES, Problem, ProblemError
+from .simplex import solve
+
+DELTA_FIELDS = ("rhs", "objective", "add_constraints")
+
+
+def _index(key, size, what):
+    try:
+        i = int(key)
+    except (TypeError, ValueError):
+        raise ProblemError(f"{what} index {key!r} is not an integer") from None
+    if isinstance(key, bool) or not 0 <= i < size:
+        raise ProblemError(f"{what} index {key!r} is outside 0..{size - 1}")
+    return i
+
+
+def apply_delta(problem, delta):
+    """A new :class:`Problem`: ``problem`` with the changes in ``delta`` applied"""
+    if not isinstance(delta, dict):
+        raise ProblemError("delta must be a JSON object")
+    unknown = set(delta) - set(DELTA_FIELDS)
+    if unknown:
+        raise ProblemError(f"unknown delta field {sorted(unknown)[0]!r}; expected {DELTA_FIELDS}")
+    index = {name: j for j, name in enumerate(problem.variables)}
+
+    def column(name):
+        if name not in index:
+            raise ProblemError(f"unknown variable {name!r} in delta")
+        return index[name]
+
+    new_rhs = delta.get("rhs") or {}
+    costs = delta.get("objective") or {}
+    added_rows = delta.get("add_constraints") or []
+    if not isinstance(new_rhs, dict):
+        raise ProblemError("delta 'rhs' must be an object of constraint index: value")
+    if not isinstance(costs, (dict, list)):
+        raise ProblemError("delta 'objective' must be an object of variable: cost or a full list")
+    if not isinstance(added_rows, list):
+        raise ProblemError("delta 'add_constraints' must be a list")
+
+    rhs = list(problem.rhs)
+    for key, value in new_rhs.items():
+        rhs[_index(key, len(rhs), "rhs")] = value
+
+    objective = list(problem.objective)
+    if isinstance(costs, list):
+        objective = costs
+    else:
+        for name, value in costs.items():
+            objective[column(name)] = value
+
+    constraints = list(problem.constraints)
+    senses = list(problem.senses)
+    for added in added_rows:
+        if not isinstance(added, dict) or "coefficients" not in added or "rhs" not in added:
+            raise ProblemError("an added constraint needs 'coefficients' and 'rhs'")
+        coefficients, rhs_value = added["coefficients"], added["rhs"]
+        sense = added.get("sense", "<=")
+        if sense not in SENSES:
+            raise ProblemError(f"added constraint has unknown sense {sense!r}")
+        if isinstance(coefficients, dict):
+            coefficients = {column(name): a for name, a in coefficients.items()}
+        constraints.append(coefficients)
+        senses.append(sense)
+        rhs.append(rhs_value)
+
+    return Problem(objective, constraints, senses, rhs, direction=problem.direction, variables=problem.variables)
+
+
+def resolve(problem, previous, delta, compare=False, **options):
+    """Apply ``delta`` to ``problem`` and solve it warm from the ``previous`` result
+
+    Returns ``(new_problem, result)``; ``options`` are passed to
+    :func:`~solver.simplex.solve`.  With ``compare`` the changed problem is
+    also solved cold, and ``result["warm_start"]`` gets that solve's
+    iterations as ``baseline`` and, if the basis was installed,
+    ``pivots_saved``: the baseline less the warm iterations and the pivots
+    that installed the basis.
+    """
+    changed = apply_delta(problem, delta)
+    result = solve(changed, warm_start=previous, **options)
+    if compare:
+        cold = solve(changed, **dict(options, trace="none", sensitivity=False))
+        report = result["warm_start"]
+        report["baseline"] = cold["iterations"]
+        if report["installed"]:
+            report["pivots_saved"] = cold["iterations"] - result["iterations"] - report["basis_pivots"]
+    return changed, result
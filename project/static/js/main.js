@@ -0,0 +1,207 @@
+function addConstraint() {
+    const groups = document.querySelectorAll('.constraint-group');
+    const last = groups[groups.length - 1];
+    const group = last.cloneNode(true);
+    const index = groups.length + 1;
+    group.querySelector('label').textContent = 'Constraint ' + index;
+    const field = group.querySelector('textarea');
+    field.name = 'constraint' + index;
+    field.value = '';
+    last.after(group);
+}
+
+// Step Through: one request for the compact trace, then every view is built here
+const escapeHtml = value => String(value).replace(/[&<>"']/g, c => (
+    {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c]));
+
+function numberValue(text) {
+    const [numerator, denominator] = String(text).split('/');
+    return denominator === undefined ? Number(numerator) : Number(numerator) / Number(denominator);
+}
+
+function stepBox(icon, title, body) {
+    return '<div class="step-container"><div class="step-info info-box">' +
+        `<h3 class="step-header"><i class="fas ${icon}"></i> ${title}</h3>${body}</div></div>`;
+}
+
+function tableHtml(names, tableau, marks = {}) {
+    let html = '<div class="table-container"><table><tr>';
+    names.forEach((name, j) => {
+        html += `<th${marks.col === j ? ' class="highlight-column"' : ''}>${escapeHtml(name)}</th>`;
+    });
+    html += marks.extra ? '<th>Ratio</th></tr>' : '</tr>';
+    tableau.rows.forEach((row, i) => {
+        html += '<tr>';
+        [`<b>${escapeHtml(tableau.labels[i])}</b>`].concat(row.map(escapeHtml)).forEach((cell, j) => {
+            const classes = [];
+            if (marks.col === j) classes.push('highlight-column');
+            if (marks.row === i) classes.push('highlight-row');
+            if (marks.col === j && marks.row === i) classes.push('pivot-cell');
+            html += `<td${classes.length ? ` class="${classes.join(' ')}"` : ''}>${cell}</td>`;
+        });
+        html += marks.extra ? `<td>${escapeHtml(marks.extra[i])}</td></tr>` : '</tr>';
+    });
+    return html + '</table></div>';
+}
+
+function ratioCells(tableau, pivot) {
+    const cells = pivot.ratios.map((ratio, i) => {
+        if (ratio === null) return '—';
+        const rhs = tableau.rows[i][tableau.rows[i].length - 1];
+        const entry = tableau.rows[i][pivot.col];
+        const sep = rhs.includes('/') || entry.includes('/') ? ' ÷ ' : '/';
+        const value = numberValue(ratio);
+        return `${rhs}${sep}${entry} = ${ratio}` + (Number.isInteger(value) ? '' : ` (${value.toFixed(2)})`);
+    });
+    const k = pivot.element;
+    if (k === null) {
+        cells.push('1/k = —');
+    } else if (k.includes('/')) {
+        const [numerator, denominator] = k.split('/');
+        cells.push(`1/k = 1/${k} = ${denominator}/${numerator}`);
+    } else {
+        cells.push(`1/k = 1/${k}`);
+    }
+    return cells;
+}
+
+function operationsHtml(names, before, after, pivot) {
+    const r = pivot.row, c = pivot.col, name = escapeHtml(names[c + 1]);
+    const last = before.rows.length - 1;
+    const label = i => `<b>${escapeHtml(before.labels[i])}</b>`;
+    // The pivot row moves to the top; the other rows keep their order below it
+    const moved = i => (i === last || i > r ? i : i + 1);
+    const factor = escapeHtml(pivot.reciprocal);
+    let html = `<p>${label(r)}(${factor})→${name}</p><ul>`;
+    before.rows[r].forEach((old, j) => {
+        html += `<li>${escapeHtml(old)}(${factor}) = ${escapeHtml(after.rows[0][j])}</li>`;
+    });
+    html += '</ul>';
+    before.rows.forEach((row, i) => {
+        if (i === r) return;
+        const p = escapeHtml(row[c]);
+        html += `<p>${label(i)} = ${label(i)} - ${name}(P ${label(i)})</p><ul>`;
+        row.forEach((old, j) => {
+            html += `<li>${escapeHtml(old)} - ${escapeHtml(after.rows[0][j])}(${p}) = ` +
+                `${escapeHtml(after.rows[moved(i)][j])}</li>`;
+        });
+        html += '</ul>';
+    });
+    return html;
+}
+
+function sensitivityHtml(table) {
+    const range = row => `[${row.low === null ? '-∞' : escapeHtml(row.low)}, ` +
+        `${row.high === null ? '∞' : escapeHtml(row.high)}]`;
+    let html = '<div class="table-container"><table><tr><th>Constraint</th><th>RHS</th>' +
+        '<th>Shadow price</th><th>RHS range</th></tr>';
+    table.constraints.forEach(row => {
+        html += `<tr><td>${escapeHtml(row.name)}</td><td>${escapeHtml(row.rhs)}</td>` +
+            `<td>${escapeHtml(row.shadow_price)}</td><td>${range(row)}</td></tr>`;
+    });
+    html += '</table></div><div class="table-container"><table><tr><th>Variable</th><th>Value</th>' +
+        '<th>Reduced cost</th><th>Cost</th><th>Cost range</th></tr>';
+    table.variables.forEach(row => {
+        html += `<tr><td>${escapeHtml(row.name)}</td><td>${escapeHtml(row.value)}</td>` +
+            `<td>${escapeHtml(row.reduced_cost)}</td><td>${escapeHtml(row.cost)}</td><td>${range(row)}</td></tr>`;
+    });
+    return html + '</table></div>';
+}
+
+function traceViews(trace) {
+    const views = [];
+    let names = trace.columns, tableau = null, pivot = null, count = 1;
+    trace.steps.forEach(step => {
+        if (step.type === 'tableau') {
+            const stepNames = step.columns || trace.columns;
+            if (pivot) {
+                views.push(stepBox('fa-calculator', `Iteration ${pivot.iteration}: Row Operations`,
+                    operationsHtml(names, tableau, step, pivot)));
+                count = pivot.iteration + 1;
+            }
+            const title = tableau === null ? 'Initial Tableau' : (pivot ? `Tableau ${count}` : 'Phase II Tableau');
+            views.push(stepBox('fa-table', title, tableHtml(stepNames, step)));
+            names = stepNames;
+            tableau = step;
+            pivot = null;
+        } else if (step.type === 'pivot') {
+            pivot = step;
+            views.push(stepBox('fa-arrows-alt-v', `Iteration ${step.iteration}: Pivot Column`,
+                '<p>The most negative entry of the z row picks the entering column.</p>' +
+                tableHtml(names, tableau, {col: step.col + 1})));
+            const unbounded = step.row === null
+                ? '<p>No entry of the pivot column is positive, so the problem is unbounded.</p>' : '';
+            views.push(stepBox('fa-arrows-alt-h', `Iteration ${step.iteration}: Pivot Row`,
+                '<p>The smallest ratio picks the leaving row.</p>' + unbounded +
+                tableHtml(names, tableau, {col: step.col + 1, row: step.row, extra: ratioCells(tableau, step)})));
+        } else if (step.type === 'phase') {
+            views.push(stepBox(step.phase === 1 ? 'fa-flag' : 'fa-flag-checkered', `Phase ${step.phase === 1 ? 'I' : 'II'}`,
+                step.phase === 1
+                    ? `<p>Artificial variables ${step.artificials.map(escapeHtml).join(', ')} give a feasible start; ` +
+                      'Phase I drives them to zero.</p>'
+                    : '<p>All artificial variables are zero. Their columns are dropped and the z row is ' +
+                      'rebuilt from the original objective.</p>'));
+        } else if (step.type === 'optimal') {
+            views.push(stepBox('fa-check-circle', 'Optimal Solution Reached',
+                '<p>No negative entry in the z row: the current solution is optimal.</p>' +
+                sensitivityHtml(step.sensitivity)));
+        } else if (step.type === 'infeasible') {
+            views.push(stepBox('fa-ban', 'No Feasible Solution',
+                `<p>Phase I is optimal but the artificial variables cannot all be zero (z = ${escapeHtml(step.value)}).</p>`));
+        } else if (step.type === 'limit_reached') {
+            views.push(stepBox('fa-hourglass-end', 'Stopped Before the Optimum',
+                `<p>The solve stopped (${escapeHtml(step.status)}) after ${step.iterations} pivots.</p>`));
+        }
+    });
+    return views;
+}
+
+function showViews(views, index) {
+    const section = document.querySelector('.results-section');
+    const nav = '<div class="action-buttons">' +
+        `<button type="button" class="btn" data-go="${index - 1}" ${index === 0 ? 'disabled' : ''}>` +
+        '<i class="fas fa-chevron-left"></i>Previous</button>' +
+        `<span>Step ${index + 1} of ${views.length}</span>` +
+        `<button type="button" class="btn btn-primary" data-go="${index + 1}" ${index === views.length - 1 ? 'disabled' : ''}>` +
+        'Next<i class="fas fa-chevron-right"></i></button>' +
+        `<button type="button" class="btn" data-go="all">Show All</button></div>`;
+    section.innerHTML = index === 'all' ? views.join('') : views[index] + nav;
+    section.querySelectorAll('[data-go]').forEach(button => {
+        button.onclick = () => showViews(views, button.dataset.go === 'all' ? 'all' : Number(button.dataset.go));
+    });
+}
+
+function showError(message) {
+    document.querySelector('.results-section').innerHTML = '<div class="iteration-info info-box">' +
+        `<h4><i class="fas fa-exclamation-triangle"></i> Invalid Problem</h4><p>${escapeHtml(message)}</p></div>`;
+}
+
+// url is the walkthrough API as the server routes it, so a mounted app still finds it
+async function stepThrough(form, url) {
+    const constraints = Array.from(form.querySelectorAll('textarea[name^="constraint"]'), field => field.value);
+    let trace;
+    try {
+        const response = await fetch(url, {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({objective: form.objective.value, constraints, numeric: form.numeric.value}),
+        });
+        const json = (response.headers.get('Content-Type') || '').includes('application/json');
+        trace = json ? await response.json() : null;
+        if (!response.ok || !trace) {
+            showError(trace && trace.error || `The server answered ${response.status} ${response.statusText}`);
+            return;
+        }
+    } catch (error) {
+        showError(`Could not get the walkthrough: ${error.message}`);
+        return;
+    }
+    showViews(traceViews(trace), 0);
+}
+
+window.onload = function () {
+    const resultBox = document.querySelector('.results-section');
+    if (resultBox) {
+        resultBox.scrollTop = resultBox.scrollHeight;
+    }
+};
@@ -0,0 +1,15 @@
+import os
+import sys
+
+import pytest
+
+# The app and the solver package are imported from the project directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def client():
+    from app import app
+
+    app.config["TESTING"] = True
+    return app.test_client()
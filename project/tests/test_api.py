@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+PROBLEM = {"objective": [3, 5], "constraints": [[1, 2], [3, 2]], "rhs": [6, 12]}
+
+
+def test_solve(client):
+    response = client.post("/api/solve", json=PROBLEM)
+    assert response.status_code == 200
+    assert response.json["status"] == "optimal"
+    assert response.json["objective"] == 16.5
+
+
+@pytest.mark.parametrize("patch", [
+    {"objective": 5},
+    {"constraints": 7},
+    {"senses": "<="},
+    {"rhs": {"0": 6}},
+    {"constraints": [5, 6]},
+    {"constraints": [[1, 2]]},
+    {"objective": ["abc", 1]},
+    {"objective": ["1e+99999", 1]},
+    {"objective": [float("nan"), 1]},
+    {"objective": [True, 1]},
+    {"variables": [["x"], "y"]},
+    {"senses": ["<", "<="]},
+    {"direction": "up"},
+])
+def test_malformed_problem(client, patch):
+    response = client.post("/api/solve", json=dict(PROBLEM, **patch))
+    assert response.status_code == 400
+    assert response.json["error"]
+
+
+def test_body_must_be_an_object(client):
+    assert client.post("/api/solve", json=[PROBLEM]).status_code == 400
+
+
+@pytest.fixture
+def one_pivot(client):
+    from app import app
+
+    saved = app.config["SOLVE_MAX_ITERATIONS"]
+    app.config["SOLVE_MAX_ITERATIONS"] = 1
+    yield client
+    app.config["SOLVE_MAX_ITERATIONS"] = saved
+
+
+@pytest.mark.parametrize("url", ["/api/solve", "/api/solve/batch"])
+def test_request_cannot_raise_the_limits(one_pivot, url):
+    body = dict(PROBLEM, max_iterations=10 ** 9, time_limit=10 ** 9)
+    response = one_pivot.post(url, json=body if url == "/api/solve" else [body])
+    assert response.status_code == 200
+    result = response.json if url == "/api/solve" else json.loads(response.data)
+    assert result["status"] == "iteration_limit"
+
+
+@pytest.mark.parametrize("limits", [
+    {"max_iterations": None},
+    {"time_limit": None},
+    {"max_iterations": 0},
+    {"time_limit": -1},
+    {"max_iterations": 2.5},
+    {"time_limit": "10"},
+])
+def test_limits_must_be_positive(client, limits):
+    response = client.post("/api/solve", json=dict(PROBLEM, **limits))
+    assert response.status_code == 400
+    assert "must be a positive" in response.json["error"]
+    line = json.loads(client.post("/api/solve/batch", json=[dict(PROBLEM, **limits)]).data)
+    assert line["status"] == "error"
+
+
+def test_lower_limit_is_kept(client):
+    response = client.post("/api/solve", json=dict(PROBLEM, max_iterations=1))
+    assert response.json["status"] == "iteration_limit"
@@ -0,0 +1,26 @@
+import re
+
+import pytest
+
+
+def asset_path(client, name):
+    page = client.get("/main").get_data(as_text=True)
+    return re.search(rf'"(/assets/{name}\.[0-9a-f]{{12}}\.css)"', page).group(1)
+
+
+@pytest.mark.parametrize("accept, encoding", [("br, gzip", "br"), ("gzip", "gzip"), ("", None)])
+def test_asset_encodings(client, accept, encoding):
+    if encoding == "br":
+        pytest.importorskip("brotli")
+    path = asset_path(client, "css/main")
+    response = client.get(path, headers={"Accept-Encoding": accept})
+    assert response.status_code == 200
+    assert response.content_encoding == encoding
+    assert "Accept-Encoding" in response.vary
+    assert response.cache_control.immutable
+    again = client.get(path, headers={"Accept-Encoding": accept, "If-None-Match": response.headers["ETag"]})
+    assert again.status_code == 304
+
+
+def test_stale_fingerprint_is_not_found(client):
+    assert client.get("/assets/css/main.000000000000.css").status_code == 404
@@ -0,0 +1,84 @@
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+from solver.batch import solve_item, solve_many
+from solver.cli import main
+
+GOOD = {"objective": [3, 5], "constraints": [[1, 2], [3, 2]], "rhs": [6, 12]}
+BAD_ITEMS = [
+    {"objective": 5, "constraints": [[1]], "rhs": [1]},
+    dict(GOOD, constraints=7),
+    [1, 2, 3],
+    "not json",
+    '"a string"',
+    dict(GOOD, trace="everything"),
+    {"objective": "max 3x", "constraints": "x <= 1"},
+]
+
+
+@pytest.mark.parametrize("data", BAD_ITEMS)
+def test_bad_item_becomes_an_error_result(data):
+    result = solve_item(7, data)
+    assert result["index"] == 7
+    assert result["status"] == "error"
+    assert result["error"]
+
+
+def test_text_item():
+    result = solve_item(0, {"objective": "max 3x + 5y", "constraints": ["x + 2y <= 6", "3x + 2y <= 12"]})
+    assert result["status"] == "optimal"
+
+
+def test_bad_items_do_not_cut_the_batch_short():
+    items = list(enumerate([GOOD] + BAD_ITEMS + [GOOD]))
+    with ThreadPoolExecutor(2) as executor:
+        results = list(solve_many(iter(items), executor, chunk_size=3))
+    assert sorted(r["index"] for r in results) == list(range(len(items)))
+    statuses = {r["index"]: r["status"] for r in results}
+    assert statuses[0] == statuses[len(items) - 1] == "optimal"
+
+
+class BrokenExecutor:
+    """Executor whose chunks all fail, as when a worker process dies"""
+
+    _max_workers = 1
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_exception(RuntimeError("worker died"))
+        return future
+
+
+def test_lost_chunk_reports_each_item():
+    results = list(solve_many(enumerate([GOOD] * 5), BrokenExecutor(), chunk_size=2))
+    assert sorted(r["index"] for r in results) == [0, 1, 2, 3, 4]
+    assert all(r["status"] == "error" and "worker died" in r["error"] for r in results)
+
+
+def test_batch_endpoint_streams_every_item(client):
+    body = "\n".join(json.dumps(item) if not isinstance(item, str) else item for item in [GOOD] + BAD_ITEMS)
+    response = client.post("/api/solve/batch", data=body, content_type="application/x-ndjson")
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert sorted(line["index"] for line in lines) == list(range(len(BAD_ITEMS) + 1))
+
+
+def test_cli_reports_bad_items(tmp_path, capsys):
+    path = tmp_path / "problems.json"
+    path.write_text(json.dumps([GOOD, BAD_ITEMS[0]]))
+    assert main([str(path), "--jobs", "1", "--output", "text"]) == 1
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith("0\toptimal")
+    assert lines[1].startswith("1\terror")
+
+
+@pytest.mark.parametrize("numeric, expected", [("fraction", "0\toptimal\t123/1000\t123/1000"),
+                                               ("float", "0\toptimal\t0.123\t0.123"),
+                                               ("float64", "0\toptimal\t0.123\t0.123")])
+def test_cli_text_output_keeps_values(tmp_path, capsys, numeric, expected):
+    path = tmp_path / "problems.json"
+    path.write_text(json.dumps({"objective": [1], "constraints": [[1]], "rhs": ["0.123"]}))
+    assert main([str(path), "--jobs", "1", "--output", "text", "--numeric", numeric]) == 0
+    assert capsys.readouterr().out.splitlines() == [expected]
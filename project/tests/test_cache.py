@@ -0,0 +1,39 @@
+import pytest
+
+from solver import Problem, solve
+from solver.cache import ResultCache, solve_cached
+
+
+@pytest.mark.parametrize("numeric", ["fraction", "float", "float64"])
+@pytest.mark.parametrize("problem", [
+    Problem([3, 5], [[1, 2], [3, 2]], ["<=", "<="], [6, 12], variables=["y", "x"]),
+    Problem([1, 1], [[1e-10, 2e-10]], ["<="], [3e-10]),
+    Problem([1, 1], [[1e-200, 1]], ["<="], [1e200]),
+    Problem([2, 1], [[2, 4], [1, 0]], ["<=", "<="], [10, 4]),
+])
+def test_cached_result_matches_uncached(problem, numeric):
+    expected = solve(problem, numeric=numeric, sensitivity=True)
+    cache = ResultCache()
+    for _ in range(2):
+        result = solve_cached(problem, cache, numeric=numeric, sensitivity=True)
+        for field in ("status", "x", "objective", "sensitivity"):
+            assert result.get(field) == expected.get(field)
+    assert cache.hits == 1
+
+
+def test_scaled_rows_share_an_entry():
+    cache = ResultCache()
+    solve_cached(Problem([1, 1], [[1, 2]], ["<="], [3]), cache)
+    result = solve_cached(Problem([1, 1], [["1/2", 1]], ["<="], ["3/2"]), cache)
+    assert cache.hits == 1
+    assert result["x"] == [3, 0]
+
+
+def test_extreme_scales_through_the_api(client):
+    response = client.post("/api/solve", json={"objective": [1, 1], "constraints": [[1e-200, 1]],
+                                               "rhs": [1e200], "numeric": "float"})
+    assert response.status_code == 200
+    response = client.post("/api/solve", json={"objective": [1, 1], "constraints": [[3e-200, 1]],
+                                               "rhs": [1e200]})
+    assert response.status_code == 200
+    assert response.json["x"][0] == "1" + "0" * 400 + "/3"
@@ -0,0 +1,39 @@
+from fractions import Fraction
+
+import pytest
+
+from solver.numeric import format_number, parse_fraction, to_number
+
+
+@pytest.mark.parametrize("value, text", [
+    (Fraction(5, 2), "5/2"),
+    (Fraction(-3), "-3"),
+    (7, "7"),
+    (2.0, "2"),
+    (-0.0, "0"),
+    (0.123, "0.123"),
+    (3.14159, "3.14159"),
+    (1234.5678, "1234.5678"),
+    (0.1 + 0.2, "0.3"),
+    (1e20, "1e+20"),
+    (float("inf"), "inf"),
+])
+def test_format_number(value, text):
+    assert format_number(value) == text
+
+
+def test_format_float64():
+    numpy = pytest.importorskip("numpy")
+    assert format_number(numpy.float64(0.123)) == "0.123"
+
+
+def test_to_number():
+    assert to_number("4/5") == Fraction(4, 5)
+    assert to_number(0.1) == Fraction(1, 10)
+    assert to_number("1.5", "float") == 1.5
+
+
+@pytest.mark.parametrize("text", ["1e+400", "1e-99999", "abc", "1" * 5000])
+def test_parse_fraction_rejects(text):
+    with pytest.raises(ValueError):
+        parse_fraction(text)
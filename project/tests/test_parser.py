@@ -0,0 +1,74 @@
+import time
+from fractions import Fraction
+
+import pytest
+
+from solver.parser import ParseError, parse_constraint, parse_linear, parse_problem
+
+
+def test_terms_on_both_sides():
+    assert parse_linear("x + 3 <= 2y") == ({"x": 1, "y": -2}, "<=", -3)
+
+
+def test_fractions_decimals_and_repeated_terms():
+    coefficients, sense, rhs = parse_constraint("2*x1 + 1/2 x2 - x1 + 0.25x2 >= -4")
+    assert coefficients == {"x1": 1, "x2": Fraction(3, 4)}
+    assert (sense, rhs) == (">=", -4)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("x < 5", "<="),
+    ("x > 5", ">="),
+    ("x =< 5", "<="),
+    ("x ≥ 5", ">="),
+    ("x == 5", "="),
+])
+def test_relations(text, expected):
+    assert parse_constraint(text)[1] == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("x <= 1e6", 1000000),
+    ("x <= 2.5E-3", Fraction(1, 400)),
+    ("x <= 1.5e+3", 1500),
+    ("x <= .5e1", 5),
+])
+def test_scientific_notation(text, expected):
+    assert parse_linear(text) == ({"x": 1}, "<=", expected)
+
+
+def test_exponent_then_name():
+    assert parse_linear("1.5e+3a + 2e1 x <= 0") == ({"a": 1500, "x": 20}, "<=", 0)
+
+
+def test_e_named_variables_need_a_separator():
+    assert parse_linear("3*e1 + 2 e2 + E <= 10") == ({"e1": 3, "e2": 2, "E": 1}, "<=", 10)
+    for text in ("3e1x + 2ex <= 1", "2E <= 1", "1.5e+a <= 1"):
+        with pytest.raises(ParseError, match="exponent"):
+            parse_linear(text)
+
+
+@pytest.mark.parametrize("text", ["x <= 1e400", "x <= 1e+4000000", "x <= 1e50000000", "x <= 1e-99999", "x <= 1" + "0" * 5000])
+def test_huge_numbers_fail_fast(text):
+    start = time.monotonic()
+    with pytest.raises(ParseError):
+        parse_linear(text)
+    assert time.monotonic() - start < 0.5
+
+
+@pytest.mark.parametrize("text", ["x +", "x <= 1 <= 2", "2 3x <= 1", "x / 0 <= 1", "1/0 x <= 1", "x <= 5 $"])
+def test_malformed(text):
+    with pytest.raises(ParseError):
+        parse_linear(text)
+
+
+def test_constraint_needs_relation():
+    with pytest.raises(ParseError):
+        parse_constraint("x + y")
+
+
+def test_problem_variables_in_natural_order():
+    problem = parse_problem("min 2x10 + x2", ["x2 + x10 >= 1"])
+    assert problem.variables == ["x2", "x10"]
+    assert problem.direction == "min"
+    assert problem.objective == [1, 2]
@@ -0,0 +1,72 @@
+import base64
+
+import pytest
+
+from solver.parser import parse_problem
+from solver.permalink import PermalinkError, decode_problem, encode_problem, problem_text
+
+
+def code_of(text):
+    return base64.urlsafe_b64encode(text.encode()).decode().rstrip("=")
+
+
+@pytest.mark.parametrize("objective, constraints", [
+    ("max 3x + 5y", ["x + 2y <= 6", "3x + 2y <= 12"]),
+    ("min Z = 2a - b", ["-a + b >= -1/2", "a + e1 = 3", "2.5 b <= 7"]),
+    ("max 3*e1 + 1/2 E", ["2 e1 + 5/2*E <= 1e3"]),
+    ("maximize 0x", ["x <= 1"]),
+])
+def test_round_trip(objective, constraints):
+    problem = parse_problem(objective, constraints)
+    code = encode_problem(problem)
+    decoded = decode_problem(code)
+    assert encode_problem(decoded) == code
+    assert problem_text(decoded) == problem_text(problem)
+
+
+def test_spelling_does_not_change_the_code():
+    first = parse_problem("max 3x + 5y", ["x + 2y <= 6", "3x + 2y <= 12"])
+    second = parse_problem("max: 5y+3x", ["2y + x <= 6", "3x + 3y - y <= 12"])
+    assert encode_problem(first) == encode_problem(second)
+
+
+@pytest.mark.parametrize("code", ["", "_w", code_of("max 3x")])
+def test_bad_codes(code):
+    with pytest.raises(PermalinkError):
+        decode_problem(code)
+
+
+@pytest.fixture
+def permalink(client):
+    problem = parse_problem("max 3x + 5y", ["x + 2y <= 6", "3x + 2y <= 12"])
+    return "/p/" + encode_problem(problem)
+
+
+def test_page_is_cacheable(client, permalink):
+    response = client.get(permalink)
+    assert response.status_code == 200
+    assert response.cache_control.public and response.cache_control.max_age
+    again = client.get(permalink, headers={"If-None-Match": response.headers["ETag"]})
+    assert again.status_code == 304
+    assert client.get(permalink).data == response.data
+
+
+def test_non_canonical_urls_redirect(client, permalink):
+    response = client.get(permalink + "?trace=full&numeric=fraction")
+    assert response.status_code == 301
+    assert response.headers["Location"] == permalink
+    response = client.get("/p/" + code_of("max:5y+3x;2y+x<=6;3x+2y<=12"))
+    assert response.headers["Location"] == permalink
+
+
+def test_canonical_url_under_a_script_prefix(client, permalink):
+    response = client.get(permalink, base_url="http://localhost/solver/")
+    assert response.status_code == 200
+    assert f'href="/solver{permalink}"' in response.get_data(as_text=True)
+    response = client.get(permalink + "?trace=full", base_url="http://localhost/solver/")
+    assert response.status_code == 301
+    assert response.headers["Location"] == "/solver" + permalink
+
+
+def test_unknown_code_is_not_found(client):
+    assert client.get("/p/_w").status_code == 404
@@ -0,0 +1,139 @@
+import gzip
+import time
+from fractions import Fraction
+
+import pytest
+
+from solver import FormatError, read_lp, read_model, read_mps, solve
+
+MPS = """\
+NAME          EXAMPLE
+OBJSENSE
+    MAX
+ROWS
+ N  profit
+ L  wood
+ G  demand
+ E  mix
+COLUMNS
+    x  profit  3  wood  1
+    x  mix  1
+    y  profit  5  wood  2
+    y  demand  1  mix  -1
+RHS
+    rhs  wood  8  demand  1
+    rhs  mix  0
+RANGES
+    rng  wood  6  mix  2
+BOUNDS
+ UP bnd  x  3
+ LO bnd  y  1/2
+ENDATA
+"""
+
+
+def lines(text):
+    return text.splitlines(keepends=True)
+
+
+def rows(problem):
+    return [(dict(problem.row_items(i)), sense, b)
+            for i, (sense, b) in enumerate(zip(problem.senses, problem.rhs))]
+
+
+def test_mps_ranges_and_bounds():
+    problem = read_mps(lines(MPS))
+    assert problem.direction == "max"
+    assert problem.variables == ["x", "y"]
+    assert problem.objective == [3, 5]
+    assert rows(problem) == [
+        ({0: 1, 1: 2}, "<=", 8),
+        ({1: 1}, ">=", 1),
+        ({0: 1, 1: -1}, ">=", 0),     # E row with a positive range: 0 <= x - y <= 2
+        ({0: 1, 1: 2}, ">=", 2),      # L row ranged below: 8 - 6
+        ({0: 1, 1: -1}, "<=", 2),
+        ({0: 1}, "<=", 3),            # UP x 3
+        ({1: 1}, ">=", Fraction(1, 2)),  # LO y 1/2
+    ]
+    result = solve(problem)
+    assert result["x"] == [3, Fraction(5, 2)]
+    assert result["objective"] == Fraction(43, 2)
+
+
+@pytest.mark.parametrize("text, message", [
+    ("ROWS\n N obj\nCOLUMNS\n x obj 1e200000000\nENDATA\n", "out of range"),
+    ("ROWS\n N obj\nCOLUMNS\n x obj abc\nENDATA\n", "not a number"),
+    ("ROWS\n N obj\nCOLUMNS\n x nothere 1\nENDATA\n", "unknown row"),
+    ("ROWS\n Q obj\nENDATA\n", "unknown row type"),
+    ("WHATEVER\n", "unknown section"),
+    (" x obj 1\n", "outside a section"),
+    ("ROWS\n N obj\nCOLUMNS\n x obj 1\nBOUNDS\n XX bnd x 1\nENDATA\n", "unknown bound type"),
+    ("ROWS\n N obj\nCOLUMNS\n x obj 1\nBOUNDS\n MI bnd x\nENDATA\n", "lower bound"),
+])
+def test_malformed_mps(text, message):
+    start = time.monotonic()
+    with pytest.raises(FormatError, match=message):
+        read_mps(lines(text))
+    assert time.monotonic() - start < 1
+
+
+def test_mps_huge_rhs_exponent():
+    text = "ROWS\n N obj\n L c\nCOLUMNS\n x obj 1 c 1\nRHS\n rhs c 1e200000000\nENDATA\n"
+    start = time.monotonic()
+    with pytest.raises(FormatError, match="line 7"):
+        read_mps(lines(text))
+    assert time.monotonic() - start < 1
+
+
+LP = """\
+\\ a comment line
+Maximize
+ obj: 3 x
+   + 5 y
+Subject To
+ wood: x + 2 y
+   <= 8
+ demand: y
+   >= 1
+ c3: x - y <= 2 \\ trailing comment
+Bounds
+ x <= 3
+ 0.5 <= y
+End
+"""
+
+
+def test_lp_continuation_lines():
+    problem = read_lp(lines(LP))
+    assert problem.direction == "max"
+    assert problem.objective == [3, 5]
+    assert rows(problem) == [
+        ({0: 1, 1: 2}, "<=", 8),
+        ({1: 1}, ">=", 1),
+        ({0: 1, 1: -1}, "<=", 2),
+        ({0: 1}, "<=", 3),
+        ({1: 1}, ">=", Fraction(1, 2)),
+    ]
+    assert solve(problem)["x"] == [3, Fraction(5, 2)]
+
+
+@pytest.mark.parametrize("text, message", [
+    ("Subject To\n x <= 1\nEnd\n", "Maximize or Minimize"),
+    ("Maximize\n x\nSubject To\n c1: x + y\n c2: x <= 1\nEnd\n", "no relation"),
+    ("Maximize\n x <= 3\nSubject To\n x <= 1\nEnd\n", "relation"),
+    ("Maximize\n x\nSubject To\n x <= 1e+99999\nEnd\n", "line 4"),
+    ("Maximize\n x\nSubject To\n x <= 1\nBounds\n x ?? 3\nEnd\n", "bound"),
+    ("Maximize\n x\nSubject To\n x <= 1\nBounds\n x >= -1\nEnd\n", "lower bound"),
+])
+def test_malformed_lp(text, message):
+    with pytest.raises(FormatError, match=message):
+        read_lp(lines(text))
+
+
+def test_read_model_gzip(tmp_path):
+    path = tmp_path / "model.lp.gz"
+    with gzip.open(path, "wt") as f:
+        f.write(LP)
+    assert read_model(str(path)).objective == [3, 5]
+    with pytest.raises(FormatError, match="model format"):
+        read_model(str(tmp_path / "model.txt"))
@@ -0,0 +1,38 @@
+from fractions import Fraction
+
+import pytest
+
+from solver import Problem, solve
+
+PROBLEMS = [
+    Problem([1, 1], [[1e-10, 2e-10]], ["<="], [3e-10]),
+    Problem([3e-12, 5e-12], [[1e-12, 2e-12], [3e-12, 2e-12]], ["<=", "<="], [6e-12, 12e-12]),
+    Problem([2, 3], [[1e-9, 1e-9], [1, 3], [4e-11, 1e-11]], ["<=", ">=", "<="], [4e-9, 6, 12e-11],
+            direction="min"),
+    Problem([1, 2], [[1e-11, 1e-11], [1, -1]], ["=", "<="], [1e-11, 0]),
+]
+
+
+def close(a, b):
+    return abs(a - b) <= 1e-9 * max(1, abs(b))
+
+
+@pytest.mark.parametrize("numeric, options", [
+    ("float", {}),
+    ("float", {"storage": "sparse"}),
+    ("float", {"method": "revised"}),
+    ("float64", {}),
+])
+@pytest.mark.parametrize("problem", PROBLEMS)
+def test_badly_scaled_float_agrees_with_fraction(problem, numeric, options):
+    exact = solve(problem)
+    result = solve(problem, numeric=numeric, **options)
+    assert result["status"] == exact["status"] == "optimal"
+    assert all(close(a, float(b)) for a, b in zip(result["x"], exact["x"]))
+    assert close(result["objective"], float(exact["objective"]))
+
+
+def test_tiny_problem_optimum():
+    result = solve(PROBLEMS[0], numeric="float")
+    assert result["x"] == pytest.approx([3, 0])
+    assert solve(PROBLEMS[0])["x"] == [3, Fraction(0)]
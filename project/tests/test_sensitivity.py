@@ -0,0 +1,36 @@
+from fractions import Fraction
+
+import pytest
+
+from solver import Problem, solve
+
+
+def report(problem, numeric="fraction"):
+    result = solve(problem, numeric=numeric, sensitivity=True)
+    assert result["status"] == "optimal"
+    return result["sensitivity"]
+
+
+def test_textbook_problem():
+    sensitivity = report(Problem([3, 5], [[1, 2], [3, 2]], ["<=", "<="], [6, 12]))
+    assert sensitivity["shadow_prices"] == [Fraction(9, 4), Fraction(1, 4)]
+    assert sensitivity["rhs_ranges"] == [[4, 12], [6, 18]]
+    assert sensitivity["reduced_costs"] == [0, 0]
+    assert sensitivity["objective_ranges"] == [[Fraction(5, 2), Fraction(15, 2)], [2, 6]]
+
+
+@pytest.mark.parametrize("numeric", ["fraction", "float"])
+def test_all_zero_equality_row_cannot_move(numeric):
+    sensitivity = report(Problem([3, 5], [[1, 2], [3, 2], [0, 0]], ["<=", "<=", "="], [6, 12, 0]), numeric)
+    assert sensitivity["rhs_ranges"][2] == [0, 0]
+
+
+def test_all_zero_inequality_row_is_a_half_line():
+    sensitivity = report(Problem([3, 5], [[1, 2], [3, 2], [0, 0]], ["<=", "<=", "<="], [6, 12, 0]))
+    assert sensitivity["rhs_ranges"][2] == [0, None]
+
+
+def test_dependent_equality_rows_are_pinned():
+    sensitivity = report(Problem([3, 5], [[1, 1], [2, 2], [1, 0]], ["=", "=", "<="], [2, 4, 1]))
+    assert sensitivity["rhs_ranges"][:2] == [[2, 2], [4, 4]]
+    assert sensitivity["rhs_ranges"][2] == [0, None]
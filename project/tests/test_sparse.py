@@ -0,0 +1,52 @@
+import random
+import pytest
+
+from solver import Problem, solve
+from solver.sparse import SparseTableau
+
+
+def random_problem(seed, m=40, n=60, density=0.08):
+    rng = random.Random(seed)
+    objective = [rng.randint(1, 9) for _ in range(n)]
+    constraints = [{j: rng.randint(1, 9) for j in range(n) if rng.random() < density} for _ in range(m)]
+    rhs = [rng.randint(10, 50) for _ in range(m)]
+    # Bound every column so the problem is never unbounded
+    constraints.append({j: 1 for j in range(n)})
+    rhs.append(100)
+    return objective, constraints, rhs
+
+
+def dense_rows(tableau):
+    return [row[:-1] for row in tableau.rows[:-1]]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_storage_tracks_true_nonzeros(seed):
+    objective, constraints, rhs = random_problem(seed)
+    tableau = SparseTableau.from_sparse(objective, constraints, rhs)
+    pivots = 0
+    while not tableau.is_optimal():
+        col = tableau.entering()
+        row = tableau.leaving(col)
+        tableau.pivot(row, col)
+        pivots += 1
+
+        stored = sum(len(row) for row in tableau.data)
+        nonzeros = sum(1 for row in dense_rows(tableau) for v in row if v != 0)
+        assert stored == nonzeros
+        assert all(v != 0 for v in tableau.z.values())
+        for j, rows in tableau.col_rows.items():
+            assert rows == {i for i, row in enumerate(tableau.data) if j in row}
+    assert pivots > 0
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_sparse_matches_dense(seed):
+    objective, constraints, rhs = random_problem(seed)
+    problem = Problem(objective, [[row.get(j, 0) for j in range(len(objective))] for row in constraints],
+                      ["<="] * len(rhs), rhs)
+    sparse = solve(problem, storage="sparse")
+    dense = solve(problem, storage="dense")
+    assert sparse["status"] == dense["status"] == "optimal"
+    assert sparse["objective"] == dense["objective"]
+    assert sparse["x"] == dense["x"]
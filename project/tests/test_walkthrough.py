@@ -0,0 +1,33 @@
+def solve_form(client, objective, *constraints, **fields):
+    data = {"objective": objective, "action": "solve", **fields}
+    data.update((f"constraint{i}", c) for i, c in enumerate(constraints, 1))
+    return client.post("/solve", data=data).get_data(as_text=True)
+
+
+def test_optimal_walkthrough(client):
+    page = solve_form(client, "3x + 5y", "x + 2y <= 6", "3x + 2y <= 12")
+    assert "Optimal Solution Reached" in page
+    assert "Sensitivity Analysis" in page
+
+
+def test_unbounded_walkthrough_says_so(client):
+    page = solve_form(client, "x + y", "x - y <= 1", "-x + y <= 2")
+    assert "the problem is unbounded" in page
+    trace = client.post("/api/walkthrough", json={"objective": "x + y", "constraints": ["x - y <= 1", "-x + y <= 2"]})
+    assert trace.json["steps"][-1] == {**trace.json["steps"][-1], "type": "pivot", "row": None}
+
+
+def test_walkthrough_errors(client):
+    assert client.post("/api/walkthrough", json={"objective": "x +", "constraints": ["x <= 1"]}).status_code == 400
+
+
+def test_page_links_the_walkthrough_api_under_a_script_root(client):
+    page = client.get("/main", base_url="http://localhost/solver/").get_data(as_text=True)
+    assert 'data-url="/solver/api/walkthrough"' in page
+
+
+
+def test_single_step_actions_start_from_the_form(client):
+    for action in ("tableau1", "highlight", "pivotrow", "solution"):
+        page = solve_form(client, "max 3x + 5y", "x + 2y <= 6", "3x + 2y <= 12", action=action)
+        assert "Invalid Problem" not in page
@@ -0,0 +1,89 @@
+import random
+
+import pytest
+
+from solver import Problem, ProblemError, solve
+from solver.warm import apply_delta, resolve
+
+PROBLEM = Problem([3, 5], [[1, 2], [3, 2]], ["<=", "<="], [6, 12], variables=["x", "y"])
+
+
+@pytest.mark.parametrize("delta", [
+    {"rhs": [1, 2]},
+    {"objective": 7},
+    {"add_constraints": {"coefficients": [1, 1], "rhs": 1}},
+    {"add_constraints": [5]},
+    {"add_constraints": [{"coefficients": [1, 1]}]},
+    {"rhs": {"5": 1}},
+    {"objective": {"z": 1}},
+    {"colour": "red"},
+    [],
+])
+def test_malformed_delta(delta):
+    with pytest.raises(ProblemError):
+        apply_delta(PROBLEM, delta)
+
+
+def test_apply_delta():
+    changed = apply_delta(PROBLEM, {"rhs": {"1": 14}, "objective": {"y": 6},
+                                    "add_constraints": [{"coefficients": {"x": 1}, "sense": ">=", "rhs": 1}]})
+    assert changed.rhs == [6, 14, 1]
+    assert changed.objective == [3, 6]
+    assert changed.senses[-1] == ">="
+
+
+def test_unchanged_problem_saves_every_pivot():
+    first = solve(PROBLEM)
+    _, result = resolve(PROBLEM, first, {}, compare=True)
+    report = result["warm_start"]
+    assert report["installed"]
+    assert report["baseline"] == first["iterations"]
+    assert result["iterations"] == 0
+    assert report["pivots_saved"] == first["iterations"] - report["basis_pivots"]
+
+
+def test_basis_list_without_compare():
+    _, result = resolve(PROBLEM, ["x", "y"], {"rhs": {"0": 5}})
+    assert set(result["warm_start"]) == {"installed", "basis_pivots"}
+
+
+def test_pivots_saved_counts_basis_pivots_against_the_changed_problem():
+    rng = random.Random(3)
+    for _ in range(60):
+        m, n = rng.randint(2, 5), rng.randint(2, 5)
+        problem = Problem([rng.randint(1, 9) for _ in range(n)], [[rng.randint(0, 6) for _ in range(n)] for _ in range(m)],
+                          [rng.choice(["<=", ">="]) for _ in range(m)], [rng.randint(1, 30) for _ in range(m)])
+        first = solve(problem)
+        delta = {"rhs": {str(rng.randrange(m)): rng.randint(1, 40)}}
+        changed, warm = resolve(problem, first, delta, compare=True)
+        cold = solve(changed)
+        report = warm["warm_start"]
+        assert report["baseline"] == cold["iterations"]
+        assert warm["status"] == cold["status"]
+        if report["installed"]:
+            assert report["pivots_saved"] == cold["iterations"] - warm["iterations"] - report["basis_pivots"]
+        else:
+            assert "pivots_saved" not in report
+
+
+def test_resolve_endpoint(client):
+    data = {"objective": [3, 5], "constraints": [[1, 2], [3, 2]], "rhs": [6, 12], "keep_basis": True}
+    handle = client.post("/api/solve", json=data).json["handle"]
+    response = client.post("/api/resolve", json={"handle": handle, "delta": {"rhs": {"0": 8}}, "compare": True})
+    assert response.status_code == 200
+    assert "pivots_saved" in response.json["warm_start"]
+    bad = client.post("/api/resolve", json={"handle": response.json["handle"], "delta": {"rhs": [1, 2]}})
+    assert bad.status_code == 400
+
+
+def test_resolve_trace_levels(client):
+    data = {"objective": [3, 5], "constraints": [[1, 2], [3, 2]], "rhs": [6, 12], "keep_basis": True}
+    handle = client.post("/api/solve", json=data).json["handle"]
+    delta = {"objective": {"x1": 9}}
+    summary = client.post("/api/resolve", json={"handle": handle, "delta": delta, "trace": "summary"}).json
+    assert summary["trace"] and all("tableau" not in step for step in summary["trace"])
+    assert "final_tableau" not in summary
+    full = client.post("/api/resolve", json={"handle": handle, "delta": delta, "trace": "full"}).json
+    assert all("tableau" in step for step in full["trace"])
+    bad = client.post("/api/resolve", json={"handle": handle, "delta": delta, "trace": "verbose"})
+    assert bad.status_code == 400